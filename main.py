@@ -2,21 +2,114 @@
 
 This module serves as the main entry point for the Chemination game. It initializes
 the pygame library, creates the game window, and starts the main game loop.
+With ``--headless``, ``--replay``, ``--batch`` or ``--vector-envs`` it runs battle simulations without a
+window instead.
 """
 
-import pygame
+import argparse
+import os
 import sys
 
-from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_NAME, load_settings
+import pygame
+
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_NAME, FPS, load_settings
 from src.utils.tools import resource_path
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Argument list (defaults to ``sys.argv[1:]``).
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=GAME_NAME)
+    parser.add_argument("--headless", action="store_true",
+                        help="run a battle simulation without a window and print its stats")
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="maximum number of frames to simulate in headless mode")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed for battles")
+    parser.add_argument("--fps", type=int, default=None,
+                        help=f"render frame rate cap, 0 for uncapped (default {FPS}, or uncapped with --stress; "
+                             "game speed is unaffected)")
+    parser.add_argument("--entity-store", choices=("ecs", "arrays"), default="ecs",
+                        help="battle entity storage: entity-component-system entities, or NumPy columns "
+                             "(requires NumPy)")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="record battles to a replay file")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="re-run a replay file headless and verify it frame by frame")
+    parser.add_argument("--batch", metavar="N", type=int, default=None,
+                        help="run N headless battles with consecutive seeds (from --seed, default 0) in "
+                             "parallel and write a per-battle summary")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes for --batch (default: number of CPUs)")
+    parser.add_argument("--policy", default=None,
+                        help="bot policy playing the battles (idle, random, greedy, oracle or module:factory); "
+                             "--batch defaults to idle, a windowed game to the keyboard")
+    parser.add_argument("--vector-envs", metavar="N", type=int, default=None,
+                        help="step N vectorized battles (NumPy) with random actions for --frames steps and "
+                             "report environment steps per second")
+    parser.add_argument("--out", metavar="PATH", default="batch.csv",
+                        help="summary file of --batch, .csv or .parquet (default: batch.csv)")
+    parser.add_argument("--stress", metavar="RATE", type=float, default=None,
+                        help="start a battle flooded with RATE more enemies and bullets per second every "
+                             "second, reporting frame times until the frame budget is exceeded")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="update only the changed regions of the window instead of redrawing every frame")
+    parser.add_argument("--show-dirty", action="store_true",
+                        help="with --dirty-rects, outline the updated regions and show the pixels pushed per frame")
+    parser.add_argument("--stress-budget", metavar="MS", type=float, default=1000 / FPS,
+                        help="frame budget of the stress test in milliseconds (default: %(default).1f)")
+    return parser.parse_args(argv)
+
+
+def headless(args: argparse.Namespace):
+    """Run a battle simulation without a window and print the results.
+
+    Args:
+        args: Parsed command line arguments.
+    """
+    # No window and no audio device are needed, but sprites still use the event queue
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+
+    if args.vector_envs:
+        from src.game.vector_env import run_vector_benchmark
+        stats = run_vector_benchmark(args.vector_envs, args.frames, args.seed)
+    elif args.batch:
+        from src.game.batch import run_batch, write_summary
+        rows, stats = run_batch(args.batch, args.workers, args.policy or "idle", args.frames,
+                                args.seed or 0, args.entity_store)
+        write_summary(rows, args.out)
+    elif args.replay:
+        from src.game.replay import BattleReplay
+        stats = BattleReplay.load(args.replay).run(entity_store=args.entity_store)
+    else:
+        from src.game.simulation import run_headless
+        stats = run_headless(args.frames, args.seed, args.record, args.entity_store, args.policy)
+    for key, value in stats.items():
+        if isinstance(value, float):
+            value = f"{value:.3f}"
+        print(f"{key}: {value}")
+    pygame.quit()
+
+
 def main():
     """Initialize and run the main game loop.
     
     This function initializes the pygame library, sets up the game window,
     loads settings, and starts the main game controller.
     """
+    args = parse_args()
+    if args.headless or args.replay or args.batch or args.vector_envs:
+        headless(args)
+        return
+
     pygame.init()  # Initialize Pygame
     pygame.mixer.init()  # Initialize audio module
 
@@ -37,7 +130,12 @@ def main():
     # Import and run the main game class
     try:
         from src.game.game import Game
-        game = Game(screen)
+        from src.game.stress import StressTest
+        stress = StressTest(args.stress, args.stress_budget, quit_when_done=True) if args.stress else None
+        fps = args.fps if args.fps is not None else (0 if stress else FPS)
+        game = Game(screen, seed=args.seed, record_path=args.record, fps=fps,
+                    entity_store=args.entity_store, stress=stress, policy=args.policy,
+                    dirty_rects=args.dirty_rects or args.show_dirty, show_dirty=args.show_dirty)
         game.run()
     except Exception as e:
         print(f"Error running game: {e}")
@@ -18,7 +18,16 @@ VERSION = "0.9.0"
 # Game window settings
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 675
-FPS = 60
+FPS = 60  # Render frame rate cap (0: uncapped)
+
+# Simulation timing: game logic always advances in fixed ticks of 1 / TICK_RATE seconds
+TICK_RATE = 60
+MAX_FRAME_TIME = 0.25  # Longest frame the loop catches up on, in seconds
+IDLE_FPS = 10  # Frame rate while the scene is idle (nothing animates): the loop waits for input
+
+# Stress test (F9 in battle, or --stress): enemies and bullets per second added per report window
+STRESS_RATE = 30
+STRESS_WINDOW = 1.0  # Report window, in seconds
 
 # Color definitions
 WHITE = pygame.Color(255, 255, 255)
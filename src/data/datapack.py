@@ -0,0 +1,250 @@
+"""Enemy data pack loading for the Chemination game.
+
+This module loads the enemy data pack (species, stats, sprite paths, help
+screen groups, enemy types, reactions and spawn waves) from a JSON or TOML
+file. A pack is validated once after parsing and then cached as a pickled
+binary next to the source file, so later starts skip parsing and validation. Both the binary
+cache and the in-process copy are only refreshed when the source file's
+modification time or size changes.
+"""
+
+import json
+import os
+import pickle
+
+from src.utils.tools import resource_path
+
+# Version of the data pack schema
+DATA_PACK_VERSION = 1
+# Version of the binary cache layout (bump to invalidate existing caches)
+CACHE_VERSION = 2
+CACHE_SUFFIX = ".cache"
+
+# Default sprite sheet columns of an enemy
+DEFAULT_SPRITE_FRAMES = 4
+
+# Spawn pacing of a pack without a spawning section: one enemy every
+# max(300 - kills, 120) frames, all species equally likely
+DEFAULT_SPAWNING = {
+    "interval": {"start": 300, "per_kill": 1, "min": 120},
+    "waves": [{"kills": 0, "burst": 1, "gap": 0, "weights": {}}],
+}
+
+# In-process packs: absolute path -> (source stamp, pack)
+_packs: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+def _stamp(path: str) -> tuple[int, int]:
+    """Get the modification time (ns) and size of a file."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse(path: str) -> dict:
+    """Parse a JSON or TOML data pack file."""
+    if path.endswith(".toml"):
+        import tomllib  # Python 3.11+
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _positive_int(value) -> bool:
+    """Check that a value is an integer greater than zero (booleans excluded)."""
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def validate_enemy_pack(data: dict, source: str = "<data pack>") -> dict:
+    """Validate a parsed enemy data pack and fill in defaults.
+
+    Args:
+        data:   Parsed data pack.
+        source: Name of the pack, used in error messages.
+
+    Returns:
+        dict: Normalized pack with ``types``, ``reactions``, ``enemies``,
+        ``groups`` and ``spawning`` entries.
+
+    Raises:
+        ValueError: If the pack is malformed or inconsistent.
+    """
+    def fail(message: str):
+        raise ValueError(f"{source}: {message}")
+
+    if not isinstance(data, dict):
+        fail("the data pack must be a table/object")
+    if data.get("version", DATA_PACK_VERSION) != DATA_PACK_VERSION:
+        fail(f"unsupported version {data.get('version')!r} (expected {DATA_PACK_VERSION})")
+
+    # Enemy types
+    types = data.get("types")
+    if not isinstance(types, list) or not types or not all(isinstance(t, str) for t in types):
+        fail("types must be a non-empty list of names")
+    if len(set(types)) != len(types):
+        fail("types must not repeat")
+
+    # Reactions: bullet type -> enemy type -> damage per hit
+    reactions = data.get("reactions")
+    if not isinstance(reactions, dict) or not reactions:
+        fail("reactions must map bullet types to enemy types")
+    for bullet_type, targets in reactions.items():
+        if not isinstance(targets, dict):
+            fail(f"reactions.{bullet_type} must map enemy types to damage")
+        for enemy_type, damage in targets.items():
+            if enemy_type not in types:
+                fail(f"reactions.{bullet_type}.{enemy_type}: unknown enemy type")
+            if not _positive_int(damage) or damage > 255:
+                fail(f"reactions.{bullet_type}.{enemy_type}: damage must be an integer from 1 to 255")
+
+    # Enemy species
+    enemies = data.get("enemies")
+    if not isinstance(enemies, dict) or not enemies:
+        fail("enemies must map enemy names to their definitions")
+    species = {}
+    for name, params in enemies.items():
+        if not isinstance(params, dict):
+            fail(f"enemies.{name} must be a table/object")
+        if params.get("type") not in types:
+            fail(f"enemies.{name}.type: unknown enemy type {params.get('type')!r}")
+        for key in ("hp", "speed"):
+            if not _positive_int(params.get(key)) or params[key] > 65535:
+                fail(f"enemies.{name}.{key} must be an integer from 1 to 65535")
+        sprite = params.get("sprite", f"assets/images/enemy/{name}.png")
+        if not isinstance(sprite, str):
+            fail(f"enemies.{name}.sprite must be a file path")
+        frames = params.get("frames", DEFAULT_SPRITE_FRAMES)
+        if not _positive_int(frames):
+            fail(f"enemies.{name}.frames must be a positive integer")
+        species[name] = {
+            "type": params["type"],
+            "hp": params["hp"],
+            "speed": params["speed"],
+            "sprite": sprite,
+            "frames": frames,
+        }
+
+    # Help screen groups
+    groups = data.get("groups", {})
+    if not isinstance(groups, dict):
+        fail("groups must map group names to lists of enemy names")
+    for group, names in groups.items():
+        if not isinstance(names, list):
+            fail(f"groups.{group} must be a list of enemy names")
+        for name in names:
+            if name not in species:
+                fail(f"groups.{group}: unknown enemy {name!r}")
+
+    return {
+        "types": list(types),
+        "reactions": {b: dict(t) for b, t in reactions.items()},
+        "enemies": species,
+        "groups": {g: list(n) for g, n in groups.items()},
+        "spawning": _validate_spawning(data.get("spawning", DEFAULT_SPAWNING), types, species, fail),
+    }
+
+
+def _validate_spawning(spawning: dict, types: list[str], species: dict, fail) -> dict:
+    """Validate the spawning section of a data pack and fill in defaults."""
+    if not isinstance(spawning, dict):
+        fail("spawning must be a table/object")
+
+    # Spawn interval: max(start - per_kill * kills, min) frames
+    interval = spawning.get("interval", {})
+    if not isinstance(interval, dict):
+        fail("spawning.interval must be a table/object")
+    interval = {**DEFAULT_SPAWNING["interval"], **interval}
+    if not all(isinstance(v, int) and not isinstance(v, bool) for v in interval.values()):
+        fail("spawning.interval values must be integers")
+    if interval["min"] < 1 or interval["start"] < interval["min"] or interval["per_kill"] < 0:
+        fail("spawning.interval must satisfy start >= min >= 1 and per_kill >= 0")
+
+    # Waves, each active from a kill count until the next wave starts
+    waves = spawning.get("waves", DEFAULT_SPAWNING["waves"])
+    if not isinstance(waves, list) or not waves:
+        fail("spawning.waves must be a non-empty list")
+    checked = []
+    for i, wave in enumerate(waves):
+        if not isinstance(wave, dict):
+            fail(f"spawning.waves[{i}] must be a table/object")
+        wave = {"kills": 0, "burst": 1, "gap": 0, "weights": {}, **wave}
+        if not isinstance(wave["kills"], int) or wave["kills"] < 0:
+            fail(f"spawning.waves[{i}].kills must be a non-negative integer")
+        if checked and wave["kills"] <= checked[-1]["kills"]:
+            fail(f"spawning.waves[{i}].kills must be greater than the previous wave's")
+        if not _positive_int(wave["burst"]):
+            fail(f"spawning.waves[{i}].burst must be a positive integer")
+        if not isinstance(wave["gap"], int) or wave["gap"] < 0:
+            fail(f"spawning.waves[{i}].gap must be a non-negative integer")
+        weights = wave["weights"]
+        if not isinstance(weights, dict):
+            fail(f"spawning.waves[{i}].weights must map enemy types or names to weights")
+        for key, weight in weights.items():
+            if key not in types and key not in species:
+                fail(f"spawning.waves[{i}].weights: unknown enemy type or name {key!r}")
+            if not isinstance(weight, (int, float)) or isinstance(weight, bool) or weight < 0:
+                fail(f"spawning.waves[{i}].weights.{key} must be a non-negative number")
+        if weights and not any(weights.get(name, weights.get(params["type"], 0)) > 0
+                               for name, params in species.items()):
+            fail(f"spawning.waves[{i}].weights must give some enemy a positive weight")
+        checked.append({key: wave[key] for key in ("kills", "burst", "gap")} | {"weights": dict(weights)})
+    if checked[0]["kills"] != 0:
+        fail("spawning.waves[0].kills must be 0")
+
+    return {"interval": interval, "waves": checked}
+
+
+def _read_cache(cache_path: str, stamp: tuple[int, int]) -> dict | None:
+    """Load a cached pack if it was built from a source with the given stamp."""
+    try:
+        with open(cache_path, "rb") as f:
+            version, cached_stamp, pack = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    if version != CACHE_VERSION or tuple(cached_stamp) != stamp:
+        return None
+    return pack
+
+
+def _write_cache(cache_path: str, stamp: tuple[int, int], pack: dict):
+    """Store a validated pack next to its source (best effort)."""
+    try:
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((CACHE_VERSION, stamp, pack), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # A read-only install still works, it just parses the pack on every start
+        print(f"Unable to cache data pack {cache_path}: {e}")
+
+
+def load_enemy_pack(filename: str) -> dict:
+    """Load a validated enemy data pack.
+
+    The pack is returned from memory while the source file is unchanged, from
+    the binary cache when only the process is new, and parsed and validated
+    otherwise.
+
+    Args:
+        filename: Data pack path (.json or .toml), relative to the base path.
+
+    Returns:
+        dict: Normalized pack (see validate_enemy_pack).
+
+    Raises:
+        FileNotFoundError: If the data pack does not exist.
+        ValueError:        If the data pack is invalid.
+    """
+    path = resource_path(filename)
+    stamp = _stamp(path)
+    loaded = _packs.get(path)
+    if loaded and loaded[0] == stamp:
+        return loaded[1]
+
+    cache_path = path + CACHE_SUFFIX
+    pack = _read_cache(cache_path, stamp)
+    if pack is None:
+        pack = validate_enemy_pack(_parse(path), filename)
+        _write_cache(cache_path, stamp, pack)
+    _packs[path] = (stamp, pack)
+    return pack
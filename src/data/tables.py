@@ -0,0 +1,94 @@
+"""Compiled game data tables for the Chemination game.
+
+This module compiles the chemical database into compact, integer-indexed
+tables at startup: one row per enemy species (type id, health points, speed)
+and a bullet type x enemy type damage matrix. Game rules index these tables
+instead of comparing strings, so adding a type or a reaction is an edit of the
+enemy data pack (``assets/data/enemies.json``), not of code.
+"""
+
+from array import array
+
+from src.data.chemicals import ENEMIES, ENEMY_TYPES, REACTIONS
+
+
+class SpeciesTable:
+    """Enemy species as parallel integer columns.
+
+    Species ids are the positions of the species in ``names``, which follows
+    the order of the source database.
+    """
+
+    def __init__(self, enemies: dict[str, dict], enemy_types: tuple[str, ...]):
+        """Compile the species table.
+
+        Args:
+            enemies:     Enemy database (name -> type, hp and speed).
+            enemy_types: Enemy type names, in the order of their type ids.
+
+        Raises:
+            ValueError: If an enemy has an unknown type.
+        """
+        self.types = tuple(enemy_types)
+        self.type_ids = {name: i for i, name in enumerate(self.types)}
+        self.names = tuple(enemies)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+
+        # Columns indexed by species id
+        self.type_id = array("B")
+        self.hp = array("H")
+        self.speed = array("H")
+        for name, params in enemies.items():
+            if params["type"] not in self.type_ids:
+                raise ValueError(f"Unknown enemy type {params['type']!r} for {name}")
+            self.type_id.append(self.type_ids[params["type"]])
+            self.hp.append(params["hp"])
+            self.speed.append(params["speed"])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class DamageMatrix:
+    """Health points a bullet type takes per hit from each enemy type."""
+
+    def __init__(self, reactions: dict[str, dict[str, int]], enemy_types: tuple[str, ...]):
+        """Compile the damage matrix.
+
+        Args:
+            reactions:   Bullet type -> enemy type -> damage per hit.
+            enemy_types: Enemy type names, in the order of their type ids.
+
+        Raises:
+            ValueError: If a reaction names an unknown enemy type.
+        """
+        self.type_ids = type_ids = {name: i for i, name in enumerate(enemy_types)}
+        self.bullet_types = tuple(reactions)
+        self.bullet_ids = {name: i for i, name in enumerate(self.bullet_types)}
+
+        # rows[bullet id][enemy type id] -> damage
+        self.rows: list[array] = []
+        for bullet_type, targets in reactions.items():
+            row = array("B", bytes(len(enemy_types)))
+            for enemy_type, damage in targets.items():
+                if enemy_type not in type_ids:
+                    raise ValueError(f"Unknown enemy type {enemy_type!r} in {bullet_type} reactions")
+                row[type_ids[enemy_type]] = damage
+            self.rows.append(row)
+
+    def damage(self, bullet_type: str, enemy_type: str) -> int:
+        """Look up the damage of a bullet type against an enemy type by name.
+
+        Args:
+            bullet_type: Bullet type name.
+            enemy_type:  Enemy type name.
+
+        Returns:
+            int: Health points taken per hit (0 if the bullet has no effect).
+        """
+        return self.rows[self.bullet_ids[bullet_type]][self.type_ids[enemy_type]]
+
+
+# Tables compiled from the chemical database
+SPECIES_TABLE = SpeciesTable(ENEMIES, ENEMY_TYPES)
+DAMAGE_MATRIX = DamageMatrix(REACTIONS, ENEMY_TYPES)
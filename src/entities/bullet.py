@@ -1,14 +1,15 @@
 """Bullet entities for the Chemination game.
 
-This module contains the Bullet class and BulletType enumeration that represent
-the projectiles fired by the player's characters. Different bullet types correspond
-to different hero types and have specific effects on enemies.
+This module contains the BulletType enumeration and the shared frames and
+animation clips of the projectiles fired by the player's characters. Different
+bullet types correspond to different hero types and have specific effects on
+enemies; the bullets themselves are battle entities (see ``src.game.systems``).
 """
 
 from enum import Enum
 import pygame
 
-from src.config.settings import SCREEN_WIDTH
+from src.utils.animation import AnimationClip
 from src.utils.tools import load_sprite_row
 
 
@@ -19,65 +20,49 @@ class BulletType(Enum):
     METAL = "metal"
 
 
-class Bullet(pygame.sprite.Sprite):
-    """Represents a bullet projectile fired by the player.
-    
-    This class handles bullet movement, animation, and collision detection.
-    """
+# Bullet animation rate in frames per second
+BULLET_FPS = 18
+
+# Bullet frame banks, built on first use: bullet type -> direction -> frames
+_frame_banks: dict[BulletType, dict[int, list[pygame.Surface]]] = {}
+# Bullet clips, built on first use: (bullet type, direction) -> clip
+_clips: dict[tuple[BulletType, int], AnimationClip] = {}
+
+
+def get_bullet_frames(bullet_type: BulletType) -> dict[int, list[pygame.Surface]]:
+    """Get the shared animation frames of a bullet type for both directions.
 
-    def __init__(self, x: int, y: int, direction: int, bullet_type: BulletType):
-        """Initialize a bullet with the given parameters.
-        
-        Args:
-            x:           Bullet initial x coordinate.
-            y:           Bullet initial y coordinate.
-            direction:   Bullet direction (-1: left, 1: right).
-            bullet_type: Type of bullet to create.
-        """
-        super().__init__()
-        self.bullet_type = bullet_type
-
-        # Load bullet animation frames
-        self.frames = load_sprite_row(
-            f"assets/images/spirits/{self.bullet_type.value}.png",
-            3,
-            scale=1
-        )
-
-        # Animation related properties
-        self.current_frame = 0
-        self.animation_speed = 0.3
-        self.image = self.frames[self.current_frame]
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-
-        # Physical properties
-        self.speed = 10
-        self.direction = direction
-
-        # Flip image based on direction
-        if self.direction == -1:
-            self.image = pygame.transform.flip(self.image, True, False)
-
-    def update(self):
-        """Update the bullet's position and animation for each frame.
-        
-        Handles bullet movement, animation, and boundary checking. Removes the
-        bullet when it flies off the screen.
-        """
-        # Update position
-        self.rect.x += self.speed * self.direction
-
-        # Update animation frames
-        self.current_frame += self.animation_speed
-        if self.current_frame >= len(self.frames):
-            self.current_frame = 0
-        self.image = self.frames[int(self.current_frame)]
-
-        # Flip image based on direction
-        if self.direction == -1:
-            self.image = pygame.transform.flip(self.image, True, False)
-
-        # Boundary check: remove bullet if it flies off the screen
-        if self.rect.right < 0 or self.rect.left > SCREEN_WIDTH:
-            self.kill()
\ No newline at end of file
+    Frames for left-moving bullets are mirrored once here, so bullets never
+    flip surfaces while flying.
+
+    Args:
+        bullet_type: Type of bullet.
+
+    Returns:
+        dict: Dictionary mapping direction (1: right, -1: left) to frames.
+    """
+    bank = _frame_banks.get(bullet_type)
+    if bank is None:
+        frames = load_sprite_row(f"assets/images/spirits/{bullet_type.value}.png", 3, scale=1)
+        bank = {
+            1: frames,
+            -1: [pygame.transform.flip(f, True, False) for f in frames]
+        }
+        _frame_banks[bullet_type] = bank
+    return bank
+
+
+def get_bullet_clip(bullet_type: BulletType, direction: int) -> AnimationClip:
+    """Get the shared animation clip of a bullet type flying in a direction.
+
+    Args:
+        bullet_type: Type of bullet.
+        direction:   Flight direction (-1: left, 1: right).
+
+    Returns:
+        AnimationClip: Looping clip of the bullet's frames.
+    """
+    clip = _clips.get((bullet_type, direction))
+    if clip is None:
+        clip = _clips[bullet_type, direction] = AnimationClip(get_bullet_frames(bullet_type)[direction], BULLET_FPS)
+    return clip
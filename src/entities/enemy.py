@@ -1,163 +1,161 @@
 """Enemy entities for the Chemination game.
 
-This module contains the Enemy class that represents the chemical enemies
-in the game. Each enemy has specific properties based on its chemical type
-and behavior in the game world.
+This module contains the EnemySpecies flyweights that hold every immutable
+per-species resource of the chemical enemies (frames, stats, health icons and
+name label); the enemies themselves are battle entities (see
+``src.game.systems``). Health
+displays are pre-rendered: heart strips are cached by (max hp, hp) and every
+species caches its combined hearts and name overlay per health value, so an
+enemy's HUD is a single blit.
 """
 
-import random
 import pygame
 
-from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, ENEMY_ESCAPED, ENEMY_KILLED
+from src.config.settings import WHITE
+from src.data.chemicals import ENEMIES
+from src.data.tables import SPECIES_TABLE, DAMAGE_MATRIX
 from src.entities.bullet import BulletType
-from src.utils.tools import load_sprite_row, resource_path
+from src.utils.animation import AnimationClip
+from src.utils.tools import convert_image, load_image, load_sprite_row
 
+# Enemy animation rate in frames per second
+ANIMATION_FPS = 9
 
-class Enemy(pygame.sprite.Sprite):
-    """Represents a chemical enemy in the game.
-    
-    This class handles enemy behavior, including movement, animation,
-    health management, and interactions with the player.
+# Heart strips, built on first use: (max hp, hp) -> strip
+_heart_strips: dict[tuple[int, int], pygame.Surface] = {}
+
+
+def get_heart_strip(max_hp: int, health: int) -> pygame.Surface:
+    """Get the shared row of health icons for a health value.
+
+    Args:
+        max_hp: Number of hearts.
+        health: Number of full hearts (clamped to 0..max_hp).
+
+    Returns:
+        pygame.Surface: ``health`` full hearts followed by empty ones.
     """
+    health = max(0, min(health, max_hp))
+    strip = _heart_strips.get((max_hp, health))
+    if strip is None:
+        heart1 = load_image("assets/images/ui/heart1.png")
+        heart3 = load_image("assets/images/ui/heart3.png")
+        width, height = heart3.get_size()
+        # Hearts are copied rather than blended, keeping their exact pixels
+        strip = pygame.Surface((width * max_hp, height), pygame.SRCALPHA)
+        for i in range(max_hp):
+            strip.blit(heart3 if i < health else heart1, (i * width, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        strip = _heart_strips[max_hp, health] = convert_image(strip)
+    return strip
+
+
+class EnemySpecies:
+    """Shared, immutable data of one enemy species (chemical formula).
+
+    One instance exists per entry of ``ENEMIES``; all enemies of that species
+    reference it instead of loading their own frames, icons and labels.
+    """
+
+    def __init__(self, name: str, params: dict, font: pygame.font.Font):
+        """Initialize a species from its database entry.
 
-    def __init__(self, name: str, params: dict):
-        """Initialize an enemy with the given parameters.
-        
         Args:
             name:   Enemy name (chemical formula).
-            params: Enemy parameters (type, health, speed).
+            params: Enemy parameters (type, health, speed, sprite, frames).
+            font:   Font used to render the name label.
         """
-        super().__init__()
         self.name = name
         self.params = params
-
-        # Load enemy animation frames
-        try:
-            self.frames = load_sprite_row(f"assets/images/enemy/{name}.png", 4, scale=1)
-        except pygame.error:
-            # If unable to load image, create a default rectangle as substitute
-            self.frames = [pygame.Surface((50, 50), pygame.SRCALPHA)]
-            self.frames[0].fill((200, 100, 100, 200))
-
-        # Load health icons
-        try:
-            self.heart1 = pygame.image.load(resource_path("assets/images/ui/heart1.png"))
-            self.heart3 = pygame.image.load(resource_path("assets/images/ui/heart3.png"))
-        except pygame.error:
-            # If unable to load images, create simple substitute graphics
-            self.heart1 = pygame.Surface((20, 20), pygame.SRCALPHA)
-            self.heart1.fill((255, 0, 0, 128))
-            self.heart3 = pygame.Surface((20, 20), pygame.SRCALPHA)
-            self.heart3.fill((0, 255, 0, 128))
-
-        # Animation related properties
-        self.current_frame = 0
-        self.animation_speed = 0.15
-        self.image = self.frames[self.current_frame]
-        self.rect = self.image.get_rect()
-
-        # Position initialization (generated from random position on right side of screen)
-        self.rect.x = SCREEN_WIDTH + random.randint(0, 100)
-        self.rect.y = random.randint(120, SCREEN_HEIGHT - 120 - self.rect.height)
-
-        # Physical properties
-        self.speed = params["speed"]
-        self.health = params["hp"]
         self.type = params["type"]
 
-        # Render enemy name
-        font = pygame.font.SysFont(None, 24)
-        self.name_surface = font.render(self.name, True, WHITE)
+        # Compiled table entries
+        self.id = SPECIES_TABLE.ids[name]
+        self.type_id = SPECIES_TABLE.type_id[self.id]
+        self.hp = SPECIES_TABLE.hp[self.id]
+        self.speed = SPECIES_TABLE.speed[self.id]
 
-        # Freeze state
-        self.is_freeze = False
+        # Animation frames
+        self.frames = load_sprite_row(params["sprite"], params["frames"], scale=1)
+        self.width, self.height = self.frames[0].get_size()
+        self.clip = AnimationClip(self.frames, ANIMATION_FPS)
 
-    def freeze(self):
-        """Freeze the enemy, preventing movement.
-        
-        When frozen, the enemy will not move until unfrozen.
-        """
-        self.is_freeze = True
+        # Health icons
+        self.heart1 = load_image("assets/images/ui/heart1.png")
+        self.heart3 = load_image("assets/images/ui/heart3.png")
 
-    def unfreeze(self):
-        """Unfreeze the enemy, allowing movement again.
-        
-        Resumes normal enemy movement and behavior.
-        """
-        self.is_freeze = False
+        # Rendered enemy name
+        self.name_surface = font.render(self.name, True, WHITE)
+
+        # Health overlays, built on first use: health -> hearts above the
+        # enemy and its name below, drawn at hud_offset from the enemy
+        self._huds: dict[int, pygame.Surface] = {}
+        heart_width, heart_height = self.heart3.get_size()
+        name_width, name_height = self.name_surface.get_size()
+        self._hearts_x = (self.width - heart_width * self.hp) // 2
+        self._name_x = (self.width - name_width) // 2
+        left = min(self._hearts_x, self._name_x)
+        right = max(self._hearts_x + heart_width * self.hp, self._name_x + name_width)
+        self.hud_offset = (left, -heart_height)
+        self._hud_size = (right - left, heart_height + self.height + name_height)
+
+    def get_hud(self, health: int) -> pygame.Surface:
+        """Get the health overlay of an enemy of this species.
 
-    def update(self):
-        """Update the enemy's state for each frame.
-        
-        Handles enemy movement, animation, and boundary checking.
-        If the enemy is frozen, no updates are performed.
-        """
-        # If frozen, do not update position
-        if self.is_freeze:
-            return
-
-        # Update position
-        self.rect.x -= self.speed
-
-        # Update animation frames
-        self.current_frame += self.animation_speed
-        if self.current_frame >= len(self.frames):
-            self.current_frame = 0
-        self.image = self.frames[int(self.current_frame)]
-
-        # Boundary check: if enemy leaves left side of screen, trigger escape event and delete
-        if self.rect.right < 0:
-            # Trigger enemy escape event
-            pygame.event.post(pygame.event.Event(ENEMY_ESCAPED, {
-                'enemy': self,
-                'damage': self.health
-            }))
-            # Delete enemy
-            self.kill()
-
-    def draw_hp(self, screen: pygame.Surface):
-        """Draw the enemy's health information on screen.
-        
-        Renders the enemy's health points as icons above the enemy sprite.
-        
         Args:
-            screen: Screen surface to draw on.
+            health: Remaining health of the enemy.
+
+        Returns:
+            pygame.Surface: Hearts and name label, to draw at ``hud_offset``
+            from the enemy's top-left corner.
         """
-        # Draw health icons
-        _x = self.rect.x + (self.rect.width - self.heart1.get_width() * self.params["hp"]) / 2
-        for i in range(self.params["hp"]):
-            heart_image = self.heart3 if i < self.health else self.heart1
-            screen.blit(heart_image, (_x + i * self.heart3.get_width(), self.rect.y - self.heart3.get_height()))
-
-        # Draw enemy name
-        _x = self.rect.x + (self.rect.width - self.name_surface.get_width()) / 2
-        screen.blit(self.name_surface, (_x, self.rect.bottom))
-
-    def take_damage(self, bullet_type: BulletType):
-        """Apply damage to the enemy based on bullet type.
-        
-        Determines if the enemy is vulnerable to the bullet type and reduces
-        health accordingly. If health reaches zero, the enemy is removed.
-        
+        hud = self._huds.get(health)
+        if hud is None:
+            left, top = self.hud_offset
+            hud = pygame.Surface(self._hud_size, pygame.SRCALPHA)
+            hud.blit(get_heart_strip(self.hp, health), (self._hearts_x - left, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            hud.blit(self.name_surface, (self._name_x - left, self.height - top), special_flags=pygame.BLEND_RGBA_MAX)
+            hud = convert_image(hud)
+            # Run-length encode the transparent gap over the enemy, so it costs
+            # nothing to blit
+            hud.set_alpha(255, pygame.RLEACCEL)
+            self._huds[health] = hud
+        return hud
+
+    def hud_item(self, rect: pygame.Rect, health: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Get the health overlay of an enemy of this species and where to draw it.
+
         Args:
-            bullet_type: Type of bullet that hit the enemy.
+            rect:   Where the enemy is drawn.
+            health: Remaining health of the enemy.
+
+        Returns:
+            tuple: (overlay, top-left position), ready for ``Surface.blits``.
         """
-        # Determine if damage is taken
-        if bullet_type == BulletType.ACID:
-            _damage = self.type == "metal" or self.type == "base"
-        elif bullet_type == BulletType.BASE:
-            _damage = self.type == "acid"
-        else:  # BulletType.METAL
-            _damage = self.type == "salt"
-
-        # If damage is taken, reduce health
-        if _damage:
-            self.health -= 1
-            if self.health <= 0:
-                # Trigger enemy kill event
-                pygame.event.post(pygame.event.Event(ENEMY_KILLED, {
-                    'enemy': self,
-                    'damage': 0
-                }))
-                # Delete enemy
-                self.kill()
\ No newline at end of file
+        left, top = self.hud_offset
+        return self.get_hud(health), (rect.x + left, rect.y + top)
+
+
+# Damage matrix row of each bullet type, indexed by enemy type id
+DAMAGE_ROWS = {b: DAMAGE_MATRIX.rows[DAMAGE_MATRIX.bullet_ids[b.value]] for b in BulletType}
+
+
+# Species registry, built on first use (requires pygame.font to be initialized)
+_species: dict[str, EnemySpecies] = {}
+
+
+def get_species(name: str) -> EnemySpecies:
+    """Get the shared species data for an enemy name.
+
+    The registry is built once for all entries of ``ENEMIES`` on the first call.
+
+    Args:
+        name: Enemy name (chemical formula).
+
+    Returns:
+        EnemySpecies: Shared species data.
+    """
+    if not _species:
+        font = pygame.font.SysFont(None, 24)
+        for _name, params in ENEMIES.items():
+            _species[_name] = EnemySpecies(_name, params, font)
+    return _species[name]
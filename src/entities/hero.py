@@ -6,15 +6,20 @@ different hero types (Base Knight, Acid Hitman, and Metal Elf).
 """
 
 import pygame
-from pygame.locals import *
 
 from src.config.settings import SCREEN_HEIGHT, HERO_ATTACK
 from src.entities.bullet import BulletType
+from src.utils.animation import GLOBAL_CLOCK, AnimationClip, PlayMode
+from src.utils.events import emit
 from src.utils.tools import load_sprite_sheet, load_sprite_row
 
 # Bullet type mapping
 BULLET_TYPES = [BulletType.BASE, BulletType.ACID, BulletType.METAL]
 
+# Animation rates in frames per second
+WALK_FPS = 12
+ATTACK_FPS = 15
+
 
 class Avatar:
     """Represents the visual appearance of a player character.
@@ -61,6 +66,10 @@ class Avatar:
             self.attack = self.animations["right"][:4] if len(self.animations["right"]) >= 4 else [self.animations[
                                                                                                        "right"][0]] * 4
 
+        # Shared clips: looping walk cycles and the play-once attack
+        self.walk_clips = {direction: AnimationClip(frames, WALK_FPS) for direction, frames in self.animations.items()}
+        self.attack_clip = AnimationClip(self.attack, ATTACK_FPS, PlayMode.ONCE)
+
     def _create_default_animations(self):
         """Create default animation frames for fallback graphics.
         
@@ -109,24 +118,29 @@ class Hero(pygame.sprite.Sprite):
         # Create character appearance instances
         self.avatars = [Avatar(0), Avatar(1), Avatar(2)]
 
-        # Animation related properties
+        # Animation related properties: the clip playing started at anim_start
+        # (a tick of the owning battle's clock)
+        self.clock = GLOBAL_CLOCK
         self.current_direction = 'right'
-        self.current_frame = 0
-        self.animation_speed = 0.2
-        self.image = self.avatars[self.hero_type].animations[self.current_direction][self.current_frame]
-        self.rect = self.image.get_rect()
+        self.anim_start = 0
+        self.rect = self.avatars[self.hero_type].animations[self.current_direction][0].get_rect()
         self.rect.center = (100, SCREEN_HEIGHT // 2)
+        # Position before the last update, for render interpolation
+        self.previous_topleft = self.rect.topleft
 
         # Physical properties
         self.speed = 5
-        self.last_shot = 0
-        self.shoot_delay = 300  # milliseconds
+        self.shoot_delay = 18  # frames (300 milliseconds at 60 FPS)
+        self.last_shot = -self.shoot_delay
 
         # Status properties
         self.walking = False
         self.direction = 1  # 1 right, -1 left
         self.attacking = False
 
+        # Event bus of the owning battle (pygame's event queue if None)
+        self.events = None
+
     def change_hero(self, hero_type: int):
         """Switch to a different character type.
         
@@ -139,46 +153,53 @@ class Hero(pygame.sprite.Sprite):
         self.hero_type = hero_type
         old_center = self.rect.center
         self.current_direction = 'right'
-        self.current_frame = 0
-        self.animation_speed = 0.2
-        self.image = self.avatars[self.hero_type].animations[self.current_direction][self.current_frame]
-        self.rect = self.image.get_rect()
+        self.anim_start = self.clock.tick
+        self.rect = self.avatars[self.hero_type].animations[self.current_direction][0].get_rect()
         self.rect.center = old_center
 
-    def update(self):
+    @property
+    def image(self) -> pygame.Surface:
+        """Current animation frame: the attack, the walk cycle or the idle pose."""
+        avatar = self.avatars[self.hero_type]
+        elapsed = self.clock.tick - self.anim_start
+        if self.attacking:
+            # The attack advances in the step it starts
+            return avatar.attack_clip.frame(elapsed + 1)
+        if self.walking:
+            return avatar.walk_clips[self.current_direction].frame(elapsed)
+        return avatar.animations[self.current_direction][0]
+
+    def update(self, move: int = 0):
         """Update the character's state for each frame.
         
-        Handles character animations, movement, and input processing. This method
-        is called once per frame to update the character's position and appearance.
+        Handles character animations and movement. This method is called once
+        per frame to update the character's position and appearance; animation
+        frames are computed from the clock, not counted here.
+        
+        Args:
+            move: Vertical movement (-1: up, 1: down, 0: none).
         """
-        # Handle attack animation
+        tick = self.clock.tick
+        self.previous_topleft = self.rect.topleft
+
+        # Handle attack animation (it advances in the step the attack starts)
         if self.attacking:
-            self.current_frame += 0.25
-            if self.current_frame >= len(self.avatars[self.hero_type].attack):
-                self.current_frame = 0
+            clip = self.avatars[self.hero_type].attack_clip
+            elapsed = tick - self.anim_start + 1
+            if clip.finished(elapsed):
+                self.anim_start = tick
                 self.attacking = False
                 # Trigger attack event
-                pygame.event.post(pygame.event.Event(HERO_ATTACK, {
+                emit(self.events, HERO_ATTACK, {
                     'x': self.rect.centerx,
                     'y': self.rect.centery,
                     'direction': self.direction,
                     'bullet_type': BULLET_TYPES[self.hero_type]
-                }))
-            self.image = self.avatars[self.hero_type].attack[int(self.current_frame)]
+                })
             return
 
-        # Get key state
-        keys = pygame.key.get_pressed()
-
-        # Switch character type
-        if keys[K_1]:
-            self.change_hero(0)  # Base
-        elif keys[K_2]:
-            self.change_hero(1)  # Acid
-        elif keys[K_3]:
-            self.change_hero(2)  # Salt
-
         # Handle movement
+        was_walking, last_direction = self.walking, self.current_direction
         self.walking = False
 
         # Horizontal movement (commented out, can be uncommented if needed)
@@ -194,11 +215,11 @@ class Hero(pygame.sprite.Sprite):
         #     self.direction = 1
 
         # Vertical movement
-        if keys[K_UP] or keys[K_w]:
+        if move < 0:
             self.current_direction = 'up'
             self.rect.y -= self.speed
             self.walking = True
-        if keys[K_DOWN] or keys[K_s]:
+        elif move > 0:
             self.current_direction = 'down'
             self.rect.y += self.speed
             self.walking = True
@@ -216,25 +237,21 @@ class Hero(pygame.sprite.Sprite):
         if self.rect.bottom > SCREEN_HEIGHT - 120:
             self.rect.bottom = SCREEN_HEIGHT - 120
 
-        # Update animation frames
-        if self.walking:
-            self.current_frame += self.animation_speed
-            if self.current_frame >= len(self.avatars[self.hero_type].animations[self.current_direction]):
-                self.current_frame = 0
-            self.image = self.avatars[self.hero_type].animations[self.current_direction][int(self.current_frame)]
-        else:
-            # Use first frame when idle
-            self.image = self.avatars[self.hero_type].animations[self.current_direction][0]
-
-    def shoot(self):
+        # A walk cycle starts over when walking starts or turns
+        if self.walking and (not was_walking or self.current_direction != last_direction):
+            self.anim_start = tick
+
+    def shoot(self, now: int):
         """Fire a bullet from the character's current position.
         
         Creates a bullet projectile based on the current hero type and direction.
         Implements a delay between shots to prevent continuous firing.
+        
+        Args:
+            now: Current simulation frame.
         """
-        now = pygame.time.get_ticks()
         if now - self.last_shot > self.shoot_delay:
             self.last_shot = now
             self.attacking = True
-            self.current_frame = 0
+            self.anim_start = now
             self.current_direction = "right"
@@ -50,6 +50,8 @@ class ProcessBar:
         self.bar_x = self.x + self.size * 3
         self.bar_y = self.y + self.size * 2
         self.bar_h = self.size * 2
+        # The icon and frame never change, so they are drawn once
+        self.frame = self._render_frame()
 
     def set_progress(self, progress: int):
         """Set the progress value and update the bar width.
@@ -73,34 +75,42 @@ class ProcessBar:
         """
         return self.progress
 
-    def draw(self, screen: pygame.Surface):
-        """Draw the progress bar on the screen.
-        
-        Renders the progress bar frame, background, and current progress.
-        
-        Args:
-            screen: Pygame surface to draw on.
+    def _render_frame(self) -> pygame.Surface:
+        """Draw the icon and the progress bar frame onto a transparent surface.
+
+        Returns:
+            pygame.Surface: The static part of the bar, drawn at ``(x, y)``.
         """
+        frame = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         if self.icon:
-            screen.blit(self.icon, (self.x, self.y))
+            frame.blit(self.icon, (0, 0))
         # Draw progress bar frame
         _h = self.size
         for i in range(2):
-            _x = self.x_offset + self.x + i * self.size
-            _y = self.y + 2 * self.size - i * self.size
+            _x = self.x_offset + i * self.size
+            _y = 2 * self.size - i * self.size
             _w = self.width - i * self.size * 2 - self.x_offset
-            pygame.draw.rect(screen, self.border_color, (_x, _y, _w, _h))
-            pygame.draw.rect(screen, self.bg_color, (_x + self.size, _y, _w - self.size * 2, _h))
-            _y = self.y + 3 * self.size + i * self.size
-            pygame.draw.rect(screen, self.border_color, (_x, _y, _w, _h))
-            pygame.draw.rect(screen, self.bg_color, (_x + self.size, _y, _w - self.size * 2, _h))
+            pygame.draw.rect(frame, self.border_color, (_x, _y, _w, _h))
+            pygame.draw.rect(frame, self.bg_color, (_x + self.size, _y, _w - self.size * 2, _h))
+            _y = 3 * self.size + i * self.size
+            pygame.draw.rect(frame, self.border_color, (_x, _y, _w, _h))
+            pygame.draw.rect(frame, self.bg_color, (_x + self.size, _y, _w - self.size * 2, _h))
 
-        _x = self.x + self.size * 2 + self.x_offset
-        _y = self.y
+        _x = self.size * 2 + self.x_offset
         _w = self.width - self.size * 4 - self.x_offset
-        pygame.draw.rect(screen, self.border_color, (_x, _y, _w, _h))
-        _y = self.y + 5 * self.size
-        pygame.draw.rect(screen, self.border_color, (_x, _y, _w, _h))
+        pygame.draw.rect(frame, self.border_color, (_x, 0, _w, _h))
+        pygame.draw.rect(frame, self.border_color, (_x, 5 * self.size, _w, _h))
+        return frame
+
+    def draw(self, screen: pygame.Surface):
+        """Draw the progress bar on the screen.
+        
+        Blits the pre-rendered icon and frame, then draws the current progress.
+        
+        Args:
+            screen: Pygame surface to draw on.
+        """
+        screen.blit(self.frame, (self.x, self.y))
 
         # Draw progress
         pygame.draw.rect(screen, self.border_color,
@@ -0,0 +1,162 @@
+"""Batch balance simulation for the Chemination game.
+
+This module runs many seeded headless battles in parallel worker processes,
+each driven by a pluggable bot policy, and writes one summary row per battle
+(survival time, kills and escapes per species, HP lost by source) to a CSV or
+Parquet file. Battles are independent, so throughput scales with the number of
+worker processes.
+
+Policies are resolved by name with ``src.game.bots.get_policy``.
+"""
+
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.data.tables import SPECIES_TABLE
+from src.game.bots import get_policy
+from src.game.simulation import create_simulation
+
+
+def run_battle(seed: int, policy: str = "idle", frames: int = 3600, entity_store: str = "ecs") -> dict:
+    """Run one headless battle to its end or the frame limit.
+
+    Args:
+        seed:         Battle seed.
+        policy:       Policy name (see get_policy).
+        frames:       Maximum number of frames.
+        entity_store: Entity storage backend (see create_simulation).
+
+    Returns:
+        dict: Summary row of the battle.
+    """
+    sim = create_simulation(seed, entity_store)
+    act = get_policy(policy)(seed)
+    for _ in range(frames):
+        sim.step(act(sim))
+        if sim.is_over:
+            break
+
+    stats = sim.stats
+    row = {
+        "seed": seed,
+        "policy": policy,
+        "frames": sim.frame,
+        "survived": not sim.is_over,
+        "hp": max(sim.hp, 0),
+        "kills": stats["kills"],
+        "escaped": stats["escaped"],
+        "collisions": stats["collisions"],
+        "spawned": stats["spawned"],
+        "shots": stats["shots"],
+        "hp_lost_escape": stats["hp_lost_escape"],
+        "hp_lost_collision": stats["hp_lost_collision"],
+    }
+    for name in SPECIES_TABLE.names:
+        row[f"kills_{name}"] = sim.species_kills.get(name, 0)
+    for name in SPECIES_TABLE.names:
+        row[f"escaped_{name}"] = sim.species_escapes.get(name, 0)
+    return row
+
+
+def _init_worker():
+    """Prepare a worker process for headless battles."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import pygame
+    pygame.init()
+
+
+def _run_chunk(seeds: list[int], policy: str, frames: int, entity_store: str) -> list[dict]:
+    """Run a chunk of battles in a worker process."""
+    return [run_battle(seed, policy, frames, entity_store) for seed in seeds]
+
+
+def run_batch(battles: int, workers: Optional[int] = None, policy: str = "idle", frames: int = 3600,
+              base_seed: int = 0, entity_store: str = "ecs") -> tuple[list[dict], dict]:
+    """Run battles with consecutive seeds across worker processes.
+
+    Args:
+        battles:      Number of battles.
+        workers:      Worker processes (defaults to the number of CPUs).
+        policy:       Policy name (see get_policy).
+        frames:       Maximum number of frames per battle.
+        base_seed:    Seed of the first battle.
+        entity_store: Entity storage backend (see create_simulation).
+
+    Returns:
+        tuple: Summary rows ordered by seed, and aggregate results including
+        throughput in battles per second and per second per worker.
+    """
+    get_policy(policy)  # Fail early on unknown policies
+    workers = workers or os.cpu_count() or 1
+    seeds = list(range(base_seed, base_seed + battles))
+    # A few chunks per worker keep all workers busy without per-battle overhead
+    chunk_size = max(1, min(64, battles // (workers * 4)))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, battles, chunk_size)]
+
+    start = time.perf_counter()
+    rows = []
+    with ProcessPoolExecutor(workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(_run_chunk, chunk, policy, frames, entity_store) for chunk in chunks]
+        for future in futures:
+            rows.extend(future.result())
+    elapsed = time.perf_counter() - start
+
+    return rows, summarize(rows, elapsed, workers)
+
+
+def summarize(rows: list[dict], elapsed: float, workers: int) -> dict:
+    """Aggregate battle summary rows.
+
+    Args:
+        rows:    Summary rows, as produced by run_battle.
+        elapsed: Wall time of the batch in seconds.
+        workers: Number of worker processes.
+
+    Returns:
+        dict: Battle count, survival rate, mean survival frames, kills, escapes
+        and HP lost by source, plus throughput.
+    """
+    count = len(rows)
+    if not count:
+        return {"battles": 0}
+
+    def mean(key: str) -> float:
+        return sum(row[key] for row in rows) / count
+
+    battles_per_second = count / elapsed if elapsed > 0 else 0.0
+    return {
+        "battles": count,
+        "survival_rate": mean("survived"),
+        "mean_frames": mean("frames"),
+        "mean_kills": mean("kills"),
+        "mean_escaped": mean("escaped"),
+        "mean_hp_lost_escape": mean("hp_lost_escape"),
+        "mean_hp_lost_collision": mean("hp_lost_collision"),
+        "elapsed": elapsed,
+        "workers": workers,
+        "battles_per_second": battles_per_second,
+        "battles_per_second_per_core": battles_per_second / workers,
+    }
+
+
+def write_summary(rows: list[dict], path: str):
+    """Write summary rows to a CSV file, or a Parquet file for a ``.parquet`` path.
+
+    Parquet output requires pandas with a Parquet engine (pyarrow).
+
+    Args:
+        rows: Summary rows.
+        path: Destination file path.
+    """
+    if path.endswith(".parquet"):
+        import pandas as pd
+        pd.DataFrame(rows).to_parquet(path, index=False)
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
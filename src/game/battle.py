@@ -1,18 +1,19 @@
 import random
+import time
+
 import pygame
 
-from src.config.settings import (
-    PINK, WHITE, CYAN, SCREEN_WIDTH, BLACK, SCREEN_HEIGHT,
-    ENEMY_ESCAPED, ENEMY_KILLED, HERO_ATTACK, RED, GREEN
-)
-from src.data.chemicals import ENEMIES
-from src.entities.bullet import Bullet, BulletType
+from src.config.settings import PINK, WHITE, CYAN, SCREEN_WIDTH, BLACK, SCREEN_HEIGHT
 from src.entities.button import ImageButton
-from src.entities.enemy import Enemy
-from src.entities.hero import Hero
 from src.entities.processbar import ProcessBar
 from src.game.scene import Scene
+from src.game.bots import get_policy
+from src.game.replay import BattleRecorder
+from src.game.simulation import BattleInput, create_simulation
+from src.game.stress import StressTest, format_report
+from src.utils.dirty import DirtyRenderer
 from src.utils.effects import EffectsManager
+from src.utils.render_queue import Layer, RenderQueue
 from src.utils.music import (
     load_background_music, pause_background_music, resume_background_music
 )
@@ -20,7 +21,12 @@ from src.utils.tools import resource_path
 
 
 class BattleScene(Scene):
-    """Battle scene class"""
+    """Battle scene class
+
+    The game rules live in a BattleSimulation; the scene translates keyboard
+    and mouse input into BattleInput commands, steps the simulation once per
+    frame and renders its state.
+    """
 
     def __init__(self, parent):
         """Initialize battle scene
@@ -32,7 +38,22 @@ class BattleScene(Scene):
 
         # Game state
         self.is_running = True
-        self.is_frozen = False
+
+        # Battle rules and entities
+        self.sim = create_simulation(parent.seed, parent.entity_store)
+
+        # Stress test started from the command line (F9 toggles one at any time)
+        self.stress = parent.stress
+        parent.stress = None
+
+        # Optional recording of the battle for later replay (stress test spawns are not recorded)
+        self.recorder = BattleRecorder(self.sim.seed) if parent.record_path and not self.stress else None
+
+        # Commands collected from input events until the next update
+        self.commands = BattleInput()
+
+        # Optional bot playing the hero instead of the keyboard and mouse
+        self.bot = get_policy(parent.policy)(self.sim.seed) if parent.policy else None
 
         # Load resources
         self._load_resources()
@@ -40,18 +61,27 @@ class BattleScene(Scene):
         # Initialize game data
         self._init_game_data()
 
-        # Create player and sprite groups
+        # Create sprite groups
         self._init_sprites()
 
         # Initialize effects manager
-        self.effects_manager = EffectsManager()
+        self.effects_manager = EffectsManager(random.Random(self.sim.seed))
+        self.sim.on_impact = self.effects_manager.add_effect
 
         # Initialize pause screen
         self._init_pause_screen()
 
-        # Timers
-        self.enemy_spawn_timer = 0
-        self.frozen_timer = 0
+        # Offscreen render target for pixel observations (see enable_capture)
+        self.capture = None
+
+        # Sprites, HUD overlays and effects are drawn in one batch per layer
+        self.render_queue = RenderQueue()
+        # Draw calls and blits of the last frame
+        self.draw_counts = (0, 0)
+
+        # Static layer cache for dirty-rectangle rendering; the info bar is part
+        # of it and is redrawn when its values change
+        self.dirty = DirtyRenderer(show_debug=parent.show_dirty)
 
         # Load background music
         load_background_music("battle_bgm.mp3")
@@ -94,42 +124,66 @@ class BattleScene(Scene):
         except (FileNotFoundError, pygame.error):
             # If font file does not exist, use system default font
             self.font = pygame.font.SysFont(None, 24)
+        self.debug_font = pygame.font.SysFont(None, 20)
 
     def _init_game_data(self):
         """Initialize game data"""
-        # Player attributes
-        self.hp = 100
-        self.mp = 0
-
         # Progress bars
         self.hp_bar = ProcessBar(20, 10, 300, 30, PINK, WHITE, "hp.png")
-        self.hp_bar.set_progress(self.hp)
+        self.hp_bar.set_progress(self.sim.hp)
         self.mp_bar = ProcessBar(360, 10, 300, 30, CYAN, WHITE, "mp.png")
-        self.mp_bar.set_progress(self.mp)
+        self.mp_bar.set_progress(self.sim.mp)
 
         # Top info bar
         self.rectangle = pygame.Surface((SCREEN_WIDTH, 50), pygame.SRCALPHA)
         self.rectangle.fill((255, 255, 255, 128))
 
-        # Kill count
-        self.kill_count = 0
-        self.kill_count_text = self.font.render("Kill Count: " + str(self.kill_count), True, BLACK)
+        # Info bar composited over the background, rebuilt when hud_dirty is set
+        self.hud = pygame.Surface(self.rectangle.get_size())
+        self.hud_dirty = True
 
-        # Skill points
-        self.boom_count = 3
-        self.boom_count_text = self.font.render("x" + str(self.boom_count), True, BLACK)
+        # Kill count and skill points, as last rendered
+        self.kill_count = None
+        self.boom_count = None
+        self._sync_hud()
 
     def _init_sprites(self):
         """Initialize sprite groups"""
-        # Create player
-        self.player = Hero()
-
-        # Create sprite groups
-        self.all_sprites = pygame.sprite.Group(self.player)
-        self.bullets = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
         self.ui_sprites = pygame.sprite.Group(self.pause_button)
 
+    def _sync_hud(self):
+        """Bring the info bar in line with the simulation state, flagging it dirty on changes"""
+        sim = self.sim
+        progress = (self.hp_bar.progress, self.mp_bar.progress)
+        self.hp_bar.set_progress(sim.hp)
+        self.mp_bar.set_progress(sim.mp)
+        if progress != (self.hp_bar.progress, self.mp_bar.progress):
+            self.hud_dirty = True
+        if self.kill_count != sim.kill_count:
+            self.hud_dirty = True
+            self.kill_count = sim.kill_count
+            self.kill_count_text = self.font.render("Kill Count: " + str(self.kill_count), True, BLACK)
+        if self.boom_count != sim.boom_count:
+            self.hud_dirty = True
+            self.boom_count = sim.boom_count
+            self.boom_count_text = self.font.render("x" + str(self.boom_count), True, BLACK)
+
+    def _read_held_keys(self):
+        """Add held-key commands (movement, direct hero selection) to this frame's commands"""
+        keys = pygame.key.get_pressed()
+
+        # Switch character type
+        if keys[pygame.K_1]:
+            self.commands.hero = 0  # Base
+        elif keys[pygame.K_2]:
+            self.commands.hero = 1  # Acid
+        elif keys[pygame.K_3]:
+            self.commands.hero = 2  # Salt
+
+        # Vertical movement
+        self.commands.move = ((keys[pygame.K_DOWN] or keys[pygame.K_s]) -
+                              (keys[pygame.K_UP] or keys[pygame.K_w]))
+
     def _init_pause_screen(self):
         """Initialize pause screen"""
         # Pause overlay
@@ -157,136 +211,244 @@ class BattleScene(Scene):
         )
         self.overlay_sprites = pygame.sprite.Group(self.start_button, self.stop_button)
 
+        # Battlefield, overlay and panel of the paused game, captured once per pause
+        self.pause_frame = None
+
     def pause_game(self):
         """Pause game"""
         self.is_running = False
+        self.pause_frame = None
+        self.dirty.invalidate()
         pause_background_music()
 
     def resume_game(self):
         """Resume game"""
         self.is_running = True
+        self.pause_frame = None
+        self.dirty.invalidate()
         resume_background_music()
 
-    def spawn_enemy(self):
-        """Spawn enemy"""
-        enemy_name = random.choice(list(ENEMIES.keys()))
-        enemy = Enemy(enemy_name, ENEMIES[enemy_name])
-        self.all_sprites.add(enemy)
-        self.enemies.add(enemy)
-        self.enemy_spawn_timer = 0
-
-    def freeze_enemy(self):
-        """Freeze all enemies"""
-        self.is_frozen = True
-        self.frozen_timer = 0
-        self.boom_count -= 1
-        self.boom_count_text = self.font.render("x" + str(self.boom_count), True, BLACK)
-        for e in self.enemies:
-            e.freeze()
-
-    def unfreeze_enemy(self):
-        """Unfreeze all enemies"""
-        self.is_frozen = False
-        self.frozen_timer = 0
-        for e in self.enemies:
-            e.unfreeze()
-
-    def shoot(self, x: int, y: int, direction: int, bullet_type: BulletType):
-        """
-        Fire bullet
-        
-        Args:
-            x:           Bullet initial x coordinate
-            y:           Bullet initial y coordinate
-            direction:   Bullet direction
-            bullet_type: Bullet type
+    def is_idle(self) -> bool:
+        """Check whether the battle only changes in response to input.
+
+        Returns:
+            bool: True while paused, unless a stress test is running.
         """
-        bullet = Bullet(x, y, direction, bullet_type)
-        self.all_sprites.add(bullet)
-        self.bullets.add(bullet)
+        return not self.is_running and not (self.stress and self.stress.running)
+
+    def leave(self):
+        """Save the battle recording, if any, when leaving the scene"""
+        if self.recorder:
+            try:
+                self.recorder.save(self.parent.record_path)
+            except OSError as e:
+                print(f"Error saving replay: {e}")
+            self.recorder = None
 
     def update(self):
         """Update game state"""
         # Do not update when paused
         if not self.is_running:
             return
+        start = time.perf_counter()
 
-        # Spawn enemies
-        if not self.is_frozen:
-            self.enemy_spawn_timer += 1
-            # Enemy spawn speed increases with kill count (minimum interval 120 frames)
-            spawn_interval = max(300 - self.kill_count, 120)
-            if self.enemy_spawn_timer >= spawn_interval:
-                self.spawn_enemy()
+        # Advance the simulation with this frame's commands
+        if self.bot:
+            self.commands = self.bot(self.sim)
         else:
-            # Update freeze timer
-            self.frozen_timer += 1
-            if self.frozen_timer >= 300:  # Unfreeze after 300 frames
-                self.unfreeze_enemy()
-
-        # Update all sprites
-        self.all_sprites.update()
-
-        # Detect collision between player and enemies
-        hits = pygame.sprite.spritecollide(self.player, self.enemies, False)
-        for hit in hits:
-            self.hp -= hit.health
-            if self.hp <= 0:
-                self.parent.game_over()
-            self.hp_bar.set_progress(self.hp)
-            self.effects_manager.add_effect(hit.rect.x, hit.rect.centery, RED)
-            # Delete enemy
-            hit.kill()
-
-        # Collision detection: bullets and enemies
-        hits = pygame.sprite.groupcollide(self.bullets, self.enemies, True, False)
-        for bullet, enemy_list in hits.items():
-            for enemy in enemy_list:
-                enemy.take_damage(bullet.bullet_type)
+            self._read_held_keys()
+        if self.stress:
+            self.stress.apply(self.sim, self.commands)
+        self.sim.step(self.commands)
+        if self.recorder:
+            self.recorder.record(self.commands, self.sim)
+        self.commands = BattleInput()
+        self._sync_hud()
+        if self.sim.is_over:
+            self.parent.game_over()
 
         # Update effects
         self.effects_manager.update_effects()
 
+        if self.stress:
+            self.stress.record_update(time.perf_counter() - start)
+
     def render(self, screen: pygame.Surface):
         """Render the battle scene to the screen.
 
         Args:
             screen: The pygame surface to render to.
         """
+        start = time.perf_counter()
+        self._draw_background(screen)
+        self._queue_frame()
+
+        # Draw the queued layers
+        queue = self.render_queue
+        queue.flush(screen)
+        self.draw_counts = (queue.draw_calls, queue.blit_count)
+
+        if self.stress:
+            self._update_stress(time.perf_counter() - start)
+
+    def render_dirty(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Render only the regions that changed since the last frame.
+
+        Args:
+            screen: The pygame surface to render to.
+
+        Returns:
+            list: Rectangles of the screen to update.
+        """
+        start = time.perf_counter()
+        if self.hud_dirty:
+            self.dirty.invalidate(self.hud.get_rect())
+        self._queue_frame()
+
+        rects = self.dirty.render(screen, self._draw_background, self.render_queue.drain())
+        self.draw_counts = (self.dirty.draw_calls, self.dirty.blit_count)
+
+        if self.stress:
+            self._update_stress(time.perf_counter() - start)
+        return rects
+
+    def _draw_background(self, surface: pygame.Surface):
+        """Draw what lies under this frame's queued items: the static layer, or the frozen pause frame.
+
+        Args:
+            surface: The pygame surface to render to.
+        """
+        if self.is_running:
+            self.render_static(surface)
+            return
+        if self.pause_frame is None:
+            self.pause_frame = self._capture_pause_frame()
+        surface.blit(self.pause_frame, (0, 0))
+
+    def _capture_pause_frame(self) -> pygame.Surface:
+        """Render the paused battlefield under the overlay and the pause panel.
+
+        Nothing on the battlefield moves while paused, so this is done once per
+        pause instead of every frame.
+
+        Returns:
+            pygame.Surface: The frame the pause screen buttons are drawn over.
+        """
+        frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.render_static(frame)
+        queue = self.render_queue
+        self._queue_battlefield(queue)
+        queue.submit(self.overlay, (0, 0), Layer.OVERLAY)
+        queue.submit(self.pause_screen, ((SCREEN_WIDTH - 504) // 2, (SCREEN_HEIGHT - 369) // 2), Layer.OVERLAY)
+        queue.flush(frame)
+        return frame
+
+    def render_static(self, surface: pygame.Surface):
+        """Draw the background and the info bar.
+
+        Args:
+            surface: The pygame surface to render to.
+        """
         # Draw background
-        screen.blit(self.background, (0, 0))
+        surface.blit(self.background, (0, 0))
 
         # Draw game data bar
-        screen.blit(self.rectangle, (0, 0))
-        self.hp_bar.draw(screen)
-        self.mp_bar.draw(screen)
+        if self.hud_dirty:
+            self._render_hud()
+        surface.blit(self.hud, (0, 0))
+
+    def _render_hud(self):
+        """Composite the info bar and the background behind it into the HUD surface"""
+        hud = self.hud
+        hud.blit(self.background, (0, 0))
+        hud.blit(self.rectangle, (0, 0))
+        self.hp_bar.draw(hud)
+        self.mp_bar.draw(hud)
 
         # Draw skill icon and count
         x_pos = self.mp_bar.x + self.mp_bar.width + 10
-        screen.blit(self.boom, (x_pos, 10))
+        hud.blit(self.boom, (x_pos, 10))
         x_pos += self.boom.get_width()
-        screen.blit(self.boom_count_text, (x_pos, 12))
+        hud.blit(self.boom_count_text, (x_pos, 12))
 
         # Draw kill count
         x_pos += 60
-        screen.blit(self.rip, (x_pos, 10))
+        hud.blit(self.rip, (x_pos, 10))
         x_pos += self.rip.get_width() + 10
-        screen.blit(self.kill_count_text, (x_pos, 12))
+        hud.blit(self.kill_count_text, (x_pos, 12))
+        self.hud_dirty = False
+
+    def _queue_frame(self):
+        """Queue the sprites, effects and overlays of this frame"""
+        queue = self.render_queue
+        if self.is_running:
+            self._queue_battlefield(queue)
+        else:
+            # The rest of the pause screen is in the frozen pause frame
+            queue.extend([(sprite.image, sprite.rect) for sprite in self.overlay_sprites], Layer.OVERLAY)
 
-        # Draw all sprites
-        self.ui_sprites.draw(screen)
-        self.all_sprites.draw(screen)
-        for e in self.enemies:
-            e.draw_hp(screen)
+        # Queue the last stress test report
+        if self.stress and self.stress.reports:
+            queue.submit(self.stress_text, (10, SCREEN_HEIGHT - self.stress_text.get_height() - 10), Layer.OVERLAY)
 
-        # Draw effects
-        self.effects_manager.draw_effects(screen)
+    def _queue_battlefield(self, queue: RenderQueue):
+        """Queue the UI, sprites and effects.
 
-        # Draw pause screen
-        if not self.is_running:
-            screen.blit(self.overlay, (0, 0))
-            screen.blit(self.pause_screen, ((SCREEN_WIDTH - 504) / 2, (SCREEN_HEIGHT - 369) / 2))
-            self.overlay_sprites.draw(screen)
+        Args:
+            queue: The render queue of this frame.
+        """
+        # Queue all sprites
+        queue.extend([(sprite.image, sprite.rect) for sprite in self.ui_sprites], Layer.UI)
+        self._queue_sprites(queue)
+
+        # Queue effects
+        queue.extend(self.effects_manager.blit_items(), Layer.EFFECTS)
+
+    def enable_capture(self, observation_size: tuple[int, int] | None = None, grayscale: bool = False):
+        """Render frames offscreen for pixel observations (see render_observation).
+
+        Args:
+            observation_size: Size observations are scaled to; full size if omitted.
+            grayscale:        Whether observations are grayscale.
+        """
+        from src.utils.capture import FrameCapture
+        self.capture = FrameCapture(observation_size=observation_size, grayscale=grayscale)
+
+    def render_observation(self):
+        """Render the scene offscreen and get its pixels as a NumPy array.
+
+        The array is a reused buffer: it is overwritten by the next observation.
+
+        Returns:
+            np.ndarray: ``(height, width, 3)`` RGB or ``(height, width)`` grayscale pixels.
+        """
+        if self.capture is None:
+            self.enable_capture()
+        self.render(self.capture.surface)
+        return self.capture.observe()
+
+    def _update_stress(self, render_seconds: float):
+        """Feed the stress test with this frame's timings and render its last report.
+
+        Args:
+            render_seconds: Time this frame took to render.
+        """
+        stress = self.stress
+        if stress.record_frame(self.parent.frame_time, render_seconds, self.sim, *self.draw_counts):
+            self.stress_text = self.debug_font.render(format_report(stress.reports[-1]), True, WHITE, BLACK)
+        if stress.result and stress.quit_when_done:
+            self.parent.running = False
+
+    def _queue_sprites(self, queue: RenderQueue):
+        """Queue the battle sprites and enemy HP, interpolated between the last two updates.
+
+        Args:
+            queue: The render queue of this frame.
+        """
+        lag = 1.0 - self.alpha if self.is_running else 0.0
+        sprites, huds = self.sim.render_items(lag)
+        queue.extend(sprites, Layer.ENTITIES)
+        queue.extend(huds, Layer.HUD)
 
     def process_input(self, event: pygame.event.Event):
         """Process user input events.
@@ -302,57 +464,34 @@ class BattleScene(Scene):
         # Handle keyboard events
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                self.player.shoot()
+                self.commands.shoot = True
+            # Debug: start/stop a stress test
+            elif event.key == pygame.K_F9:
+                if self.stress and self.stress.running:
+                    self.stress.stop()
+                else:
+                    self.stress = StressTest()
+                    # The recording cannot replay the stress test's spawns and bullets
+                    if self.recorder:
+                        print("Stress test started: the battle is no longer recorded")
+                        self.recorder = None
 
         elif event.type == pygame.KEYUP:
             # Character switching
             if event.key == pygame.K_LEFT:
-                hero_type = (self.player.hero_type - 1) % 3
-                self.player.change_hero(hero_type)
+                self.commands.switch -= 1
             elif event.key == pygame.K_RIGHT:
-                hero_type = (self.player.hero_type + 1) % 3
-                self.player.change_hero(hero_type)
+                self.commands.switch += 1
             # Skill release
             elif event.key == pygame.K_x:
-                if not self.is_frozen and self.boom_count > 0:
-                    self.freeze_enemy()
+                self.commands.freeze = True
 
         # Handle mouse events
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:  # Left click to shoot
-                self.player.shoot()
+                self.commands.shoot = True
             elif event.button == 3:  # Right click to switch character
-                hero_type = (self.player.hero_type + 1) % 3
-                self.player.change_hero(hero_type)
-
-        # Handle custom events
-        elif event.type == HERO_ATTACK:  # Player attack
-            self.shoot(**event.dict)
-        elif event.type == ENEMY_ESCAPED:  # Enemy escape
-            enemy = event.dict.get('enemy', None)
-            damage = event.dict.get('damage', 0)
-            if enemy:
-                self.hp -= damage
-                self.hp_bar.set_progress(self.hp)
-                self.effects_manager.add_effect(0, enemy.rect.centery, RED)
-                if self.hp <= 0:
-                    self.parent.game_over()
-
-        elif event.type == ENEMY_KILLED:  # Enemy killed
-            enemy = event.dict.get('enemy', None)
-            if enemy:
-                self.kill_count += 1
-                self.mp += 10
-                self.mp_bar.set_progress(self.mp)
-                self.kill_count_text = self.font.render("Kill Count: " + str(self.kill_count), True, BLACK)
-                self.effects_manager.add_effect(enemy.rect.x, enemy.rect.centery, GREEN)
-
-                # Gain one skill point for every 10 enemies killed
-                if self.kill_count % 10 == 0:
-                    self.mp = 0
-                    self.mp_bar.set_progress(self.mp)
-                    self.boom_count += 1
-                    self.boom_count_text = self.font.render("x" + str(self.boom_count), True, BLACK)
+                self.commands.switch += 1
 
         # Update UI sprites
         self.ui_sprites.update(event)
@@ -0,0 +1,307 @@
+"""Bot players for the Chemination game.
+
+This module contains scripted policies that play a battle by producing the
+BattleInput of every step from the observed battle state: hero lane (vertical
+movement), hero type, shooting and the freeze skill. They drive headless,
+batch and windowed battles for load, soak and regression runs.
+
+Built-in bots:
+
+- ``random``: wanders between lanes and presses buttons at random.
+- ``greedy``: chases the enemy closest to the hero with the hero type that
+  counters it.
+- ``oracle``: reads the exact state and kinematics of every enemy and attacks
+  the one with the least slack before it reaches the hero, accounting for
+  enemies that block the lane; it saves the freeze skill for crowds.
+
+Besides the built-ins, a policy can be named as ``module:attribute`` of any
+factory that takes the battle seed and returns a callable mapping the
+simulation to the BattleInput of the next step.
+"""
+
+import importlib
+import math
+import random
+from abc import ABC, abstractmethod
+from typing import Callable, NamedTuple
+
+from src.data.tables import SPECIES_TABLE, DAMAGE_MATRIX
+from src.entities.bullet import get_bullet_frames
+from src.entities.hero import BULLET_TYPES
+from src.game.simulation import BattleInput, BattleSimulation
+
+# Bullet speed in pixels per frame
+BULLET_SPEED = 10
+
+# Damage of each hero's bullet against each enemy type id
+HERO_DAMAGE = [DAMAGE_MATRIX.rows[DAMAGE_MATRIX.bullet_ids[b.value]] for b in BULLET_TYPES]
+# Hero that counters each enemy type id (the one dealing the most damage), or None
+COUNTER_HERO = [
+    max(range(len(BULLET_TYPES)), key=lambda h: HERO_DAMAGE[h][t]) if any(row[t] for row in HERO_DAMAGE) else None
+    for t in range(len(SPECIES_TABLE.types))
+]
+
+
+# Bullet height in pixels, read from the bullet frames on first use
+_bullet_height: int | None = None
+
+
+def bullet_height() -> int:
+    """Get the height of a bullet in pixels.
+
+    The bullet frames are loaded on the first call rather than on import.
+
+    Returns:
+        int: Bullet height.
+    """
+    global _bullet_height
+    if _bullet_height is None:
+        _bullet_height = get_bullet_frames(BULLET_TYPES[0])[1][0].get_height()
+    return _bullet_height
+
+
+class EnemyView(NamedTuple):
+    """Observed state of an enemy."""
+    x: int
+    y: int
+    width: int
+    height: int
+    species: int
+    health: int
+    speed: int
+
+    @property
+    def type_id(self) -> int:
+        """Enemy type id."""
+        return SPECIES_TABLE.type_id[self.species]
+
+    @property
+    def centery(self) -> int:
+        """Vertical center."""
+        return self.y + self.height // 2
+
+
+def observe_enemies(sim: BattleSimulation) -> list[EnemyView]:
+    """Get the enemies of a battle, for any entity store.
+
+    Args:
+        sim: The battle.
+
+    Returns:
+        list: Enemy views, in no particular order.
+    """
+    return [EnemyView(*rect, species.id, health, species.speed) for rect, species, health in sim.enemy_states()]
+
+
+class Bot(ABC):
+    """Abstract base class of bot policies.
+
+    A bot is called with the battle before every step and returns the commands
+    of that step. Bots only read the simulation, so they can drive any battle,
+    recorded or not.
+    """
+
+    def __init__(self, seed: int = 0):
+        """Initialize the bot.
+
+        Args:
+            seed: Seed of the bot's own random generator.
+        """
+        self.rng = random.Random(seed)
+
+    def __call__(self, sim: BattleSimulation) -> BattleInput:
+        return self.act(sim)
+
+    @abstractmethod
+    def act(self, sim: BattleSimulation) -> BattleInput:
+        """Choose the commands of the next step.
+
+        Args:
+            sim: The battle, before the step.
+
+        Returns:
+            BattleInput: Commands of the step.
+        """
+        pass
+
+    @staticmethod
+    def can_shoot(sim: BattleSimulation) -> bool:
+        """Check whether a shot issued in the next step starts an attack."""
+        player = sim.player
+        return not player.attacking and sim.frame + 1 - player.last_shot > player.shoot_delay
+
+    @staticmethod
+    def steer(sim: BattleSimulation, target_y: int) -> int:
+        """Get the movement that brings the hero's center towards a height.
+
+        Args:
+            sim:      The battle.
+            target_y: Target center height.
+
+        Returns:
+            int: Movement command (-1, 0 or 1).
+        """
+        player = sim.player
+        delta = target_y - player.rect.centery
+        if abs(delta) < player.speed:
+            return 0
+        return 1 if delta > 0 else -1
+
+    @staticmethod
+    def in_lane(sim: BattleSimulation, enemy: EnemyView) -> bool:
+        """Check whether a bullet fired now would cross an enemy's rows."""
+        y = sim.player.rect.centery
+        half = bullet_height() // 2
+        return y - half < enemy.y + enemy.height and y + half > enemy.y
+
+
+class RandomBot(Bot):
+    """Wanders between lanes, switches heroes and presses buttons at random."""
+
+    def __init__(self, seed: int = 0):
+        super().__init__(seed)
+        self.move = 0
+        self.hold = 0
+
+    def act(self, sim: BattleSimulation) -> BattleInput:
+        rng = self.rng
+        # Keep a direction for a while, so the hero actually changes lanes
+        if self.hold <= 0:
+            self.move = rng.choice((-1, 0, 1))
+            self.hold = rng.randint(10, 60)
+        self.hold -= 1
+        return BattleInput(
+            move=self.move,
+            hero=rng.randrange(3) if rng.random() < 0.02 else None,
+            shoot=rng.random() < 0.2,
+            freeze=rng.random() < 0.001,
+        )
+
+
+class GreedyBot(Bot):
+    """Attacks the enemy closest to the hero with the hero type that counters it."""
+
+    def act(self, sim: BattleSimulation) -> BattleInput:
+        enemies = [e for e in observe_enemies(sim) if COUNTER_HERO[e.type_id] is not None]
+        if not enemies:
+            return BattleInput()
+        target = min(enemies, key=lambda e: e.x)
+        hero = COUNTER_HERO[target.type_id]
+        commands = BattleInput(move=self.steer(sim, target.centery), hero=hero)
+        if sim.player.hero_type == hero and self.in_lane(sim, target):
+            commands.shoot = True
+        # Freeze when an enemy is about to reach the hero
+        if target.x < sim.player.rect.right + 60 and not sim.is_frozen and sim.boom_count > 0:
+            commands.freeze = True
+        return commands
+
+
+class OracleBot(Bot):
+    """Plays with full knowledge of the battle state and its kinematics.
+
+    For every enemy the bot computes how many frames remain before it reaches
+    the hero, and how many frames killing it would take: reaching its lane,
+    switching heroes, one attack per hit needed and the bullet's flight. It
+    attacks the front enemy of the lane with the least slack, and releases the
+    freeze skill when several enemies cannot be killed in time.
+    """
+
+    # Frames from a shot until the bullet leaves (attack animation)
+    attack_frames = 16
+    # Enemies without a chance that justify the freeze skill
+    freeze_threshold = 2
+
+    def _frames_left(self, sim: BattleSimulation, enemy: EnemyView) -> float:
+        """Frames until an enemy reaches the hero's column."""
+        if sim.is_frozen:
+            return math.inf
+        return max(enemy.x - sim.player.rect.right, 0) / enemy.speed
+
+    def _frames_to_kill(self, sim: BattleSimulation, enemy: EnemyView) -> float:
+        """Frames the hero needs to kill an enemy, starting now."""
+        hero = COUNTER_HERO[enemy.type_id]
+        if hero is None:
+            return math.inf
+        player = sim.player
+        travel = abs(enemy.centery - player.rect.centery) / player.speed
+        hits = math.ceil(enemy.health / HERO_DAMAGE[hero][enemy.type_id])
+        cycle = player.shoot_delay + 1
+        flight = max(enemy.x - player.rect.right, 0) / (BULLET_SPEED + enemy.speed)
+        return travel + (hits - 1) * cycle + self.attack_frames + flight
+
+    def _front(self, enemies: list[EnemyView], enemy: EnemyView) -> EnemyView:
+        """Get the enemy a bullet aimed at an enemy's center would hit first."""
+        y = enemy.centery
+        half = bullet_height() // 2
+        blockers = [e for e in enemies if e.y < y + half and e.y + e.height > y - half]
+        return min(blockers, key=lambda e: e.x)
+
+    def act(self, sim: BattleSimulation) -> BattleInput:
+        enemies = observe_enemies(sim)
+        if not enemies:
+            return BattleInput()
+
+        # Slack of every enemy: frames to spare after killing it
+        slack = {e: self._frames_left(sim, e) - self._frames_to_kill(sim, e) for e in enemies}
+        target = min(enemies, key=lambda e: (slack[e], e.x))
+        # Bullets stop at the first enemy in their lane, so attack that one
+        target = self._front(enemies, target)
+        hero = COUNTER_HERO[target.type_id]
+
+        commands = BattleInput(move=self.steer(sim, target.centery))
+        if hero is not None:
+            commands.hero = hero
+            if sim.player.hero_type == hero and self.in_lane(sim, target) and self.can_shoot(sim):
+                commands.shoot = True
+
+        # Freeze when several enemies will get through otherwise
+        doomed = sum(1 for s in slack.values() if s < 0)
+        if doomed >= self.freeze_threshold and not sim.is_frozen and sim.boom_count > 0:
+            commands.freeze = True
+        return commands
+
+
+# Policy: simulation -> commands of the next step
+Policy = Callable[[BattleSimulation], BattleInput]
+
+
+def idle_policy(seed: int) -> Policy:
+    """Create a policy that never presses anything (a baseline for balance).
+
+    Args:
+        seed: Battle seed (unused).
+
+    Returns:
+        Policy: The policy.
+    """
+    return lambda sim: BattleInput()
+
+
+# Built-in policy factories by name; they are called with the battle seed
+POLICIES: dict[str, Callable[[int], Policy]] = {
+    "idle": idle_policy,
+    "random": RandomBot,
+    "greedy": GreedyBot,
+    "oracle": OracleBot,
+}
+
+
+def get_policy(name: str) -> Callable[[int], Policy]:
+    """Resolve a policy name to its factory.
+
+    Args:
+        name: Key of ``POLICIES``, or ``module:attribute`` of a factory.
+
+    Returns:
+        Callable: Factory taking the battle seed and returning a policy.
+
+    Raises:
+        ValueError: If the policy does not exist.
+    """
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, _, attribute = name.partition(":")
+    try:
+        return getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError, ValueError) as err:
+        raise ValueError(f"Unknown policy: {name} (choose from {', '.join(POLICIES)} or module:factory)") from err
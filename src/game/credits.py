@@ -3,6 +3,7 @@ import pygame
 from src.config.settings import SCREEN_WIDTH, GOLD, WHITE
 from src.entities.button import ImageButton
 from src.game.scene import Scene
+from src.utils.dirty import DirtyRenderer
 from src.utils.tools import resource_path
 
 credits_text = [
@@ -52,23 +53,54 @@ class CreditsScene(Scene):
         # Add button to sprite group
         self.all_sprites.add(button_back)
 
+        # Static background cache for dirty-rectangle rendering
+        self.dirty = DirtyRenderer(show_debug=parent.show_dirty)
+
     def update(self):
         """Update scene state"""
         pass
 
+    def is_idle(self) -> bool:
+        """Check whether the scene only changes in response to input.
+
+        Returns:
+            bool: Always True; the credits page is static.
+        """
+        return True
+
     def render(self, screen: pygame.Surface):
         """Render the credits scene to the screen.
 
         Args:
             screen: The pygame surface to render to.
         """
-        screen.blit(self.background, (0, 0))
+        self.render_static(screen)
+        self.all_sprites.draw(screen)
+
+    def render_dirty(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Render only the buttons that changed since the last frame.
+
+        Args:
+            screen: The pygame surface to render to.
+
+        Returns:
+            list: Rectangles of the screen to update.
+        """
+        return self.dirty.render(screen, self.render_static,
+                                 [(sprite.image, sprite.rect) for sprite in self.all_sprites])
+
+    def render_static(self, surface: pygame.Surface):
+        """Draw the background and text.
+
+        Args:
+            surface: The pygame surface to render to.
+        """
+        surface.blit(self.background, (0, 0))
         current_y = 80
         for i, line_surface in enumerate(self.line_surfaces):
             line_x = (SCREEN_WIDTH - line_surface.get_width()) // 2
-            screen.blit(line_surface, (line_x, current_y))
+            surface.blit(line_surface, (line_x, current_y))
             current_y += line_surface.get_height() + (10 if i % 2 == 0 else 30)
-        self.all_sprites.draw(screen)
 
     def process_input(self, event: pygame.event.Event):
         """Process user input events.
@@ -8,6 +8,7 @@ main game loop.
 from enum import Enum
 
 import sys
+import time
 from src.config.settings import *
 from src.game.battle import BattleScene
 from src.game.credits import CreditsScene
@@ -15,6 +16,7 @@ from src.game.game_over import GameOverScene
 from src.game.help import HelpScene
 from src.game.options import OptionsScene
 from src.game.story import StoryScene
+from src.game.stress import StressTest
 from src.game.main_menu import MainMenuScene
 from src.utils.music import play_background_music, stop_background_music, load_background_music
 
@@ -37,18 +39,41 @@ class Game:
     It serves as the central coordinator between different game components.
     """
 
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, seed: int | None = None, record_path: str | None = None,
+                 fps: int = FPS, entity_store: str = "ecs", stress: StressTest | None = None,
+                 policy: str | None = None, dirty_rects: bool = False, show_dirty: bool = False):
         """Initialize the game and set up the initial state.
         
         Args:
-            screen: The pygame surface to render the game on.
+            screen:      The pygame surface to render the game on.
+            seed:        Optional random seed for battles.
+            record_path: Optional path of a replay file to record battles to.
+            fps:         Render frame rate cap (0: uncapped).
+            entity_store: Battle entity storage backend (``ecs`` or ``arrays``).
+            stress:      Optional StressTest; the game then starts in a stressed battle.
+            policy:      Optional bot policy playing the hero in battles (see bots.get_policy).
+            dirty_rects: Whether to update only the changed regions of the display.
+            show_dirty:  Whether to outline the updated regions (dirty-rectangle mode).
         """
         self.screen = screen
         self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.entity_store = entity_store
         self.running = True
         self.last_state = None
+        self.seed = seed
+        self.record_path = record_path
+        self.stress = stress
+        self.policy = policy
+        self.dirty_rects = dirty_rects
+        self.show_dirty = show_dirty
+        # Busy time of the last frame, excluding the frame rate cap wait (seconds)
+        self.frame_time = 0.0
         _intro = get_option("game", "intro")
-        if _intro == "on":
+        if stress:
+            self.game_state = SceneType.BATTLE
+            self.current_scene = BattleScene(self)
+        elif _intro == "on":
             self.game_state = SceneType.INTRO
             self.current_scene = StoryScene(self)
         else:
@@ -59,15 +84,25 @@ class Game:
         load_background_music("bgm.mp3")
         # play_background_music()
 
+    def _change_scene(self, game_state: SceneType, scene_class: type):
+        """Leave the current scene and switch to a new one.
+        
+        Args:
+            game_state:  The new game state.
+            scene_class: Scene class to instantiate for the new state.
+        """
+        self.current_scene.leave()
+        self.last_state = self.game_state
+        self.game_state = game_state
+        self.current_scene = scene_class(self)
+
     def main_menu(self):
         """Switch to the main menu scene.
         
         Transitions the game to the main menu scene and loads the appropriate
         background music for the menu.
         """
-        self.last_state = self.game_state
-        self.game_state = SceneType.MENU
-        self.current_scene = MainMenuScene(self)
+        self._change_scene(SceneType.MENU, MainMenuScene)
         if self.last_state == SceneType.BATTLE or self.last_state == SceneType.GAME_OVER:
             load_background_music("bgm.mp3")
 
@@ -76,18 +111,14 @@ class Game:
         
         Transitions the game to the credits scene to display game credits and information.
         """
-        self.last_state = self.game_state
-        self.game_state = SceneType.CREDITS
-        self.current_scene = CreditsScene(self)
+        self._change_scene(SceneType.CREDITS, CreditsScene)
 
     def options(self):
         """Switch to the options scene.
         
         Transitions the game to the options scene where players can adjust game settings.
         """
-        self.last_state = self.game_state
-        self.game_state = SceneType.OPTIONS
-        self.current_scene = OptionsScene(self)
+        self._change_scene(SceneType.OPTIONS, OptionsScene)
 
     def help(self):
         """Switch to the help scene.
@@ -95,18 +126,14 @@ class Game:
         Transitions the game to the help scene where players can view game instructions
         and information about game mechanics.
         """
-        self.last_state = self.game_state
-        self.game_state = SceneType.HELP
-        self.current_scene = HelpScene(self)
+        self._change_scene(SceneType.HELP, HelpScene)
 
     def battle(self):
         """Switch to the battle scene.
         
         Transitions the game to the main battle scene where gameplay occurs.
         """
-        self.last_state = self.game_state
-        self.game_state = SceneType.BATTLE
-        self.current_scene = BattleScene(self)
+        self._change_scene(SceneType.BATTLE, BattleScene)
 
     def music_toggle(self, state: bool):
         """Toggle background music on or off.
@@ -135,15 +162,14 @@ class Game:
         
         Transitions the game to the game over scene when the player's health reaches zero.
         """
-        self.last_state = self.game_state
-        self.game_state = SceneType.GAME_OVER
-        self.current_scene = GameOverScene(self)
+        self._change_scene(SceneType.GAME_OVER, GameOverScene)
 
     def exit_game(self):
         """Exit the game and close the application.
         
         Properly shuts down the pygame library and exits the application.
         """
+        self.current_scene.leave()
         pygame.quit()
         sys.exit()
 
@@ -151,24 +177,58 @@ class Game:
         """Run the main game loop.
         
         This is the core game loop that handles events, updates game state,
-        renders graphics, and maintains the frame rate. The loop continues
-        until the game is exited.
+        renders graphics, and maintains the frame rate. Game logic advances in
+        fixed ticks of 1 / TICK_RATE seconds, independent of the render frame
+        rate: a slow frame is caught up with several ticks (up to MAX_FRAME_TIME),
+        and between ticks scenes interpolate sprite positions using their
+        ``alpha``. In dirty-rectangle mode only the regions of the display that
+        changed are updated. While the scene is idle the loop waits for input
+        instead of polling, so a menu or a paused battle left alone renders at
+        IDLE_FPS. The loop continues until the game is exited.
         """
+        tick = 1.0 / TICK_RATE
+        accumulator = 0.0
+        previous = time.perf_counter()
         while self.running:
+            # Sleep until an event arrives while nothing animates
+            events = []
+            if self.current_scene.is_idle():
+                event = pygame.event.wait(1000 // IDLE_FPS)
+                if event.type != pygame.NOEVENT:
+                    events.append(event)
+
+            now = time.perf_counter()
+            accumulator += min(now - previous, MAX_FRAME_TIME)
+            previous = now
+
             # Handle events
-            for event in pygame.event.get():
+            full_update = False
+            for event in events + pygame.event.get():
                 self.current_scene.process_input(event)
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.WINDOWEXPOSED:
+                    full_update = True
 
-            # Update game logic
-            self.current_scene.update()
+            # Update game logic in fixed ticks
+            while accumulator >= tick:
+                self.current_scene.update()
+                accumulator -= tick
 
             # Render
-            self.current_scene.render(self.screen)
-            pygame.display.flip()
+            self.current_scene.alpha = accumulator / tick
+            if self.dirty_rects:
+                rects = self.current_scene.render_dirty(self.screen)
+                if rects is None or full_update:
+                    pygame.display.flip()
+                elif rects:
+                    pygame.display.update(rects)
+            else:
+                self.current_scene.render(self.screen)
+                pygame.display.flip()
+            self.frame_time = time.perf_counter() - now
 
             # Clock tick
-            self.clock.tick(FPS)
+            self.clock.tick(self.fps)
 
-        self.exit_game()
\ No newline at end of file
+        self.exit_game()
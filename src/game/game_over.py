@@ -39,6 +39,14 @@ class GameOverScene(Scene):
         """Update scene state"""
         pass
 
+    def is_idle(self) -> bool:
+        """Check whether the scene only changes in response to input.
+
+        Returns:
+            bool: Always True; the game over screen is static.
+        """
+        return True
+
     def render(self, screen: pygame.Surface):
         """Render the game over scene to the screen.
 
@@ -5,7 +5,8 @@ from src.data.chemicals import ENEMIES_SPIRIT, ENEMIES
 from src.entities.button import ImageButton
 from src.entities.tab import TabButton
 from src.game.scene import Scene
-from src.utils.tools import resource_path, load_sprite_sheet
+from src.utils.dirty import DirtyRenderer
+from src.utils.tools import resource_path, load_image, load_sprite_sheet
 
 goal_text = [
     "Commander Fisher Lucas has 3 heroes,",
@@ -64,7 +65,7 @@ class HelpScene(Scene):
         self.background = pygame.image.load(resource_path("assets/images/ui/options_bg.jpg"))  # Background image
         self.control_left = pygame.image.load(resource_path("assets/images/ui/control_left.png"))
         self.control_right = pygame.image.load(resource_path("assets/images/ui/control_right.png"))
-        self.heart = pygame.image.load(resource_path("assets/images/ui/heart3.png"))
+        self.heart = load_image("assets/images/ui/heart3.png")
         self.heros_name = [
             "Base Knight",
             "Acid Hitman",
@@ -125,12 +126,16 @@ class HelpScene(Scene):
         # Add buttons to sprite group
         self.all_sprites.add(button_back, self.button_rule, self.button_role, self.button_control)
 
+        # Static background cache for dirty-rectangle rendering (redrawn when the tab changes)
+        self.dirty = DirtyRenderer(show_debug=parent.show_dirty)
+
         self.button_rule.set_click_status(True)
         self.show_rule()
 
     def show_rule(self):
         """Show game rules"""
         self.state = 0
+        self.dirty.invalidate()
         self.title_surface_left = self.font_title.render("Game Goals", True, DARK_RED)
         self.title_surface_right = self.font_title.render("Game Rules", True, DARK_RED)
         self.line_surfaces_left = []
@@ -147,6 +152,7 @@ class HelpScene(Scene):
     def show_control(self):
         """Show control instructions"""
         self.state = 1
+        self.dirty.invalidate()
         self.title_surface_left = self.font_title.render("Keyboard Control", True, DARK_GREEN)
         self.title_surface_right = self.font_title.render("Mouse Control", True, DARK_GREEN)
         self.button_rule.set_click_status(False)
@@ -155,6 +161,7 @@ class HelpScene(Scene):
     def show_role(self):
         """Show role information"""
         self.state = 2
+        self.dirty.invalidate()
         self.title_surface_left = []
         self.title_surface_right = []
         self.button_rule.set_click_status(False)
@@ -164,6 +171,14 @@ class HelpScene(Scene):
         """Update scene state"""
         pass
 
+    def is_idle(self) -> bool:
+        """Check whether the scene only changes in response to input.
+
+        Returns:
+            bool: Always True; the pages only change when a tab is clicked.
+        """
+        return True
+
     def render_rule(self, screen: pygame.Surface):
         """Render game rules"""
         _x, _y = 150, 160
@@ -235,22 +250,42 @@ class HelpScene(Scene):
         Args:
             screen: The pygame surface to render to.
         """
-        screen.blit(self.background, (0, 0))
+        self.render_static(screen)
+        self.all_sprites.draw(screen)
+
+    def render_dirty(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Render only the buttons that changed since the last frame.
+
+        Args:
+            screen: The pygame surface to render to.
+
+        Returns:
+            list: Rectangles of the screen to update.
+        """
+        return self.dirty.render(screen, self.render_static,
+                                 [(sprite.image, sprite.rect) for sprite in self.all_sprites])
+
+    def render_static(self, surface: pygame.Surface):
+        """Draw the background and text of the current tab.
+
+        Args:
+            surface: The pygame surface to render to.
+        """
+        surface.blit(self.background, (0, 0))
         if self.title_surface_left:
             _x = 150 + (400 - self.title_surface_left.get_width()) / 2
             _y = 100
-            screen.blit(self.title_surface_left, (_x, _y))
+            surface.blit(self.title_surface_left, (_x, _y))
         if self.title_surface_right:
             _x = 650 + (400 - self.title_surface_right.get_width()) / 2
             _y = 100
-            screen.blit(self.title_surface_right, (_x, _y))
+            surface.blit(self.title_surface_right, (_x, _y))
         if self.state == 0:
-            self.render_rule(screen)
+            self.render_rule(surface)
         elif self.state == 1:
-            self.render_control(screen)
+            self.render_control(surface)
         elif self.state == 2:
-            self.render_role(screen)
-        self.all_sprites.draw(screen)
+            self.render_role(surface)
 
     def process_input(self, event: pygame.event.Event):
         """Process user input events for the help scene.
@@ -1,7 +1,8 @@
 """Main menu scene for the Chemination game.
 
 This module contains the MainMenuScene class that displays the game title,
-navigation buttons, and a fire particle effect.
+navigation buttons, and a fire particle effect. In dirty-rectangle mode only
+the region around the fire is redrawn while no button changes.
 """
 
 import pygame
@@ -9,6 +10,7 @@ import pygame
 from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from src.entities.button import ImageButton
 from src.game.scene import Scene
+from src.utils.dirty import DirtyRenderer
 from src.utils.effects import FireEffect
 from src.utils.tools import resource_path
 
@@ -62,6 +64,9 @@ class MainMenuScene(Scene):
         # Add buttons to sprite group
         self.all_sprites.add(button_play, button_options, button_credits, button_help, button_close)
 
+        # Static background cache for dirty-rectangle rendering
+        self.dirty = DirtyRenderer(show_debug=parent.show_dirty)
+
     def update(self):
         """Update the scene state."""
         # Update fire effect
@@ -73,12 +78,39 @@ class MainMenuScene(Scene):
         Args:
             screen: The pygame surface to render to.
         """
-        screen_width, screen_height = screen.get_size()
-        screen.blit(self.background, (0, 0))
+        self.render_static(screen)
+        screen.blits(self._dynamic_items(), False)
+
+    def render_dirty(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Render only the regions that changed since the last frame.
+
+        Args:
+            screen: The pygame surface to render to.
+
+        Returns:
+            list: Rectangles of the screen to update.
+        """
+        return self.dirty.render(screen, self.render_static, self._dynamic_items())
+
+    def render_static(self, surface: pygame.Surface):
+        """Draw the background.
+
+        Args:
+            surface: The pygame surface to render to.
+        """
+        surface.blit(self.background, (0, 0))
+
+    def _dynamic_items(self) -> list[tuple[pygame.Surface, tuple[int, int] | pygame.Rect]]:
+        """Get the fire particles, title and buttons to draw over the background.
+
+        Returns:
+            list: (surface, position) pairs in drawing order.
+        """
         # Draw fire effect first (behind the title)
-        self.fire_effect.draw(screen)
-        screen.blit(self.game_title, ((screen_width - self.game_title.get_width()) // 2, 20))
-        self.all_sprites.draw(screen)
+        items = self.fire_effect.blit_items()
+        items.append((self.game_title, ((SCREEN_WIDTH - self.game_title.get_width()) // 2, 20)))
+        items += [(sprite.image, sprite.rect) for sprite in self.all_sprites]
+        return items
 
     def process_input(self, event: pygame.event.Event):
         """Process user input events.
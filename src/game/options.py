@@ -4,6 +4,7 @@ from src.config.settings import WHITE, get_option, BLACK
 from src.entities.button import ImageButton
 from src.entities.switcher import Switcher
 from src.game.scene import Scene
+from src.utils.dirty import DirtyRenderer
 from src.utils.tools import resource_path
 
 option_text = [
@@ -83,25 +84,56 @@ class OptionsScene(Scene):
         # Add button to sprite group
         self.all_sprites.add(button_back, music_switcher, intro_switcher)
 
+        # Static background cache for dirty-rectangle rendering
+        self.dirty = DirtyRenderer(show_debug=parent.show_dirty)
+
     def update(self):
         pass
 
+    def is_idle(self) -> bool:
+        """Check whether the scene only changes in response to input.
+
+        Returns:
+            bool: Always True; the switches only change when clicked.
+        """
+        return True
+
     def render(self, screen: pygame.Surface):
         """Render the options scene to the screen.
 
         Args:
             screen: The pygame surface to render to.
         """
-        screen.blit(self.background, (0, 0))
+        self.render_static(screen)
+        self.all_sprites.draw(screen)
+
+    def render_dirty(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Render only the buttons that changed since the last frame.
+
+        Args:
+            screen: The pygame surface to render to.
+
+        Returns:
+            list: Rectangles of the screen to update.
+        """
+        return self.dirty.render(screen, self.render_static,
+                                 [(sprite.image, sprite.rect) for sprite in self.all_sprites])
+
+    def render_static(self, surface: pygame.Surface):
+        """Draw the background and text.
+
+        Args:
+            surface: The pygame surface to render to.
+        """
+        surface.blit(self.background, (0, 0))
         _x, _y = 180, 120
         for line_surface in self.words_surfaces:
-            screen.blit(line_surface, (_x, _y))
+            surface.blit(line_surface, (_x, _y))
             _y += line_surface.get_height() + 5
         _x, _y = 830, 160
         for line_surface in self.line_surfaces:
-            screen.blit(line_surface, (_x - line_surface.get_width(), _y))
+            surface.blit(line_surface, (_x - line_surface.get_width(), _y))
             _y += line_surface.get_height() + 70
-        self.all_sprites.draw(screen)
 
     def process_input(self, event: pygame.event.Event):
         """Process user input events for the options scene.
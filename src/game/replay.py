@@ -0,0 +1,170 @@
+"""Battle recording and replay for the Chemination game.
+
+This module contains the BattleRecorder that captures the seed and the per-frame
+player commands of a battle, and the BattleReplay that loads such a recording
+and re-runs the battle bit-for-bit. A per-frame state hash is stored alongside
+the commands so that a replay can detect the frame where it diverges.
+
+Replay file layout (little endian)::
+
+    header:  magic "CHRP", version (u8), seed (u64), frame count (u32)
+    payload: zlib-compressed command bytes (one per frame) followed by
+             one u32 state hash per frame
+"""
+
+import struct
+import time
+import zlib
+from typing import Optional
+
+from src.game.simulation import BattleInput, BattleSimulation, create_simulation
+
+REPLAY_MAGIC = b"CHRP"
+REPLAY_VERSION = 5  # 5: hero animation is hashed as its start tick
+_HEADER = struct.Struct("<4sBQI")
+
+
+def encode_input(commands: BattleInput) -> int:
+    """Pack the commands of one frame into a single byte.
+
+    Bits 0-1 hold the movement, bits 2-3 the selected hero (0 means none),
+    bits 4-5 the hero cycling modulo 3, bit 6 shooting and bit 7 the freeze skill.
+
+    Args:
+        commands: Player commands.
+
+    Returns:
+        int: Encoded commands (0-255).
+    """
+    code = (commands.move % 3)  # 0: none, 1: down, 2: up
+    if commands.hero is not None:
+        code |= (commands.hero + 1) << 2
+    code |= (commands.switch % 3) << 4  # Cycling is applied modulo 3 heroes
+    if commands.shoot:
+        code |= 1 << 6
+    if commands.freeze:
+        code |= 1 << 7
+    return code
+
+
+def decode_input(code: int) -> BattleInput:
+    """Unpack the commands of one frame.
+
+    Args:
+        code: Encoded commands as produced by encode_input.
+
+    Returns:
+        BattleInput: Player commands.
+    """
+    move = code & 3
+    hero = (code >> 2) & 3
+    return BattleInput(
+        move=-1 if move == 2 else move,
+        hero=hero - 1 if hero else None,
+        switch=(code >> 4) & 3,
+        shoot=bool(code & (1 << 6)),
+        freeze=bool(code & (1 << 7)),
+    )
+
+
+class BattleRecorder:
+    """Records the commands and state hashes of a battle, frame by frame."""
+
+    def __init__(self, seed: int):
+        """Initialize an empty recording.
+
+        Args:
+            seed: Random seed of the recorded battle.
+        """
+        self.seed = seed
+        self.inputs = bytearray()
+        self.hashes: list[int] = []
+
+    def record(self, commands: BattleInput, sim: BattleSimulation):
+        """Record a frame after the simulation has been stepped with its commands.
+
+        Args:
+            commands: Commands the frame was stepped with.
+            sim:      The recorded simulation.
+        """
+        self.inputs.append(encode_input(commands))
+        self.hashes.append(sim.state_hash())
+
+    def save(self, path: str):
+        """Write the recording to a replay file.
+
+        Args:
+            path: Destination file path.
+        """
+        payload = bytes(self.inputs) + struct.pack(f"<{len(self.hashes)}I", *self.hashes)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, len(self.inputs)))
+            f.write(zlib.compress(payload, 9))
+
+
+class BattleReplay:
+    """A recorded battle that can be re-run and verified."""
+
+    def __init__(self, seed: int, inputs: bytes, hashes: list[int]):
+        """Initialize a replay from recorded data.
+
+        Args:
+            seed:   Random seed of the battle.
+            inputs: Encoded commands, one byte per frame.
+            hashes: State hash after each frame.
+        """
+        self.seed = seed
+        self.inputs = inputs
+        self.hashes = hashes
+
+    @classmethod
+    def load(cls, path: str) -> "BattleReplay":
+        """Load a replay file.
+
+        Args:
+            path: Replay file path.
+
+        Returns:
+            BattleReplay: The loaded replay.
+
+        Raises:
+            ValueError: If the file is not a supported replay file.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed, frames = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay file: {path}")
+        payload = zlib.decompress(data[_HEADER.size:])
+        inputs = payload[:frames]
+        hashes = list(struct.unpack_from(f"<{frames}I", payload, frames))
+        return cls(seed, inputs, hashes)
+
+    def run(self, verify: bool = True, entity_store: str = "ecs") -> dict:
+        """Re-run the recorded battle.
+
+        Args:
+            verify:       Whether to compare the state hash after every frame.
+            entity_store: Entity storage backend to re-run the battle with.
+
+        Returns:
+            dict: Final battle statistics plus elapsed time, step throughput and
+            ``diverged_at``, the first frame whose state differs from the
+            recording (None if the replay matched).
+        """
+        sim = create_simulation(self.seed, entity_store)
+        commands = [decode_input(code) for code in self.inputs]
+        diverged_at: Optional[int] = None
+
+        start = time.perf_counter()
+        for i, frame_commands in enumerate(commands):
+            sim.step(frame_commands)
+            if verify and diverged_at is None and sim.state_hash() != self.hashes[i]:
+                diverged_at = i + 1
+        elapsed = time.perf_counter() - start
+
+        stats = sim.get_stats()
+        stats["diverged_at"] = diverged_at
+        stats["elapsed"] = elapsed
+        stats["steps_per_second"] = sim.frame / elapsed if elapsed > 0 else 0.0
+        return stats
@@ -19,6 +19,8 @@ class Scene(ABC):
                    the main game object.
         """
         self.parent = parent
+        # Fraction of a tick elapsed since the last update, for render interpolation
+        self.alpha = 1.0
 
     @abstractmethod
     def process_input(self, event: pygame.event.Event):
@@ -51,4 +53,38 @@ class Scene(ABC):
         Args:
             screen: The pygame surface to render to.
         """
+        pass
+
+    def is_idle(self) -> bool:
+        """Check whether the scene only changes in response to input.
+        
+        While the current scene is idle, the game loop sleeps until an event
+        arrives, rendering at most IDLE_FPS frames per second.
+        
+        Returns:
+            bool: True if nothing animates; False by default.
+        """
+        return False
+
+    def render_dirty(self, screen: pygame.Surface) -> list[pygame.Rect] | None:
+        """Render only the parts of the scene that changed since the last frame.
+        
+        Used instead of ``render`` in dirty-rectangle mode. Scenes that support
+        it keep a DirtyRenderer; the default renders the whole scene.
+        
+        Args:
+            screen: The pygame surface to render to.
+        
+        Returns:
+            list: Rectangles of the screen to update, or None if the whole
+            screen has to be updated.
+        """
+        self.render(screen)
+        return None
+
+    def leave(self):
+        """Called once when the game switches away from this scene.
+        
+        Subclasses can override this to release resources or persist state.
+        """
         pass
\ No newline at end of file
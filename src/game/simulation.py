@@ -0,0 +1,513 @@
+"""Battle simulation core for the Chemination game.
+
+This module contains the BattleSimulation class that holds the game rules of a
+battle (spawning, HP/MP, freeze skill, collisions) without any rendering, fonts
+or keyboard polling. BattleScene drives it at 60 ticks per second, while the
+headless runner steps it in bulk, far faster than real time. Enemies and
+bullets are entities of an entity-component system, moved, expired, collided
+and damaged by the systems of ``src.game.systems``.
+
+All randomness comes from a per-battle random generator, so a battle is fully
+determined by its seed and the sequence of BattleInput commands.
+"""
+
+import random
+import time
+import zlib
+from typing import Optional
+
+import pygame
+
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_ESCAPED, ENEMY_KILLED, HERO_ATTACK, RED, GREEN
+from src.data.tables import SPECIES_TABLE
+from src.entities.bullet import BulletType, get_bullet_clip
+from src.entities.enemy import get_species
+from src.entities.hero import Hero
+from src.game.spawner import SpawnDirector
+from src.game.systems import (
+    Animation, Body, Frozen, Health, Lifetime, Projectile, Species, Velocity,
+    CollisionSystem, DamageSystem, LifetimeSystem, MovementSystem
+)
+from src.utils.animation import AnimationClock
+from src.utils.ecs import World
+from src.utils.events import EventBus
+
+# Game events raised by the hero and the systems during a simulation step
+GAME_EVENTS = (HERO_ATTACK, ENEMY_ESCAPED, ENEMY_KILLED)
+GAME_EVENT_NAMES = {HERO_ATTACK: "hero_attack", ENEMY_ESCAPED: "enemy_escaped", ENEMY_KILLED: "enemy_killed"}
+
+
+class BattleInput:
+    """Player commands for a single simulation step."""
+
+    def __init__(self, move: int = 0, hero: Optional[int] = None, switch: int = 0,
+                 shoot: bool = False, freeze: bool = False):
+        """Initialize the commands of one step.
+
+        Args:
+            move:   Vertical movement (-1: up, 1: down, 0: none).
+            hero:   Hero type to switch to (0: base, 1: acid, 2: metal), or None.
+            switch: Cycle heroes (-1: previous, 1: next, 0: none).
+            shoot:  Whether the hero should attack.
+            freeze: Whether to release the freeze skill.
+        """
+        self.move = move
+        self.hero = hero
+        self.switch = switch
+        self.shoot = shoot
+        self.freeze = freeze
+
+
+# Input used when no player commands are given
+NO_INPUT = BattleInput()
+
+
+class BattleSimulation:
+    """Game rules and entity state of a single battle.
+
+    The simulation never draws and never polls input devices; every step takes
+    a BattleInput. Hits that the renderer may want to visualize are reported
+    through the optional ``on_impact`` callback, and ``render_items`` lists
+    what to draw, so the renderer does not depend on the entity store.
+
+    The hero is a sprite. ``world`` holds the enemies and bullets as entities;
+    ``enemies`` and ``bullets`` are its Species and Projectile stores (entity ->
+    component), and ``all_sprites`` only contains the hero.
+    """
+
+    # Entity storage backend (see create_simulation)
+    entity_store = "ecs"
+
+    def __init__(self, seed: Optional[int] = None):
+        """Initialize a new battle.
+
+        Args:
+            seed: Random seed of the battle; a random one is chosen if omitted.
+        """
+        # Per-battle random generator
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+
+        # Player attributes
+        self.hp = 100
+        self.mp = 0
+        self.kill_count = 0
+        self.boom_count = 3
+
+        # Game state
+        self.frame = 0
+        # Animations are played against the battle's frame count
+        self.clock = AnimationClock()
+        self.is_frozen = False
+        self.is_over = False
+        # Debug: ignore HP losses (used by the stress test)
+        self.invulnerable = False
+
+        # Timers
+        self.frozen_timer = 0
+
+        # Spawn schedule (pacing, waves and species weights from the enemy data pack)
+        self.spawner = SpawnDirector(self.rng)
+
+        # Game events raised by the hero and the systems are delivered through the battle's own
+        # event bus, at the end of the step that raised them
+        self.events = EventBus()
+        for event_type in GAME_EVENTS:
+            self.events.subscribe(event_type, self.handle_event)
+
+        # Create player and entities
+        self.player = Hero()
+        self.player.events = self.events
+        self.player.clock = self.clock
+        self.all_sprites = pygame.sprite.Group(self.player)
+        self._create_entities()
+
+        # Callback receiving (x, y, color) for every hit worth visualizing
+        self.on_impact = None
+
+        # Battle statistics
+        self.stats = {
+            "spawned": 0,
+            "shots": 0,
+            "kills": 0,
+            "escaped": 0,
+            "collisions": 0,
+            "hp_lost_escape": 0,
+            "hp_lost_collision": 0,
+        }
+        # Kills and escapes per species name
+        self.species_kills: dict[str, int] = {}
+        self.species_escapes: dict[str, int] = {}
+
+    def _create_entities(self):
+        """Create the entity world, its systems and the enemy and bullet stores."""
+        self.world = world = World()
+        world.add_system(MovementSystem())
+        world.add_system(LifetimeSystem(self))
+        world.add_system(CollisionSystem(self, world))
+        world.add_system(DamageSystem(self))
+
+        self.enemies = world.store(Species)
+        self.bullets = world.store(Projectile)
+
+    def _impact(self, x: int, y: int, color: pygame.Color):
+        """Report a hit to the renderer, if any."""
+        if self.on_impact:
+            self.on_impact(x, y, color)
+
+    def _lose_hp(self, damage: int, source: str):
+        """Deduct player HP and end the battle when it is used up.
+
+        Args:
+            damage: HP lost.
+            source: What caused the loss (``escape`` or ``collision``).
+        """
+        if self.invulnerable:
+            return
+        self.stats[f"hp_lost_{source}"] += damage
+        self.hp -= damage
+        if self.hp <= 0:
+            self.is_over = True
+
+    @property
+    def enemy_spawn_timer(self) -> int:
+        """Frames since the last scheduled spawn."""
+        return self.spawner.timer
+
+    def spawn_enemy(self, species: Optional[int] = None):
+        """Spawn enemy
+
+        Args:
+            species: Species id; drawn from the current wave if omitted.
+        """
+        if species is None:
+            species = self.spawner.sample(self.kill_count)
+        species = get_species(SPECIES_TABLE.names[species])
+        # Position initialization (random position on the right side of the screen)
+        rect = species.frames[0].get_rect()
+        rect.x = SCREEN_WIDTH + self.rng.randint(0, 100)
+        rect.y = self.rng.randint(120, SCREEN_HEIGHT - 120 - rect.height)
+
+        world = self.world
+        entity = world.create()
+        world.add(entity, Body(entity, rect))
+        world.add(entity, Velocity(-species.speed))
+        world.add(entity, Animation(species.clip, self.frame))
+        world.add(entity, Health(species.hp))
+        world.add(entity, Species(species))
+        # Enemies enter from the right, so only the left edge ends their life
+        world.add(entity, Lifetime(exit_right=False))
+        self.stats["spawned"] += 1
+
+    def freeze_enemy(self):
+        """Freeze all enemies"""
+        self.is_frozen = True
+        self.frozen_timer = 0
+        self.boom_count -= 1
+        for entity in self.enemies:
+            self.world.add(entity, Frozen(self.frame))
+
+    def unfreeze_enemy(self):
+        """Unfreeze all enemies"""
+        self.is_frozen = False
+        self.frozen_timer = 0
+        world = self.world
+        animations = world.store(Animation)
+        for entity, frozen in list(world.store(Frozen).items()):
+            # Resume the animation where it stopped
+            animations[entity].start += self.frame - frozen.since
+            world.remove(entity, Frozen)
+
+    def shoot(self, x: int, y: int, direction: int, bullet_type: BulletType):
+        """
+        Fire bullet
+
+        Args:
+            x:           Bullet initial x coordinate
+            y:           Bullet initial y coordinate
+            direction:   Bullet direction
+            bullet_type: Bullet type
+        """
+        clip = get_bullet_clip(bullet_type, direction)
+        rect = clip.frames[0].get_rect()
+        rect.center = (x, y)
+
+        world = self.world
+        entity = world.create()
+        world.add(entity, Body(entity, rect))
+        world.add(entity, Velocity(10 * direction))
+        world.add(entity, Animation(clip, self.frame))
+        world.add(entity, Projectile(bullet_type, direction))
+        world.add(entity, Lifetime())
+        self.stats["shots"] += 1
+
+    def post_event(self, event: pygame.event.Event):
+        """Queue a game event to be handled at the end of the next step.
+
+        Args:
+            event: The game event.
+        """
+        self.events.post(event)
+
+    def handle_event(self, event: pygame.event.Event):
+        """Apply a game event raised by the hero or a system.
+
+        Events that are not game events, and events arriving after the battle
+        has ended, are ignored.
+
+        Args:
+            event: The pygame event to process.
+        """
+        if self.is_over:
+            return
+        if event.type == HERO_ATTACK:  # Player attack
+            self.shoot(**event.dict)
+        elif event.type == ENEMY_ESCAPED:  # Enemy escape
+            self.stats["escaped"] += 1
+            self.species_escapes[event.name] = self.species_escapes.get(event.name, 0) + 1
+            self._lose_hp(event.damage, "escape")
+            self._impact(event.x, event.y, RED)
+
+        elif event.type == ENEMY_KILLED:  # Enemy killed
+            self.kill_count += 1
+            self.stats["kills"] += 1
+            self.species_kills[event.name] = self.species_kills.get(event.name, 0) + 1
+            self.mp += 10
+            self._impact(event.x, event.y, GREEN)
+
+            # Gain one skill point for every 10 enemies killed
+            if self.kill_count % 10 == 0:
+                self.mp = 0
+                self.boom_count += 1
+
+    def apply_input(self, commands: BattleInput):
+        """Apply the discrete player commands of a step.
+
+        Args:
+            commands: Player commands.
+        """
+        player = self.player
+        # Direct hero selection is held-key driven, so it waits for attacks to finish
+        if commands.hero is not None and not player.attacking:
+            player.change_hero(commands.hero)
+        if commands.switch:
+            player.change_hero((player.hero_type + commands.switch) % 3)
+        if commands.freeze and not self.is_frozen and self.boom_count > 0:
+            self.freeze_enemy()
+        if commands.shoot:
+            player.shoot(self.frame)
+
+    def step(self, commands: BattleInput = NO_INPUT):
+        """Advance the battle by one frame.
+
+        Args:
+            commands: Player commands for this frame.
+        """
+        if self.is_over:
+            return
+        self.frame += 1
+        self.clock.tick = self.frame
+
+        self.apply_input(commands)
+
+        # Spawn enemies
+        if not self.is_frozen:
+            # Enemy spawn speed increases with kill count (see SpawnDirector)
+            for species in self.spawner.update(self.kill_count):
+                self.spawn_enemy(species)
+        else:
+            # Update freeze timer
+            self.frozen_timer += 1
+            if self.frozen_timer >= 300:  # Unfreeze after 300 frames
+                self.unfreeze_enemy()
+
+        # Update all entities
+        self.player.update(commands.move)
+        self._update_entities()
+
+        # Apply the attacks, kills and escapes of this step
+        self.events.dispatch()
+
+    def _update_entities(self):
+        """Run the battle's systems (movement, lifetime, collision and damage)"""
+        self.world.update()
+
+    def render_items(self, lag: float = 0.0) -> tuple[list, list]:
+        """Get the surfaces to draw for the hero, enemies and bullets.
+
+        Positions are interpolated between the last two steps. Entities move at
+        a constant velocity, so their previous position is derived from it.
+
+        Args:
+            lag: Fraction of a step the drawn positions lag behind the
+                 simulation (0: current positions).
+
+        Returns:
+            tuple: (surface, position) pairs of the entities and of the
+            enemies' HP overlays, each in drawing order.
+        """
+        sprites = [(sprite.image, interpolated_rect(sprite, lag)) for sprite in self.all_sprites]
+
+        world = self.world
+        velocities, frozen = world.store(Velocity), world.store(Frozen)
+        rects = {}
+        tick = self.frame
+        for entity, body, animation in world.query(Body, Animation):
+            rect = body.rect
+            status = frozen.get(entity)
+            velocity = velocities.get(entity)
+            if velocity and lag and status is None:
+                rect = rect.move(-round(velocity.dx * lag), -round(velocity.dy * lag))
+            # Frozen animations hold the frame they were frozen at
+            sprites.append((animation.image(tick if status is None else status.since), rect))
+            rects[entity] = rect
+        health = world.store(Health)
+        huds = [species.species.hud_item(rects[entity], health[entity].hp) for entity, species in self.enemies.items()]
+        return sprites, huds
+
+    def enemy_states(self) -> list[tuple]:
+        """Get the position, species and health of every enemy.
+
+        Returns:
+            list: (rect, EnemySpecies, health) tuples, in no particular order.
+        """
+        world = self.world
+        bodies, health = world.store(Body), world.store(Health)
+        return [(bodies[entity].rect, species.species, health[entity].hp) for entity, species in self.enemies.items()]
+
+    def state_hash(self) -> int:
+        """Get a checksum of the simulation state.
+
+        Two battles that have the same hash after the same frame are, for all
+        practical purposes, in the same state. Used to detect replay divergence.
+
+        Returns:
+            int: 32-bit checksum.
+        """
+        world = self.world
+        bodies, health, frozen = world.store(Body), world.store(Health), world.store(Frozen)
+        player = self.player
+        state = (
+            self.frame, self.hp, self.mp, self.kill_count, self.boom_count,
+            self.is_frozen, self.spawner.state(), self.frozen_timer,
+            player.hero_type, player.rect.topleft, player.attacking, player.anim_start, player.last_shot,
+            [(s.species.name, bodies[e].rect.topleft, health[e].hp, e in frozen) for e, s in self.enemies.items()],
+            [(p.bullet_type.value, bodies[e].rect.topleft, p.direction) for e, p in self.bullets.items()],
+        )
+        return zlib.crc32(repr(state).encode())
+
+    def get_stats(self) -> dict:
+        """Get a snapshot of the battle state and statistics.
+
+        Returns:
+            dict: Frame count, player attributes, entity counts and statistics.
+        """
+        return {
+            "seed": self.seed,
+            "frame": self.frame,
+            "hp": self.hp,
+            "mp": self.mp,
+            "kill_count": self.kill_count,
+            "boom_count": self.boom_count,
+            "enemies": len(self.enemies),
+            "bullets": len(self.bullets),
+            "is_over": self.is_over,
+            **self.stats,
+        }
+
+    def get_event_stats(self) -> dict:
+        """Get the counters of the battle's event bus.
+
+        Returns:
+            dict: Dispatched events per game event name, total dispatched
+            events and the high-water mark of the event queue.
+        """
+        dispatched = self.events.dispatched
+        return {
+            **{name: dispatched[event_type] for event_type, name in GAME_EVENT_NAMES.items()},
+            "total": sum(dispatched.values()),
+            "queue_high_water": self.events.queue_high_water,
+        }
+
+
+# Available entity storage backends
+ENTITY_STORES = ("ecs", "arrays")
+
+
+def interpolated_rect(sprite: pygame.sprite.Sprite, lag: float) -> pygame.Rect:
+    """Get the rect of a sprite moved back towards its position before the last step.
+
+    Args:
+        sprite: Sprite with a ``previous_topleft``.
+        lag:    Fraction of the last step's movement to undo.
+
+    Returns:
+        pygame.Rect: The sprite's rect (not a copy if ``lag`` is 0).
+    """
+    rect = sprite.rect
+    if not lag:
+        return rect
+    last = sprite.previous_topleft
+    return rect.move(round((last[0] - rect.x) * lag), round((last[1] - rect.y) * lag))
+
+
+def create_simulation(seed: Optional[int] = None, entity_store: str = "ecs") -> BattleSimulation:
+    """Create a battle simulation with the given entity storage backend.
+
+    Args:
+        seed:         Random seed of the battle; a random one is chosen if omitted.
+        entity_store: ``ecs`` for entities updated by systems, ``arrays`` for
+                      NumPy columns (requires NumPy).
+
+    Returns:
+        BattleSimulation: The new simulation.
+    """
+    if entity_store == "arrays":
+        from src.game.array_simulation import ArrayBattleSimulation
+        return ArrayBattleSimulation(seed)
+    return BattleSimulation(seed)
+
+
+def run_headless(frames: int, seed: Optional[int] = None, record: Optional[str] = None,
+                 entity_store: str = "ecs", policy: Optional[str] = None) -> dict:
+    """Run a battle without a window and report its outcome.
+
+    The battle is stepped as fast as possible until it ends or the frame limit
+    is reached.
+
+    Args:
+        frames:       Maximum number of frames to simulate.
+        seed:         Optional random seed.
+        record:       Optional path of a replay file to record the battle to.
+        entity_store: Entity storage backend (see create_simulation).
+        policy:       Optional bot policy name (see bots.get_policy); no input if omitted.
+
+    Returns:
+        dict: Final battle statistics plus elapsed time and step throughput.
+    """
+    from src.game.replay import BattleRecorder
+
+    sim = create_simulation(seed, entity_store)
+    if policy:
+        from src.game.bots import get_policy
+        act = get_policy(policy)(sim.seed)
+    else:
+        act = lambda _: NO_INPUT
+    recorder = BattleRecorder(sim.seed) if record else None
+    start = time.perf_counter()
+    for _ in range(frames):
+        commands = act(sim)
+        sim.step(commands)
+        if recorder:
+            recorder.record(commands, sim)
+        if sim.is_over:
+            break
+    elapsed = time.perf_counter() - start
+    if recorder:
+        recorder.save(record)
+
+    stats = sim.get_stats()
+    stats["events_dispatched"] = sim.get_event_stats()["total"]
+    stats["elapsed"] = elapsed
+    stats["steps_per_second"] = sim.frame / elapsed if elapsed > 0 else 0.0
+    return stats
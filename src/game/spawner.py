@@ -0,0 +1,152 @@
+"""Enemy spawn scheduling for the Chemination game.
+
+This module contains the SpawnDirector that decides when enemies appear and
+which species they are. Spawn intervals, waves, bursts and species weights come
+from the spawning section of the enemy data pack. Everything that does not
+depend on the battle's progress is compiled when the director is created: a
+spawn interval and a wave per kill count, and one alias table per wave, so that
+each spawn costs a list lookup and a single random draw.
+"""
+
+import random
+from collections import deque
+
+from src.data.chemicals import SPAWNING
+from src.data.tables import SPECIES_TABLE, SpeciesTable
+from src.utils.sampling import AliasTable
+
+
+class Wave:
+    """Compiled spawn wave: burst size, burst gap and species sampler."""
+
+    def __init__(self, params: dict, table: SpeciesTable):
+        """Compile a wave from its data pack entry.
+
+        Species weights are looked up by species name first, then by type. An
+        empty weight table makes all species equally likely.
+
+        Args:
+            params: Wave parameters (kills, burst, gap, weights).
+            table:  Compiled species table.
+        """
+        self.kills = params["kills"]
+        self.burst = params["burst"]
+        self.gap = params["gap"]
+        weights = params["weights"]
+        if weights:
+            species_weights = [weights.get(name, weights.get(table.types[table.type_id[i]], 0))
+                               for i, name in enumerate(table.names)]
+        else:
+            species_weights = [1] * len(table)
+        self.sampler = AliasTable(species_weights)
+
+
+class SpawnDirector:
+    """Schedules enemy spawns for a battle.
+
+    The director counts frames while enemies are not frozen. Once the spawn
+    interval for the current kill count has elapsed, it schedules the current
+    wave's burst: the first species spawns right away and the others follow
+    ``gap`` frames apart.
+    """
+
+    def __init__(self, rng: random.Random, spawning: dict = SPAWNING, table: SpeciesTable = SPECIES_TABLE):
+        """Compile the spawn schedule.
+
+        Args:
+            rng:      Random generator of the battle.
+            spawning: Spawning section of the enemy data pack.
+            table:    Compiled species table.
+        """
+        self.rng = rng
+
+        # Spawn interval per kill count, up to the count where it bottoms out
+        interval = spawning["interval"]
+        self.intervals = [max(interval["start"] - interval["per_kill"] * kills, interval["min"])
+                          for kills in range(self._floor_kills(interval) + 1)]
+
+        # Wave per kill count, up to the count where the last wave starts
+        self.waves = [Wave(params, table) for params in spawning["waves"]]
+        self.wave_index = []
+        for i, wave in enumerate(self.waves[1:]):
+            self.wave_index.extend([i] * (wave.kills - len(self.wave_index)))
+        self.wave_index.append(len(self.waves) - 1)
+
+        # Frames since the last scheduled spawn
+        self.timer = 0
+        # Frames counted so far, and the upcoming burst spawns as (frame, species id)
+        self.frame = 0
+        self.queue: deque[tuple[int, int]] = deque()
+
+    @staticmethod
+    def _floor_kills(interval: dict) -> int:
+        """Get the first kill count at which the spawn interval reaches its minimum."""
+        if interval["per_kill"] == 0:
+            return 0
+        return max(-(-(interval["start"] - interval["min"]) // interval["per_kill"]), 0)
+
+    def interval(self, kill_count: int) -> int:
+        """Get the spawn interval at a kill count.
+
+        Args:
+            kill_count: Enemies killed so far.
+
+        Returns:
+            int: Frames between spawns.
+        """
+        intervals = self.intervals
+        return intervals[kill_count] if kill_count < len(intervals) else intervals[-1]
+
+    def wave(self, kill_count: int) -> Wave:
+        """Get the wave active at a kill count.
+
+        Args:
+            kill_count: Enemies killed so far.
+
+        Returns:
+            Wave: The active wave.
+        """
+        index = self.wave_index
+        return self.waves[index[kill_count] if kill_count < len(index) else index[-1]]
+
+    def sample(self, kill_count: int) -> int:
+        """Draw a species from the wave active at a kill count.
+
+        Args:
+            kill_count: Enemies killed so far.
+
+        Returns:
+            int: Species id.
+        """
+        return self.wave(kill_count).sampler.sample(self.rng)
+
+    def update(self, kill_count: int) -> list[int]:
+        """Advance the schedule by one (unfrozen) frame.
+
+        Args:
+            kill_count: Enemies killed so far.
+
+        Returns:
+            list: Ids of the species to spawn this frame, in order.
+        """
+        self.frame += 1
+        self.timer += 1
+        if self.timer >= self.interval(kill_count):
+            self.timer = 0
+            wave = self.wave(kill_count)
+            for i in range(wave.burst):
+                self.queue.append((self.frame + i * wave.gap, wave.sampler.sample(self.rng)))
+
+        spawns = []
+        queue = self.queue
+        while queue and queue[0][0] <= self.frame:
+            spawns.append(queue.popleft()[1])
+        return spawns
+
+    def state(self) -> tuple:
+        """Get the schedule state, for state hashing.
+
+        Returns:
+            tuple: Timer and pending burst spawns, relative to the current frame.
+        """
+        return self.timer, [(frame - self.frame, species) for frame, species in self.queue]
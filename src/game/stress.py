@@ -0,0 +1,204 @@
+"""Battle stress testing for the Chemination game.
+
+This module contains the StressTest class that floods a running battle with
+enemies and bullets at a rate that ramps up every report window, while measuring
+how long frames take. Each window it prints frame time percentiles, the
+update/render split, the draw calls and the entity counts. Once the 95th
+percentile frame time exceeds the frame budget, the flood stops and the load
+that broke the budget is reported.
+"""
+
+import math
+import time
+
+from src.config.settings import TICK_RATE, STRESS_RATE, STRESS_WINDOW
+from src.entities.bullet import BulletType
+from src.game.simulation import BattleInput, BattleSimulation
+
+# Bullet types fired in turn by the autofire
+_AUTOFIRE_TYPES = list(BulletType)
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Get a percentile of a list of values (nearest rank).
+
+    Args:
+        values: Values (need not be sorted).
+        p:      Percentile, from 0 to 100.
+
+    Returns:
+        float: The percentile, or 0 for an empty list.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(max(math.ceil(p / 100 * len(ordered)) - 1, 0), len(ordered) - 1)
+    return ordered[rank]
+
+
+class StressTest:
+    """Ramping enemy/bullet flood with frame time reporting.
+
+    The battle scene calls ``apply`` before every simulation step, and
+    ``record_update``/``record_frame`` with its timings. Frame times are the
+    busy time of a frame (events, updates, rendering and the display flip), so
+    they do not include the wait of a frame rate cap.
+    """
+
+    def __init__(self, rate: float = STRESS_RATE, budget_ms: float = 1000 / 60,
+                 window: float = STRESS_WINDOW, quit_when_done: bool = False):
+        """Initialize a stress test.
+
+        Args:
+            rate:           Enemies (and bullets) per second added in the first
+                            window; every further window adds the same rate again.
+            budget_ms:      Frame budget in milliseconds.
+            window:         Report window length in seconds.
+            quit_when_done: Whether the game should quit once the budget is exceeded.
+        """
+        self.rate = rate
+        self.budget_ms = budget_ms
+        self.window = window
+        self.quit_when_done = quit_when_done
+
+        self.running = True
+        self.current_rate = rate
+        self._spawn_credit = 0.0
+        self._fire_credit = 0.0
+        self._fired = 0
+        # Flooded simulation and whether its hero was invulnerable before, restored on stop
+        self._sim: BattleSimulation | None = None
+        self._was_invulnerable = False
+
+        # Current report window
+        self._window_start = time.perf_counter()
+        self._frame_times: list[float] = []
+        self._update_time = 0.0
+        self._render_time = 0.0
+        self._draw_calls = 0
+        self._blits = 0
+
+        # Reports of all windows, and the final one that exceeded the budget
+        self.reports: list[dict] = []
+        self.result: dict | None = None
+
+    def apply(self, sim: BattleSimulation, commands: BattleInput):
+        """Add this tick's enemies and bullets, and hold the attack key.
+
+        Args:
+            sim:      Simulation about to be stepped.
+            commands: Commands of the step.
+        """
+        if not self.running:
+            return
+        if self._sim is not sim:
+            self._sim, self._was_invulnerable = sim, sim.invulnerable
+        sim.invulnerable = True
+        commands.shoot = True
+
+        per_tick = self.current_rate / TICK_RATE
+        self._spawn_credit += per_tick
+        while self._spawn_credit >= 1:
+            sim.spawn_enemy()
+            self._spawn_credit -= 1
+
+        # Bullets fan out over the battlefield from the hero's column
+        self._fire_credit += per_tick
+        player = sim.player.rect
+        while self._fire_credit >= 1:
+            y = 120 + (self._fired * 37) % 430
+            sim.shoot(player.centerx, y, 1, _AUTOFIRE_TYPES[self._fired % len(_AUTOFIRE_TYPES)])
+            self._fired += 1
+            self._fire_credit -= 1
+
+    def record_update(self, seconds: float):
+        """Add the duration of a scene update.
+
+        Args:
+            seconds: Update duration.
+        """
+        self._update_time += seconds
+
+    def record_frame(self, frame_seconds: float, render_seconds: float, sim: BattleSimulation,
+                     draw_calls: int = 0, blits: int = 0) -> dict | None:
+        """Add a rendered frame and close the report window when it is over.
+
+        Args:
+            frame_seconds:  Busy time of the previous frame.
+            render_seconds: Render duration of this frame.
+            sim:            The stressed simulation.
+            draw_calls:     Batched draw calls of this frame.
+            blits:          Surfaces drawn by those calls.
+
+        Returns:
+            dict: The window's report if a window was closed, else None.
+        """
+        if not self.running:
+            return None
+        if frame_seconds > 0:
+            self._frame_times.append(frame_seconds * 1000)
+        self._render_time += render_seconds
+        self._draw_calls += draw_calls
+        self._blits += blits
+        now = time.perf_counter()
+        elapsed = now - self._window_start
+        if elapsed < self.window or not self._frame_times:
+            return None
+
+        frames = len(self._frame_times)
+        report = {
+            "rate": self.current_rate,
+            "fps": frames / elapsed,
+            "p50_ms": percentile(self._frame_times, 50),
+            "p95_ms": percentile(self._frame_times, 95),
+            "p99_ms": percentile(self._frame_times, 99),
+            "update_ms": self._update_time * 1000 / frames,
+            "render_ms": self._render_time * 1000 / frames,
+            "draw_calls": self._draw_calls / frames,
+            "blits": self._blits / frames,
+            "enemies": len(sim.enemies),
+            "bullets": len(sim.bullets),
+        }
+        self.reports.append(report)
+        print(format_report(report))
+
+        if report["p95_ms"] > self.budget_ms:
+            self.stop(report)
+        else:
+            self.current_rate += self.rate
+        self._window_start = now
+        self._frame_times = []
+        self._update_time = self._render_time = 0.0
+        self._draw_calls = self._blits = 0
+        return report
+
+    def stop(self, report: dict | None = None):
+        """Stop flooding and give the hero back its vulnerability.
+
+        Args:
+            report: Report of the window that exceeded the frame budget, if any.
+        """
+        self.running = False
+        self.result = report
+        if self._sim is not None:
+            self._sim.invulnerable = self._was_invulnerable
+        if report:
+            print(f"Frame budget of {self.budget_ms:.1f} ms exceeded (p95 {report['p95_ms']:.1f} ms) "
+                  f"with {report['enemies']} enemies and {report['bullets']} bullets "
+                  f"at {report['rate']:.0f} spawns/s")
+
+
+def format_report(report: dict) -> str:
+    """Format a stress test window report as one line.
+
+    Args:
+        report: Window report, as produced by StressTest.record_frame.
+
+    Returns:
+        str: Report line.
+    """
+    return (f"rate {report['rate']:6.0f}/s  fps {report['fps']:6.1f}  "
+            f"frame p50/p95/p99 {report['p50_ms']:5.1f}/{report['p95_ms']:5.1f}/{report['p99_ms']:5.1f} ms  "
+            f"update {report['update_ms']:5.1f} ms  render {report['render_ms']:5.1f} ms  "
+            f"draws {report['draw_calls']:3.1f}/{report['blits']:6.0f} blits  "
+            f"enemies {report['enemies']:5d}  bullets {report['bullets']:5d}")
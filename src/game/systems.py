@@ -0,0 +1,292 @@
+"""Components and systems of the battle engine for the Chemination game.
+
+BattleSimulation keeps its enemies and bullets as ECS entities (see
+``src.utils.ecs``) made of the components below, instead of sprites with their
+own ``update`` methods. Each tick is driven by systems, each iterating only the
+entities that have its components:
+
+- MovementSystem: moves bodies by their velocity.
+- LifetimeSystem: removes entities that leave the battlefield or run out of
+  time; enemies leaving on the left escape.
+- CollisionSystem: hero contacts, and bullet hits queued on the enemies.
+- DamageSystem: applies queued hits and kills enemies.
+
+Animations are not advanced by a system: the Animation component holds a
+shared clip and the frame it started at, and the renderer computes the frame
+to show. Freezing is a status effect: the Frozen component, which the movement
+and lifetime systems skip and which holds the frozen animation.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+import pygame
+
+from src.config.settings import SCREEN_WIDTH, ENEMY_ESCAPED, ENEMY_KILLED, RED
+from src.entities.bullet import BulletType
+from src.entities.enemy import DAMAGE_ROWS, EnemySpecies
+from src.utils.animation import AnimationClip
+from src.utils.ecs import System, World
+from src.utils.spatial import SpatialHash
+
+if TYPE_CHECKING:
+    from src.game.simulation import BattleSimulation
+
+
+# Components
+
+class Body:
+    """Position and collision box."""
+    __slots__ = ("entity", "rect")
+
+    def __init__(self, entity: int, rect: pygame.Rect):
+        self.entity = entity
+        self.rect = rect
+
+
+class Velocity:
+    """Movement in pixels per tick."""
+    __slots__ = ("dx", "dy")
+
+    def __init__(self, dx: int = 0, dy: int = 0):
+        self.dx = dx
+        self.dy = dy
+
+
+class Animation:
+    """Shared animation clip and the tick it started at."""
+    __slots__ = ("clip", "start")
+
+    def __init__(self, clip: AnimationClip, start: int):
+        self.clip = clip
+        self.start = start
+
+    def image(self, tick: int) -> pygame.Surface:
+        """Get the frame shown at a tick."""
+        return self.clip.frame(tick - self.start)
+
+
+class Health:
+    """Remaining health points."""
+    __slots__ = ("hp",)
+
+    def __init__(self, hp: int):
+        self.hp = hp
+
+
+class Species:
+    """Enemy species (shared EnemySpecies flyweight); marks an entity as an enemy."""
+    __slots__ = ("species",)
+
+    def __init__(self, species: EnemySpecies):
+        self.species = species
+
+
+class Projectile:
+    """Bullet type and flight direction; marks an entity as a bullet."""
+    __slots__ = ("bullet_type", "direction")
+
+    def __init__(self, bullet_type: BulletType, direction: int):
+        self.bullet_type = bullet_type
+        self.direction = direction
+
+
+class Lifetime:
+    """When an entity is removed: after a number of ticks, or when it leaves the screen."""
+    __slots__ = ("frames", "exit_left", "exit_right")
+
+    def __init__(self, frames: Optional[int] = None, exit_left: bool = True, exit_right: bool = True):
+        """Initialize the lifetime.
+
+        Args:
+            frames:     Ticks left to live, or None for no limit.
+            exit_left:  Whether the entity is removed once past the left edge.
+            exit_right: Whether the entity is removed once past the right edge.
+        """
+        self.frames = frames
+        self.exit_left = exit_left
+        self.exit_right = exit_right
+
+
+class Frozen:
+    """Status effect: the entity neither moves, animates nor expires."""
+    __slots__ = ("since",)
+
+    def __init__(self, since: int):
+        self.since = since
+
+
+class Hits:
+    """Bullet hits taken this tick, in order, waiting for the damage system."""
+    __slots__ = ("bullet_types",)
+
+    def __init__(self):
+        self.bullet_types: list[BulletType] = []
+
+
+# Systems
+
+class MovementSystem(System):
+    """Moves every unfrozen body by its velocity."""
+
+    def update(self, world: World):
+        bodies = world.store(Body)
+        frozen = world.store(Frozen)
+        for entity, velocity in world.store(Velocity).items():
+            if frozen and entity in frozen:
+                continue
+            rect = bodies[entity].rect
+            rect.x += velocity.dx
+            if velocity.dy:
+                rect.y += velocity.dy
+
+
+class LifetimeSystem(System):
+    """Removes expired entities and entities that left the screen.
+
+    An enemy (an entity with Species) that leaves the screen escapes: the
+    battle receives an ENEMY_ESCAPED event carrying its remaining health.
+    """
+
+    def __init__(self, sim: "BattleSimulation"):
+        """Initialize the system.
+
+        Args:
+            sim: The battle receiving escape events.
+        """
+        self.sim = sim
+
+    def update(self, world: World):
+        bodies = world.store(Body)
+        frozen = world.store(Frozen)
+        expired = []
+        for entity, lifetime in world.store(Lifetime).items():
+            if frozen and entity in frozen:
+                continue
+            if lifetime.frames is not None:
+                lifetime.frames -= 1
+                if lifetime.frames <= 0:
+                    expired.append(entity)
+                    continue
+            rect = bodies[entity].rect
+            if (lifetime.exit_left and rect.right < 0) or (lifetime.exit_right and rect.left > SCREEN_WIDTH):
+                expired.append(entity)
+
+        species = world.store(Species)
+        for entity in expired:
+            if entity in species:
+                rect = bodies[entity].rect
+                self.sim.events.post(pygame.event.Event(ENEMY_ESCAPED, {
+                    'enemy': entity,
+                    'name': species[entity].species.name,
+                    'x': 0,
+                    'y': rect.centery,
+                    'damage': world.get(entity, Health).hp
+                }))
+            world.destroy(entity)
+
+
+class CollisionSystem(System):
+    """Resolves hero contacts and queues bullet hits on enemies.
+
+    Enemy bodies are kept in a spatial hash, so each query only tests the
+    enemies in the cells it covers. An enemy touching the hero takes its
+    remaining health from the hero and is removed. A bullet touching enemies is
+    removed and adds a hit to each of them (see DamageSystem).
+    """
+
+    def __init__(self, sim: "BattleSimulation", world: World):
+        """Initialize the system.
+
+        Args:
+            sim:   The battle whose hero collides.
+            world: The world; destroyed enemies are dropped from the index.
+        """
+        self.sim = sim
+        self.index = SpatialHash()
+        world.on_destroy.append(self._forget)
+        self._bodies = world.store(Body)
+
+    def _forget(self, entity: int):
+        """Drop a destroyed entity from the index."""
+        body = self._bodies.get(entity)
+        if body is not None:
+            self.index.remove(body)
+
+    def update(self, world: World):
+        sim = self.sim
+        bodies = self._bodies
+        index = self.index
+        # Index new enemies and re-index those that may have moved
+        frozen = world.store(Frozen)
+        indexed, move, insert = index.spans, index.move, index.insert
+        for entity in world.store(Species):
+            body = bodies[entity]
+            if body not in indexed:
+                insert(body)
+            elif not (frozen and entity in frozen):
+                move(body)
+
+        # Enemies touching the hero
+        for body in index.query(sim.player.rect):
+            sim.stats["collisions"] += 1
+            sim._lose_hp(world.get(body.entity, Health).hp, "collision")
+            sim._impact(body.rect.x, body.rect.centery, RED)
+            world.destroy(body.entity)
+
+        # Bullets touching enemies (all hits are found before any damage is applied)
+        query = index.query
+        hits = [(entity, projectile, found) for entity, projectile in world.store(Projectile).items()
+                if (found := query(bodies[entity].rect))]
+        hit_store = world.store(Hits)
+        for entity, projectile, found in hits:
+            world.destroy(entity)
+            for body in found:
+                enemy_hits = hit_store.get(body.entity)
+                if enemy_hits is None:
+                    enemy_hits = Hits()
+                    world.add(body.entity, enemy_hits)
+                enemy_hits.bullet_types.append(projectile.bullet_type)
+
+
+class DamageSystem(System):
+    """Applies queued bullet hits, killing enemies whose health runs out.
+
+    Each hit takes the damage matrix entry of its bullet type against the
+    enemy's type; a killed enemy takes no further hits.
+    """
+
+    def __init__(self, sim: "BattleSimulation"):
+        """Initialize the system.
+
+        Args:
+            sim: The battle receiving kill events.
+        """
+        self.sim = sim
+
+    def update(self, world: World):
+        health_store = world.store(Health)
+        species_store = world.store(Species)
+        bodies = world.store(Body)
+        for entity, hits in list(world.store(Hits).items()):
+            health = health_store[entity]
+            type_id = species_store[entity].species.type_id
+            killed = False
+            for bullet_type in hits.bullet_types:
+                damage = DAMAGE_ROWS[bullet_type][type_id]
+                if damage:
+                    health.hp -= damage
+                    if health.hp <= 0:
+                        killed = True
+                        break
+            if not killed:
+                world.remove(entity, Hits)
+                continue
+            rect = bodies[entity].rect
+            self.sim.events.post(pygame.event.Event(ENEMY_KILLED, {
+                'enemy': entity,
+                'name': species_store[entity].species.name,
+                'x': rect.x,
+                'y': rect.centery,
+                'damage': 0
+            }))
+            world.destroy(entity)
@@ -0,0 +1,462 @@
+"""Vectorized battle environments for the Chemination game.
+
+This module contains the VectorBattleEnv class that runs N battles in lockstep
+for training and evaluating agents, with a Gym-style ``reset``/``step`` API.
+The state of all battles lives in NumPy arrays: one entry per battle for the
+hero and the counters, and fixed-capacity ``(N, slots)`` tables with an alive
+mask for enemies and bullets. Every rule of a step (spawning, movement,
+collisions, damage, HP/MP and the freeze skill) runs as a handful of array
+operations over all battles at once, so the cost of a step grows far slower
+than N.
+
+The rules follow BattleSimulation and use the same species table, damage
+matrix and spawn schedule, but the battles draw from one NumPy generator
+rather than a ``random.Random`` per battle, so they do not reproduce the
+sprite simulation's battles for a given seed. Spawns beyond the enemy capacity
+of a battle are dropped.
+
+Requires NumPy.
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.data.tables import SPECIES_TABLE, DAMAGE_MATRIX
+from src.entities.bullet import get_bullet_frames
+from src.entities.enemy import get_species
+from src.entities.hero import Hero, BULLET_TYPES
+from src.game.spawner import SpawnDirector
+
+# Action columns: movement (-1, 0, 1), hero type (-1: keep, 0-2), shoot (0/1), freeze (0/1)
+ACTION_MOVE, ACTION_HERO, ACTION_SHOOT, ACTION_FREEZE = range(4)
+ACTION_SIZE = 4
+
+# Enemies included in an observation, nearest to the hero's column first
+OBSERVED_ENEMIES = 8
+# Observation layout: hero features, then per observed enemy
+# (present, x distance, y offset, health fraction, speed, type one-hot)
+HERO_FEATURES = 11
+ENEMY_FEATURES = 5 + len(SPECIES_TABLE.types)
+OBSERVATION_SIZE = HERO_FEATURES + OBSERVED_ENEMIES * ENEMY_FEATURES
+
+# Battlefield limits of the hero and the enemies
+FIELD_TOP = 120
+FIELD_BOTTOM = SCREEN_HEIGHT - 120
+
+BULLET_SPEED = 10
+FREEZE_FRAMES = 300
+
+
+class VectorBattleEnv:
+    """N battles advanced in lockstep, with automatic reset.
+
+    ``step`` takes an ``(N, ACTION_SIZE)`` integer array of actions and
+    returns observations, rewards, done flags and an info dictionary of
+    arrays. A battle is done when the hero runs out of HP or, if
+    ``max_frames`` is set, when the frame limit is reached. Done battles are
+    reset within the same step: their returned observation is the first one
+    of the new battle, and ``info`` holds the final frame count, kills and
+    whether the battle was cut off by the frame limit.
+    """
+
+    def __init__(self, num_envs: int, seed: Optional[int] = None, max_frames: Optional[int] = None,
+                 max_enemies: int = 32, max_bullets: int = 8, kill_reward: float = 1.0, hp_penalty: float = 0.1):
+        """Initialize the environments.
+
+        Args:
+            num_envs:    Number of battles.
+            seed:        Seed of the environments' random generator.
+            max_frames:  Frame limit of a battle, or None for no limit.
+            max_enemies: Enemy slots per battle.
+            max_bullets: Bullet slots per battle.
+            kill_reward: Reward per enemy killed.
+            hp_penalty:  Negative reward per HP lost.
+        """
+        self.num_envs = num_envs
+        self.max_frames = max_frames
+        self.kill_reward = kill_reward
+        self.hp_penalty = hp_penalty
+        self.rng = np.random.default_rng(seed)
+
+        # Species columns and sizes, indexed by species id
+        names = SPECIES_TABLE.names
+        species = [get_species(name) for name in names]
+        self.species_type = np.array(SPECIES_TABLE.type_id, np.intp)
+        self.species_hp = np.array(SPECIES_TABLE.hp, np.int32)
+        self.species_speed = np.array(SPECIES_TABLE.speed, np.int32)
+        self.species_w = np.array([s.width for s in species], np.int32)
+        self.species_h = np.array([s.height for s in species], np.int32)
+        # damage[hero type, species]: health points a hit takes
+        hero_damage = np.array([DAMAGE_MATRIX.rows[DAMAGE_MATRIX.bullet_ids[b.value]] for b in BULLET_TYPES],
+                               np.int32)
+        self.damage = hero_damage[:, self.species_type]
+
+        # Hero and bullet sizes per hero type, and the hero's timings
+        hero = Hero()
+        self.hero_w = np.array([a.animations["right"][0].get_width() for a in hero.avatars], np.int32)
+        self.hero_h = np.array([a.animations["right"][0].get_height() for a in hero.avatars], np.int32)
+        self.hero_x = hero.rect.centerx
+        self.hero_speed = hero.speed
+        self.shoot_delay = hero.shoot_delay
+        # Frames from the start of an attack until its bullet is fired
+        self.attack_frames = hero.avatars[0].attack_clip.duration
+        bullet_sizes = [get_bullet_frames(b)[1][0].get_size() for b in BULLET_TYPES]
+        self.bullet_w = np.array([w for w, _ in bullet_sizes], np.int32)
+        self.bullet_h = np.array([h for _, h in bullet_sizes], np.int32)
+
+        # Spawn schedule, compiled once and indexed by kill count
+        director = SpawnDirector(None)
+        self.intervals = np.array(director.intervals, np.int32)
+        self.wave_index = np.array(director.wave_index, np.intp)
+        self.wave_burst = np.array([w.burst for w in director.waves], np.int32)
+        self.wave_gap = np.array([w.gap for w in director.waves], np.int32)
+        # Alias tables of all waves, as (wave, bucket) arrays
+        self.wave_prob = np.array([w.sampler.prob for w in director.waves])
+        self.wave_alias = np.array([w.sampler.alias for w in director.waves], np.intp)
+
+        n = num_envs
+        # Battle state, one entry per battle
+        self.frame = np.zeros(n, np.int32)
+        self.hp = np.zeros(n, np.int32)
+        self.mp = np.zeros(n, np.int32)
+        self.kill_count = np.zeros(n, np.int32)
+        self.boom_count = np.zeros(n, np.int32)
+        self.is_frozen = np.zeros(n, bool)
+        self.frozen_timer = np.zeros(n, np.int32)
+        self.spawn_timer = np.zeros(n, np.int32)
+        self.burst_left = np.zeros(n, np.int32)
+        self.burst_wait = np.zeros(n, np.int32)
+        # Hero: type, vertical center, attack progress (frames, -1: idle) and last shot frame
+        self.hero_type = np.zeros(n, np.intp)
+        self.hero_y = np.zeros(n, np.int32)
+        self.attack = np.zeros(n, np.int32)
+        self.last_shot = np.zeros(n, np.int32)
+
+        # Entity tables: (battle, slot) columns and alive masks
+        self.enemy_alive = np.zeros((n, max_enemies), bool)
+        self.enemy_x = np.zeros((n, max_enemies), np.int32)
+        self.enemy_y = np.zeros((n, max_enemies), np.int32)
+        self.enemy_species = np.zeros((n, max_enemies), np.intp)
+        self.enemy_health = np.zeros((n, max_enemies), np.int32)
+        # Per-slot copies of the species' size and speed, so steps need no lookups
+        self.enemy_w = np.zeros((n, max_enemies), np.int32)
+        self.enemy_h = np.zeros((n, max_enemies), np.int32)
+        self.enemy_speed = np.zeros((n, max_enemies), np.int32)
+        self.bullet_alive = np.zeros((n, max_bullets), bool)
+        self.bullet_x = np.zeros((n, max_bullets), np.int32)
+        self.bullet_y = np.zeros((n, max_bullets), np.int32)
+        self.bullet_type = np.zeros((n, max_bullets), np.intp)
+
+        # Observation buffer, reused by every step
+        self._obs = np.zeros((n, OBSERVATION_SIZE), np.float32)
+        self._rows = np.arange(n)
+
+    def reset(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Start new battles.
+
+        Args:
+            mask: Boolean array selecting the battles to reset; all if omitted.
+
+        Returns:
+            np.ndarray: Observations of all battles, ``(N, OBSERVATION_SIZE)``.
+        """
+        if mask is None:
+            mask = np.ones(self.num_envs, bool)
+        self.frame[mask] = 0
+        self.hp[mask] = 100
+        self.mp[mask] = 0
+        self.kill_count[mask] = 0
+        self.boom_count[mask] = 3
+        self.is_frozen[mask] = False
+        self.frozen_timer[mask] = 0
+        self.spawn_timer[mask] = 0
+        self.burst_left[mask] = 0
+        self.burst_wait[mask] = 0
+        self.hero_type[mask] = 0
+        self.hero_y[mask] = SCREEN_HEIGHT // 2
+        self.attack[mask] = -1
+        self.last_shot[mask] = -self.shoot_delay
+        self.enemy_alive[mask] = False
+        self.bullet_alive[mask] = False
+        return self._observe()
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
+        """Advance all battles by one frame.
+
+        Args:
+            actions: ``(N, ACTION_SIZE)`` integer array (see the ACTION_* columns).
+
+        Returns:
+            tuple: Observations ``(N, OBSERVATION_SIZE)``, rewards ``(N,)``,
+            done flags ``(N,)`` and a dict of per-battle arrays: ``frames``,
+            ``kills`` and ``truncated`` (final values for done battles).
+        """
+        actions = np.asarray(actions)
+        self.frame += 1
+        hp_before = self.hp.copy()
+        kills_before = self.kill_count.copy()
+
+        self._apply_actions(actions)
+        self._update_spawns()
+        self._update_hero(actions[:, ACTION_MOVE])
+        fired = self._update_entities()
+        self._resolve_collisions()
+        self._fire(fired)
+
+        rewards = (self.kill_reward * (self.kill_count - kills_before)
+                   - self.hp_penalty * (hp_before - self.hp)).astype(np.float32)
+        lost = self.hp <= 0
+        truncated = ~lost & (self.frame >= self.max_frames) if self.max_frames else np.zeros(self.num_envs, bool)
+        dones = lost | truncated
+        info = {"frames": self.frame.copy(), "kills": self.kill_count.copy(), "truncated": truncated}
+        if dones.any():
+            return self.reset(dones), rewards, dones, info
+        return self._observe(), rewards, dones, info
+
+    def _apply_actions(self, actions: np.ndarray):
+        """Apply hero changes, the freeze skill and attacks."""
+        idle = self.attack < 0
+        # Direct hero selection waits for attacks to finish, like in BattleSimulation
+        change = (actions[:, ACTION_HERO] >= 0) & idle
+        self.hero_type[change] = actions[change, ACTION_HERO]
+
+        freeze = (actions[:, ACTION_FREEZE] != 0) & ~self.is_frozen & (self.boom_count > 0)
+        self.is_frozen |= freeze
+        self.frozen_timer[freeze] = 0
+        self.boom_count -= freeze
+
+        shoot = (actions[:, ACTION_SHOOT] != 0) & (self.frame - self.last_shot > self.shoot_delay)
+        self.last_shot[shoot] = self.frame[shoot]
+        self.attack[shoot] = 0
+
+    def _update_spawns(self):
+        """Advance the spawn schedule of unfrozen battles and the freeze timer of frozen ones."""
+        frozen = self.is_frozen.copy()
+        self.frozen_timer[frozen] += 1
+        thaw = frozen & (self.frozen_timer >= FREEZE_FRAMES)
+        self.is_frozen[thaw] = False
+        self.frozen_timer[thaw] = 0
+
+        active = ~frozen
+        kills = np.minimum(self.kill_count, len(self.intervals) - 1)
+        wave = self.wave_index[np.minimum(self.kill_count, len(self.wave_index) - 1)]
+        self.spawn_timer[active] += 1
+        due = active & (self.spawn_timer >= self.intervals[kills])
+        self.spawn_timer[due] = 0
+        self.burst_left[due] += self.wave_burst[wave[due]]
+
+        # Bursts spawn one enemy every `gap` frames; a gap of 0 spawns them together
+        while True:
+            ready = active & (self.burst_left > 0) & (self.burst_wait <= 0)
+            if not ready.any():
+                break
+            rows = np.flatnonzero(ready)
+            self._spawn(rows, wave[rows])
+            self.burst_left[rows] -= 1
+            self.burst_wait[rows] = self.wave_gap[wave[rows]]
+        self.burst_wait[active & (self.burst_wait > 0)] -= 1
+
+    def _spawn(self, rows: np.ndarray, waves: np.ndarray):
+        """Spawn one enemy, drawn from its battle's wave, in each of the given battles."""
+        # Alias sampling for all battles at once
+        buckets = self.wave_prob.shape[1]
+        u = self.rng.random(len(rows)) * buckets
+        bucket = u.astype(np.intp)
+        species = np.where(u - bucket < self.wave_prob[waves, bucket], bucket, self.wave_alias[waves, bucket])
+
+        # First free slot per battle; full battles drop the spawn
+        slot = np.argmin(self.enemy_alive[rows], axis=1)
+        free = ~self.enemy_alive[rows, slot]
+        rows, slot, species = rows[free], slot[free], species[free]
+        h = self.species_h[species]
+        self.enemy_alive[rows, slot] = True
+        self.enemy_species[rows, slot] = species
+        self.enemy_health[rows, slot] = self.species_hp[species]
+        self.enemy_w[rows, slot] = self.species_w[species]
+        self.enemy_h[rows, slot] = h
+        self.enemy_speed[rows, slot] = self.species_speed[species]
+        self.enemy_x[rows, slot] = SCREEN_WIDTH + self.rng.integers(0, 101, len(rows))
+        self.enemy_y[rows, slot] = self.rng.integers(FIELD_TOP, FIELD_BOTTOM - h + 1)
+
+    def _update_hero(self, move: np.ndarray):
+        """Move idle heroes within the battlefield and advance attacks."""
+        idle = self.attack < 0
+        half = self.hero_h[self.hero_type] // 2
+        y = self.hero_y + np.where(idle, np.sign(move), 0) * self.hero_speed
+        self.hero_y = np.clip(y, FIELD_TOP + half, FIELD_BOTTOM - self.hero_h[self.hero_type] + half)
+        self.attack[~idle] += 1
+
+    def _update_entities(self) -> np.ndarray:
+        """Move enemies and bullets, and take HP for escaped enemies.
+
+        Returns:
+            np.ndarray: Battles whose hero finished an attack this step.
+        """
+        moving = self.enemy_alive & ~self.is_frozen[:, None]
+        self.enemy_x -= np.where(moving, self.enemy_speed, 0)
+        escaped = self.enemy_alive & (self.enemy_x + self.enemy_w < 0)
+        self.hp -= np.where(escaped, self.enemy_health, 0).sum(axis=1, dtype=np.int32)
+        self.enemy_alive &= ~escaped
+
+        self.bullet_x += BULLET_SPEED
+        self.bullet_alive &= self.bullet_x <= SCREEN_WIDTH
+
+        fired = self.attack >= self.attack_frames
+        self.attack[fired] = -1
+        return fired
+
+    def _resolve_collisions(self):
+        """Resolve hero/enemy and bullet/enemy collisions of all battles."""
+        alive = self.enemy_alive
+        x, y = self.enemy_x, self.enemy_y
+        right, bottom = x + self.enemy_w, y + self.enemy_h
+
+        # Hero/enemy collisions take the enemy's remaining health from the hero
+        hero_w, hero_h = self.hero_w[self.hero_type], self.hero_h[self.hero_type]
+        left = self.hero_x - hero_w // 2
+        top = self.hero_y - hero_h // 2
+        hit = (alive & (x < (left + hero_w)[:, None]) & (right > left[:, None])
+               & (y < (top + hero_h)[:, None]) & (bottom > top[:, None]))
+        self.hp -= np.where(hit, self.enemy_health, 0).sum(axis=1, dtype=np.int32)
+        alive &= ~hit
+
+        # Live bullets, grouped by battle, each tested against the enemies of its battle
+        rows, slots = np.nonzero(self.bullet_alive)
+        if not len(rows):
+            return
+        bullet_type = self.bullet_type[rows, slots]
+        bx, by = self.bullet_x[rows, slots], self.bullet_y[rows, slots]
+        bw, bh = self.bullet_w[bullet_type], self.bullet_h[bullet_type]
+        overlap = (alive[rows] & (bx[:, None] < right[rows]) & ((bx + bw)[:, None] > x[rows])
+                   & (by[:, None] < bottom[rows]) & ((by + bh)[:, None] > y[rows]))
+        spent = overlap.any(axis=1)
+        if not spent.any():
+            return
+        # Every bullet touching an enemy is spent; every hit takes its damage matrix entry
+        self.bullet_alive[rows[spent], slots[spent]] = False
+        hit_damage = np.where(overlap, self.damage[bullet_type[:, None], self.enemy_species[rows]], 0)
+        battles, first = np.unique(rows, return_index=True)
+        total = np.zeros_like(self.enemy_health)
+        total[battles] = np.add.reduceat(hit_damage, first, axis=0)
+        health = self.enemy_health
+        damaged = total > 0
+        health -= np.minimum(total, health)
+        killed = damaged & (health <= 0)
+        alive &= ~killed
+
+        # Kills raise MP; every 10th kill trades it for a skill point
+        kills = killed.sum(axis=1, dtype=np.int32)
+        if not kills.any():
+            return
+        before = self.kill_count.copy()
+        self.kill_count += kills
+        self.mp += 10 * kills
+        skill_points = self.kill_count // 10 - before // 10
+        self.boom_count += skill_points
+        self.mp[skill_points > 0] = 10 * (self.kill_count[skill_points > 0] % 10)
+
+    def _fire(self, fired: np.ndarray):
+        """Add the bullets of finished attacks at the heroes' centers."""
+        rows = np.flatnonzero(fired)
+        if not len(rows):
+            return
+        slot = np.argmin(self.bullet_alive[rows], axis=1)
+        free = ~self.bullet_alive[rows, slot]
+        rows, slot = rows[free], slot[free]
+        bullet_type = self.hero_type[rows]
+        self.bullet_alive[rows, slot] = True
+        self.bullet_type[rows, slot] = bullet_type
+        self.bullet_x[rows, slot] = self.hero_x - self.bullet_w[bullet_type] // 2
+        self.bullet_y[rows, slot] = self.hero_y[rows] - self.bullet_h[bullet_type] // 2
+
+    def _observe(self) -> np.ndarray:
+        """Fill the observation buffer from the battle state.
+
+        Returns:
+            np.ndarray: The observation buffer.
+        """
+        obs = self._obs
+        rows = self._rows
+        hero_right = self.hero_x + self.hero_w[self.hero_type] // 2
+
+        # Hero features: height, hero type one-hot, attacking, shot cooldown, HP, MP,
+        # skill points and remaining freeze time
+        obs[:, 0] = (self.hero_y - FIELD_TOP) / (FIELD_BOTTOM - FIELD_TOP)
+        obs[:, 1:4] = 0
+        obs[rows, 1 + self.hero_type] = 1
+        obs[:, 4] = self.attack >= 0
+        obs[:, 5] = np.clip(self.shoot_delay + 1 - (self.frame - self.last_shot), 0, None) / (self.shoot_delay + 1)
+        obs[:, 6] = self.hp / 100
+        obs[:, 7] = self.mp / 100
+        obs[:, 8] = self.boom_count / 10
+        obs[:, 9] = self.is_frozen
+        obs[:, 10] = np.where(self.is_frozen, (FREEZE_FRAMES - self.frozen_timer) / FREEZE_FRAMES, 0)
+
+        # Enemies closest to the hero's column, nearest first
+        k = min(OBSERVED_ENEMIES, self.enemy_alive.shape[1])
+        distance = np.where(self.enemy_alive, self.enemy_x, np.iinfo(np.int32).max)
+        nearest = np.argpartition(distance, k - 1, axis=1)[:, :k]
+        nearest = np.take_along_axis(nearest, np.argsort(np.take_along_axis(distance, nearest, 1), axis=1), 1)
+        present = np.take_along_axis(self.enemy_alive, nearest, 1)
+        species = np.take_along_axis(self.enemy_species, nearest, 1)
+        h = np.take_along_axis(self.enemy_h, nearest, 1)
+        enemies = obs[:, HERO_FEATURES:].reshape(self.num_envs, OBSERVED_ENEMIES, ENEMY_FEATURES)
+        enemies[:] = 0
+        enemies[:, :k, 0] = present
+        enemies[:, :k, 1] = (np.take_along_axis(self.enemy_x, nearest, 1) - hero_right[:, None]) / SCREEN_WIDTH
+        enemy_center_y = np.take_along_axis(self.enemy_y, nearest, 1) + h // 2
+        enemies[:, :k, 2] = (enemy_center_y - self.hero_y[:, None]) / SCREEN_HEIGHT
+        enemies[:, :k, 3] = np.take_along_axis(self.enemy_health, nearest, 1) / self.species_hp[species]
+        enemies[:, :k, 4] = self.species_speed[species] / 10
+        type_one_hot = enemies[:, :k, 5:]
+        np.put_along_axis(type_one_hot, self.species_type[species][:, :, None], 1, 2)
+        enemies[:, :k] *= present[:, :, None]
+        return obs
+
+
+def run_vector_benchmark(num_envs: int, steps: int, seed: Optional[int] = None,
+                         max_frames: Optional[int] = None) -> dict:
+    """Step vectorized battles with random actions and measure throughput.
+
+    Args:
+        num_envs:   Number of battles.
+        steps:      Number of vectorized steps.
+        seed:       Seed of the environments and the actions.
+        max_frames: Frame limit of a battle, or None for no limit.
+
+    Returns:
+        dict: Completed battles, mean reward per step and throughput in
+        vectorized steps and environment steps per second.
+    """
+    env = VectorBattleEnv(num_envs, seed, max_frames)
+    rng = np.random.default_rng(seed)
+    env.reset()
+
+    # Random actions, drawn up front so that only the environment is timed
+    actions = np.empty((steps, num_envs, ACTION_SIZE), np.int32)
+    actions[..., ACTION_MOVE] = rng.integers(-1, 2, (steps, num_envs))
+    actions[..., ACTION_HERO] = rng.integers(-1, 3, (steps, num_envs))
+    actions[..., ACTION_SHOOT] = rng.random((steps, num_envs)) < 0.2
+    actions[..., ACTION_FREEZE] = rng.random((steps, num_envs)) < 0.001
+
+    episodes = 0
+    total_reward = 0.0
+    start = time.perf_counter()
+    for i in range(steps):
+        _, rewards, dones, _ = env.step(actions[i])
+        episodes += int(dones.sum())
+        total_reward += float(rewards.sum())
+    elapsed = time.perf_counter() - start
+
+    return {
+        "num_envs": num_envs,
+        "steps": steps,
+        "episodes": episodes,
+        "mean_reward": total_reward / (steps * num_envs),
+        "elapsed": elapsed,
+        "steps_per_second": steps / elapsed if elapsed > 0 else 0.0,
+        "env_steps_per_second": steps * num_envs / elapsed if elapsed > 0 else 0.0,
+    }
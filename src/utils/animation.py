@@ -0,0 +1,129 @@
+"""Clock-driven animation for the Chemination game.
+
+This module contains shared AnimationClip definitions (frames, frame rate and
+play mode) and the AnimationClock they are played against. An animated object
+only stores the tick its clip started at; the frame to show is computed from
+the clock when it is needed, so nothing is advanced per object per tick, and
+animation speed depends on game ticks rather than on the render frame rate.
+
+``frame_indices`` computes the frames of many animations in one NumPy pass.
+"""
+
+from enum import Enum
+
+import pygame
+
+from src.config.settings import TICK_RATE
+
+
+class PlayMode(Enum):
+    """How a clip continues after its last frame."""
+    LOOP = "loop"  # Start over
+    ONCE = "once"  # Hold the last frame; the clip is finished
+
+
+class AnimationClock:
+    """Tick counter that animations are played against.
+
+    A battle owns one clock and sets it to its frame count every step, so all
+    of its sprites share the same time base.
+    """
+
+    def __init__(self, tick: int = 0):
+        """Initialize the clock.
+
+        Args:
+            tick: Current tick.
+        """
+        self.tick = tick
+
+    def advance(self, ticks: int = 1):
+        """Move the clock forward.
+
+        Args:
+            ticks: Ticks to advance.
+        """
+        self.tick += ticks
+
+
+# Clock of sprites that do not belong to a battle
+GLOBAL_CLOCK = AnimationClock()
+
+
+class AnimationClip:
+    """Shared animation definition: frames, frame rate and play mode.
+
+    Frame positions are computed with integer arithmetic from the ticks elapsed
+    since the clip started, so any number of objects can share a clip.
+    """
+
+    def __init__(self, frames: list[pygame.Surface], fps: int, mode: PlayMode = PlayMode.LOOP,
+                 tick_rate: int = TICK_RATE):
+        """Initialize a clip.
+
+        Args:
+            frames:    Animation frames.
+            fps:       Animation frames per second of game time.
+            mode:      Play mode.
+            tick_rate: Game ticks per second.
+        """
+        self.frames = frames
+        self.fps = fps
+        self.mode = mode
+        self.tick_rate = tick_rate
+        # Ticks until the clip has shown all of its frames once
+        self.duration = -(-len(frames) * tick_rate // fps)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def index(self, elapsed: int) -> int:
+        """Get the frame index shown a number of ticks after the clip started.
+
+        Args:
+            elapsed: Ticks since the clip started.
+
+        Returns:
+            int: Frame index.
+        """
+        position = max(elapsed, 0) * self.fps // self.tick_rate
+        if self.mode is PlayMode.LOOP:
+            return position % len(self.frames)
+        return min(position, len(self.frames) - 1)
+
+    def frame(self, elapsed: int) -> pygame.Surface:
+        """Get the frame shown a number of ticks after the clip started.
+
+        Args:
+            elapsed: Ticks since the clip started.
+
+        Returns:
+            pygame.Surface: The frame.
+        """
+        return self.frames[self.index(elapsed)]
+
+    def finished(self, elapsed: int) -> bool:
+        """Check whether a play-once clip has shown all of its frames.
+
+        Args:
+            elapsed: Ticks since the clip started.
+
+        Returns:
+            bool: True once the clip is over (never for looping clips).
+        """
+        return self.mode is PlayMode.ONCE and elapsed >= self.duration
+
+
+def frame_indices(elapsed, fps: int, frame_counts, tick_rate: int = TICK_RATE):
+    """Compute the frame indices of many looping animations at once.
+
+    Args:
+        elapsed:      NumPy array of ticks since each animation started.
+        fps:          Animation frames per second of game time.
+        frame_counts: Frame count of each animation's clip (array or scalar).
+        tick_rate:    Game ticks per second.
+
+    Returns:
+        np.ndarray: Frame index of each animation.
+    """
+    return (elapsed.clip(0) * fps // tick_rate) % frame_counts
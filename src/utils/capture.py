@@ -0,0 +1,112 @@
+"""Pixel observations for the Chemination game.
+
+This module contains the FrameCapture class, an offscreen render target whose
+pixels are exposed as NumPy arrays, for vision-based agents and frame analysis.
+Observations are written into buffers that are allocated once (after optional
+downscaling and grayscale conversion), so observing a frame allocates no pixel
+memory and never leaves the render target locked.
+
+Requires NumPy (``pygame.surfarray``).
+"""
+
+import sys
+from typing import Optional
+
+import numpy as np
+import pygame
+
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def _rgb_view(pixels: np.ndarray, surface: pygame.Surface) -> np.ndarray:
+    """Get an RGB view of 32-bit pixels copied from a surface.
+
+    Args:
+        pixels:  ``(height, width)`` uint32 pixels, in the surface's format.
+        surface: Surface the pixels come from.
+
+    Returns:
+        np.ndarray: ``(height, width, 3)`` uint8 view of ``pixels``.
+    """
+    # Byte offsets of the channels in a pixel
+    offsets = [shift // 8 if sys.byteorder == "little" else 3 - shift // 8 for shift in surface.get_shifts()[:3]]
+    step = offsets[1] - offsets[0]
+    channels = pixels.view(np.uint8).reshape(*pixels.shape, 4)
+    return channels[..., offsets[0]::step][..., :3]
+
+
+class FrameCapture:
+    """Offscreen render target with reused observation buffers.
+
+    Scenes render into ``surface`` instead of the display. Observations are
+    row-major, ``(height, width, 3)`` RGB or ``(height, width)`` grayscale,
+    and ``observe`` returns the same array every time: it changes with the
+    next observation.
+
+    A view of ``surface`` would lock it, and pygame cannot blit onto a locked
+    surface, so full-size frames are copied (one row-major copy of the 32-bit
+    pixels) instead of being exposed as views.
+    """
+
+    def __init__(self, size: tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+                 observation_size: Optional[tuple[int, int]] = None, grayscale: bool = False, smooth: bool = True):
+        """Initialize the render target and the observation buffers.
+
+        Args:
+            size:             Render target size.
+            observation_size: Size observations are scaled to; full size if omitted.
+            grayscale:        Whether observations are grayscale.
+            smooth:           Whether downscaling averages pixels (smoothscale)
+                              rather than picking the nearest one.
+        """
+        self.surface = pygame.Surface(size, 0, 32)
+        self.observation_size = observation_size
+        self.grayscale = grayscale
+        self.smooth = smooth
+
+        # Reused observation buffers: the scaled surface and its persistent view (or
+        # a copy of the full-size pixels and its RGB view), and the grayscale
+        # output with its luminance accumulators
+        width, height = observation_size or size
+        if observation_size:
+            self._scaled = pygame.Surface(observation_size, 0, 32)
+            self._rgb = pygame.surfarray.pixels3d(self._scaled).transpose(1, 0, 2)
+            self._frame = None
+        else:
+            self._scaled = None
+            self._frame = np.empty((height, width), np.uint32)
+            self._rgb = _rgb_view(self._frame, self.surface)
+        if grayscale:
+            self._gray = np.empty((height, width), np.uint8)
+            self._luma = np.empty((height, width), np.uint16)
+            self._channel = np.empty((height, width), np.uint16)
+        else:
+            self._gray = None
+
+    def observe(self) -> np.ndarray:
+        """Get the observation of the last rendered frame.
+
+        Returns:
+            np.ndarray: The reused observation buffer (RGB or grayscale).
+        """
+        if self._scaled:
+            scale = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+            scale(self.surface, self.observation_size, self._scaled)
+        else:
+            # The view is released before returning, so the surface is unlocked again
+            view = pygame.surfarray.pixels2d(self.surface)
+            np.copyto(self._frame, view.T)
+            del view
+        rgb = self._rgb
+        if self._gray is None:
+            return rgb
+
+        # Integer BT.601 luminance: (77 R + 150 G + 29 B) / 256
+        luma, channel = self._luma, self._channel
+        np.multiply(rgb[..., 0], 77, out=luma, dtype=np.uint16)
+        np.multiply(rgb[..., 1], 150, out=channel, dtype=np.uint16)
+        luma += channel
+        np.multiply(rgb[..., 2], 29, out=channel, dtype=np.uint16)
+        luma += channel
+        np.right_shift(luma, 8, out=self._gray, casting="unsafe")
+        return self._gray
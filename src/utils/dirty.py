@@ -0,0 +1,175 @@
+"""Dirty-rectangle rendering for the Chemination game.
+
+This module contains the DirtyRenderer class, which keeps a cached copy of a
+scene's static layer (background, text and other parts that do not change
+between frames) and remembers the dynamic items, (surface, position) pairs,
+drawn over it in the last frame. Each frame only the regions where an item
+appeared, moved, changed its image or disappeared are restored from the cache
+and redrawn, and only those rectangles are pushed to the display with
+``pygame.display.update(rects)`` instead of flipping the whole window.
+"""
+
+from collections import Counter
+
+import pygame
+
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, YELLOW, WHITE, BLACK
+
+
+def merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Merge overlapping rectangles into their unions.
+
+    Args:
+        rects: Rectangles to merge.
+
+    Returns:
+        list: Non-overlapping rectangles covering all input rectangles.
+    """
+    merged: list[pygame.Rect] = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRenderer:
+    """Static layer cache and change tracking of one scene.
+
+    The scene draws its static layer into ``background`` on demand and hands
+    over its dynamic items every frame; ``render`` brings the screen up to date
+    and returns the rectangles to push to the display. A scene whose static
+    content changes calls ``invalidate``.
+    """
+
+    def __init__(self, size: tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT), show_debug: bool = False):
+        """Initialize the renderer; the first frame is drawn and pushed in full.
+
+        Args:
+            size:       Screen size.
+            show_debug: Whether to outline the updated regions and show the
+                        pixel count pushed per frame.
+        """
+        self.background = pygame.Surface(size)
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.show_debug = show_debug
+        self.debug_font = pygame.font.SysFont(None, 20) if show_debug else None
+
+        self._static_valid = False
+        self._full = True
+        # Static regions redrawn since the last frame
+        self._invalid: list[pygame.Rect] = []
+        # Items drawn last frame: (surface, x, y) -> count
+        self._drawn: Counter = Counter()
+        # Debug overlay pixels drawn last frame, restored in the next one
+        self._debug_rects: list[pygame.Rect] = []
+
+        # Statistics of the last frame
+        self.last_rects: list[pygame.Rect] = []
+        self.last_pixels = 0
+        self.draw_calls = 0
+        self.blit_count = 0
+
+    def invalidate(self, rect: pygame.Rect | None = None):
+        """Redraw the static layer before the next frame.
+
+        Args:
+            rect: Region where the static layer changed; the whole screen if omitted.
+        """
+        self._static_valid = False
+        if rect is None:
+            self._full = True
+        else:
+            self._invalid.append(pygame.Rect(rect))
+
+    def render(self, screen: pygame.Surface, draw_static, items: list) -> list[pygame.Rect]:
+        """Bring the screen up to date with the static layer and this frame's items.
+
+        Args:
+            screen:      Screen surface, holding the last frame rendered by this renderer.
+            draw_static: Callable drawing the static layer onto a surface.
+            items:       Dynamic (surface, position) pairs in drawing order.
+
+        Returns:
+            list: Rectangles of the screen that changed.
+        """
+        if not self._static_valid:
+            draw_static(self.background)
+            self._static_valid = True
+
+        # Bounding rects and identities of the items
+        rects = []
+        drawn = Counter()
+        for surface, position in items:
+            x, y = (position.x, position.y) if isinstance(position, pygame.Rect) else position
+            rects.append(surface.get_rect(topleft=(x, y)))
+            drawn[surface, x, y] += 1
+
+        if self._full:
+            screen.blit(self.background, (0, 0))
+            screen.blits(items, False)
+            changed = regions = [self.screen_rect.copy()]
+            self.draw_calls, self.blit_count = 2, len(items) + 1
+            self._full = False
+        else:
+            # Items that disappeared or moved leave their old rect, new ones cover theirs
+            changed = self._invalid
+            previous = self._drawn
+            for surface, x, y in previous - drawn:
+                changed.append(surface.get_rect(topleft=(x, y)))
+            for surface, x, y in drawn - previous:
+                changed.append(surface.get_rect(topleft=(x, y)))
+            changed = merge_rects([r for r in (r.clip(self.screen_rect) for r in changed) if r])
+            regions = merge_rects(changed + self._debug_rects) if self._debug_rects else changed
+
+            # Restore each region from the static layer and redraw the items over it, clipped
+            self.draw_calls = self.blit_count = 0
+            for region in regions:
+                screen.set_clip(region)
+                screen.blit(self.background, region, region)
+                overlapping = [items[i] for i in region.collidelistall(rects)]
+                screen.blits(overlapping, False)
+                self.draw_calls += 2
+                self.blit_count += len(overlapping) + 1
+            screen.set_clip(None)
+
+        self._invalid = []
+        self._drawn = drawn
+        updated = list(regions)
+        if self.show_debug:
+            updated += self._draw_debug(screen, changed, updated)
+        self.last_rects = updated
+        self.last_pixels = sum(r.width * r.height for r in updated)
+        return updated
+
+    def _draw_debug(self, screen: pygame.Surface, changed: list[pygame.Rect],
+                    updated: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Outline the changed regions and show the pixels pushed this frame.
+
+        Args:
+            screen:  Screen surface.
+            changed: Regions that changed this frame.
+            updated: Rectangles pushed to the display so far.
+
+        Returns:
+            list: Further rectangles to push (the overlay label).
+        """
+        pixels = sum(r.width * r.height for r in updated)
+        total = self.screen_rect.width * self.screen_rect.height
+        label = self.debug_font.render(f"{len(updated)} rects  {pixels} px  {100 * pixels / total:.1f}%",
+                                       True, WHITE, BLACK)
+        label_rect = label.get_rect(bottomright=(self.screen_rect.right - 5, self.screen_rect.bottom - 5))
+
+        # The outlines and the label are erased by the next frame, but not outlined themselves
+        self._debug_rects = [label_rect]
+        for rect in changed:
+            pygame.draw.rect(screen, YELLOW, rect, 1)
+            self._debug_rects += [pygame.Rect(rect.x, rect.y, rect.width, 1),
+                                  pygame.Rect(rect.x, rect.bottom - 1, rect.width, 1),
+                                  pygame.Rect(rect.x, rect.y, 1, rect.height),
+                                  pygame.Rect(rect.right - 1, rect.y, 1, rect.height)]
+        screen.blit(label, label_rect)
+        return [label_rect]
@@ -0,0 +1,179 @@
+"""Entity-component-system core for the Chemination game.
+
+This module contains a small ECS: a World that owns entities (integer ids),
+one store per component type, and an ordered list of systems. Entities carry
+no behaviour of their own; each system iterates the store of the components it
+needs and skips everything else, so adding a kind of entity or a feature means
+adding components and a system rather than overriding per-object methods.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator
+
+
+class System(ABC):
+    """Abstract base class of systems.
+
+    The world calls ``update`` once per tick, in the order the systems were
+    added.
+    """
+
+    @abstractmethod
+    def update(self, world: "World"):
+        """Advance the system by one tick.
+
+        Args:
+            world: The world to update.
+        """
+        pass
+
+
+class World:
+    """Entities, their components and the systems that update them.
+
+    Component stores map entity ids to component instances and keep insertion
+    order, so iterating a store visits entities in the order they received the
+    component. Entity ids are never reused.
+    """
+
+    def __init__(self):
+        """Initialize an empty world."""
+        self._next_entity = 0
+        # Entity -> component types it has
+        self.entities: dict[int, set[type]] = {}
+        # Component type -> entity -> component
+        self.stores: dict[type, dict[int, object]] = {}
+        self.systems: list[System] = []
+        # Callbacks receiving an entity about to be destroyed
+        self.on_destroy: list[Callable[[int], None]] = []
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def store(self, component_type: type) -> dict[int, object]:
+        """Get the store of a component type (created empty if needed).
+
+        The store is live: systems may iterate it directly, but must iterate a
+        copy if they add or remove that component while doing so.
+
+        Args:
+            component_type: Component class.
+
+        Returns:
+            dict: Entity -> component.
+        """
+        store = self.stores.get(component_type)
+        if store is None:
+            store = self.stores[component_type] = {}
+        return store
+
+    def create(self, *components) -> int:
+        """Create an entity.
+
+        Args:
+            *components: Initial components (one per component type).
+
+        Returns:
+            int: The new entity id.
+        """
+        entity = self._next_entity
+        self._next_entity += 1
+        self.entities[entity] = set()
+        for component in components:
+            self.add(entity, component)
+        return entity
+
+    def add(self, entity: int, component):
+        """Attach a component to an entity, replacing one of the same type.
+
+        Args:
+            entity:    Entity id.
+            component: Component instance.
+        """
+        component_type = type(component)
+        self.entities[entity].add(component_type)
+        self.store(component_type)[entity] = component
+
+    def remove(self, entity: int, component_type: type):
+        """Detach a component from an entity (no-op if it has none).
+
+        Args:
+            entity:         Entity id.
+            component_type: Component class.
+        """
+        types = self.entities.get(entity)
+        if types and component_type in types:
+            types.discard(component_type)
+            del self.stores[component_type][entity]
+
+    def get(self, entity: int, component_type: type):
+        """Get a component of an entity.
+
+        Args:
+            entity:         Entity id.
+            component_type: Component class.
+
+        Returns:
+            The component, or None if the entity does not have one.
+        """
+        store = self.stores.get(component_type)
+        return store.get(entity) if store else None
+
+    def alive(self, entity: int) -> bool:
+        """Check whether an entity exists.
+
+        Args:
+            entity: Entity id.
+
+        Returns:
+            bool: True until the entity is destroyed.
+        """
+        return entity in self.entities
+
+    def destroy(self, entity: int):
+        """Destroy an entity and all its components (no-op if already destroyed).
+
+        Args:
+            entity: Entity id.
+        """
+        if entity not in self.entities:
+            return
+        for callback in self.on_destroy:
+            callback(entity)
+        stores = self.stores
+        for component_type in self.entities.pop(entity):
+            del stores[component_type][entity]
+
+    def query(self, *component_types: type) -> Iterator[tuple]:
+        """Iterate the entities that have all of the given components.
+
+        Entities are visited in the order of the first component's store; the
+        results are collected first, so the world may change while iterating.
+
+        Args:
+            *component_types: Component classes (at least one).
+
+        Yields:
+            tuple: The entity id followed by its components, in argument order.
+        """
+        primary = self.store(component_types[0])
+        others = [self.store(t) for t in component_types[1:]]
+        if not others:
+            yield from list(primary.items())
+            return
+        rows = [(entity, component, *(store[entity] for store in others))
+                for entity, component in primary.items() if all(entity in store for store in others)]
+        yield from rows
+
+    def add_system(self, system: System):
+        """Append a system to the update order.
+
+        Args:
+            system: The system.
+        """
+        self.systems.append(system)
+
+    def update(self):
+        """Run every system once, in order."""
+        for system in self.systems:
+            system.update(self)
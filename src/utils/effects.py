@@ -2,11 +2,59 @@
 
 This module contains classes and functions for creating visual effects
 like particle systems for explosions, damage indicators, and other animations.
+Particles can also be drawn as cached circle images, so a whole frame of
+particles is a single ``Surface.blits`` batch.
 """
 
 import pygame
 import random
 
+# Particle images, built on first use: (color, radius) -> circle
+_particle_images: dict[tuple, pygame.Surface] = {}
+
+
+def get_particle_image(color: pygame.Color, radius: int) -> pygame.Surface:
+    """Get a shared image of a particle, pixel-identical to drawing its circle.
+
+    Args:
+        color:  Particle color.
+        radius: Circle radius in pixels.
+
+    Returns:
+        pygame.Surface: Circle centered in a (2 * radius + 1) square.
+    """
+    key = (tuple(color), radius)
+    image = _particle_images.get(key)
+    if image is None:
+        # Colorkeyed and run-length encoded, which blits faster than per-pixel alpha
+        background = (0, 0, 0) if tuple(color)[:3] != (0, 0, 0) else (255, 255, 255)
+        image = pygame.Surface((2 * radius + 1, 2 * radius + 1))
+        image.fill(background)
+        pygame.draw.circle(image, color, (radius, radius), radius)
+        image.set_colorkey(background, pygame.RLEACCEL)
+        _particle_images[key] = image
+    return image
+
+
+def particle_items(particles: list) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+    """Get live particles as images to blit.
+
+    Drawing the items in order looks the same as drawing the particles.
+
+    Args:
+        particles: Particles (Particle or FireParticle).
+
+    Returns:
+        list: (particle image, top-left position) pairs.
+    """
+    items = []
+    for particle in particles:
+        if particle.size > 0:
+            radius = int(particle.size)
+            items.append((get_particle_image(particle.color, radius),
+                          (int(particle.x) - radius, int(particle.y) - radius)))
+    return items
+
 
 class Particle:
     """Represents a single particle in a visual effect.
@@ -70,13 +118,14 @@ class Effect:
     at a specific location, such as an explosion or damage indicator.
     """
 
-    def __init__(self, x: int, y: int, color: pygame.Color):
+    def __init__(self, x: int, y: int, color: pygame.Color, rng: random.Random = random):
         """Initialize an effect at the given position.
         
         Args:
             x:     X coordinate of effect.
             y:     Y coordinate of effect.
             color: RGB color tuple for the effect.
+            rng:   Random generator for the particle velocities and sizes.
         """
         self.x = x
         self.y = y
@@ -88,9 +137,9 @@ class Effect:
         for i in range(10):
             particle = Particle(x,
                                 y,
-                                random.uniform(-8, 8),
-                                random.uniform(-8, 8),
-                                random.randint(5, 10), color
+                                rng.uniform(-8, 8),
+                                rng.uniform(-8, 8),
+                                rng.randint(5, 10), color
                                 )
             self.particles.append(particle)
 
@@ -130,9 +179,14 @@ class EffectsManager:
     and cleans up finished effects.
     """
 
-    def __init__(self):
-        """Initialize effects manager."""
+    def __init__(self, rng: random.Random = random):
+        """Initialize effects manager.
+        
+        Args:
+            rng: Random generator shared by all effects of this manager.
+        """
         self.effects: list[Effect] = []  # Store effect instances
+        self.rng = rng
 
     def add_effect(self, x: int, y: int, color: pygame.Color):
         """Add a new effect to the manager.
@@ -142,7 +196,7 @@ class EffectsManager:
             y:     Y coordinate of effect.
             color: RGB color for the effect.
         """
-        effect = Effect(x, y, color)
+        effect = Effect(x, y, color, self.rng)
         self.effects.append(effect)
 
     def update_effects(self):
@@ -165,6 +219,19 @@ class EffectsManager:
         for effect in self.effects:
             effect.draw(screen)
 
+    def blit_items(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """Get the particles of all active effects as images to blit.
+
+        Drawing the items in order looks the same as ``draw_effects``.
+
+        Returns:
+            list: (particle image, top-left position) pairs.
+        """
+        items = []
+        for effect in self.effects:
+            items += particle_items(effect.particles)
+        return items
+
 
 class FireParticle(Particle):
     """Represents a fire particle with specialized behavior and coloring."""
@@ -283,3 +350,13 @@ class FireEffect:
         """
         for particle in self.particles:
             particle.draw(screen)
+
+    def blit_items(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """Get the fire particles as images to blit.
+
+        Drawing the items in order looks the same as ``draw``.
+
+        Returns:
+            list: (particle image, top-left position) pairs.
+        """
+        return particle_items(self.particles)
@@ -0,0 +1,96 @@
+"""In-process game event bus for the Chemination game.
+
+This module contains the EventBus class that carries game events (attacks,
+kills, escapes) from sprites to the battle that owns them, without going
+through SDL's event queue. Events are pygame Event objects, so handlers read
+their payload as attributes, but they are never posted to the OS queue.
+"""
+
+from collections import defaultdict
+from typing import Callable, Optional
+
+import pygame
+
+# Event handler: receives the event
+EventHandler = Callable[[pygame.event.Event], None]
+
+
+class EventBus:
+    """Synchronous and deferred dispatch of game events to subscribers.
+
+    ``publish`` calls the subscribers of an event type immediately. ``post``
+    queues the event until the owner calls ``dispatch``, which delivers the
+    queued events in posting order; events posted by handlers during a dispatch
+    are delivered in the same dispatch.
+    """
+
+    def __init__(self):
+        """Initialize a bus without subscribers."""
+        self.handlers: dict[int, list[EventHandler]] = defaultdict(list)
+        self.queue: list[pygame.event.Event] = []
+
+        # Statistics (see BattleSimulation.get_event_stats)
+        self.dispatched: dict[int, int] = defaultdict(int)
+        self.queue_high_water = 0
+
+    def subscribe(self, event_type: int, handler: EventHandler):
+        """Call a handler for every event of a type.
+
+        Args:
+            event_type: Event type (for example ENEMY_KILLED).
+            handler:    Callable receiving the event.
+        """
+        self.handlers[event_type].append(handler)
+
+    def publish(self, event: pygame.event.Event):
+        """Deliver an event to its subscribers right away.
+
+        Args:
+            event: The game event.
+        """
+        self.dispatched[event.type] += 1
+        for handler in self.handlers.get(event.type, ()):
+            handler(event)
+
+    def post(self, event: pygame.event.Event):
+        """Queue an event for the next dispatch.
+
+        Args:
+            event: The game event.
+        """
+        self.queue.append(event)
+        if len(self.queue) > self.queue_high_water:
+            self.queue_high_water = len(self.queue)
+
+    def dispatch(self) -> int:
+        """Deliver all queued events, including those posted while dispatching.
+
+        Returns:
+            int: Number of events delivered.
+        """
+        count = 0
+        queue = self.queue
+        while queue:
+            self.queue = []
+            for event in queue:
+                self.publish(event)
+            count += len(queue)
+            queue = self.queue
+        return count
+
+
+def emit(bus: Optional[EventBus], event_type: int, payload: dict):
+    """Post a game event to a bus, or to pygame's event queue without one.
+
+    Sprites use this so that they also work outside of a battle simulation.
+
+    Args:
+        bus:        Event bus of the owning battle, or None.
+        event_type: Event type.
+        payload:    Event attributes.
+    """
+    event = pygame.event.Event(event_type, payload)
+    if bus is not None:
+        bus.post(event)
+    else:
+        pygame.event.post(event)
@@ -0,0 +1,91 @@
+"""Batched drawing for the Chemination game.
+
+This module contains the RenderQueue class, which collects the (surface,
+position) pairs of a frame by layer and draws each layer with a single
+``Surface.blits`` call (``fblits`` where the pygame build provides it), instead
+of paying Python and pygame call overhead for every sprite. The queue counts the
+draw calls and blits of each frame.
+"""
+
+from enum import IntEnum
+
+import pygame
+
+
+class Layer(IntEnum):
+    """Render layers, drawn in ascending order."""
+    UI = 0        # Info bar widgets (pause button)
+    ENTITIES = 1  # Hero, enemies and bullets
+    HUD = 2       # Enemy health overlays
+    EFFECTS = 3   # Particles
+    OVERLAY = 4   # Pause screen
+
+
+class RenderQueue:
+    """Per-frame draw queue, flushed one batched call per layer.
+
+    Surfaces queued on the same layer are drawn in submission order; a layer
+    is drawn entirely before the next one.
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self.layers: list[list[tuple[pygame.Surface, tuple[int, int] | pygame.Rect]]] = [[] for _ in Layer]
+        # Counts of the last flushed frame
+        self.draw_calls = 0
+        self.blit_count = 0
+
+    def submit(self, surface: pygame.Surface, position: tuple[int, int] | pygame.Rect, layer: Layer):
+        """Queue a surface.
+
+        Args:
+            surface:  Surface to draw.
+            position: Top-left corner (or a rect) to draw it at.
+            layer:    Layer to draw it on.
+        """
+        self.layers[layer].append((surface, position))
+
+    def extend(self, items, layer: Layer):
+        """Queue several surfaces.
+
+        Args:
+            items: Iterable of (surface, position) pairs.
+            layer: Layer to draw them on.
+        """
+        self.layers[layer].extend(items)
+
+    def drain(self) -> list[tuple[pygame.Surface, tuple[int, int] | pygame.Rect]]:
+        """Take every queued surface, in drawing order, and clear the queue.
+
+        Used when the caller draws the items itself (dirty-rectangle rendering).
+
+        Returns:
+            list: (surface, position) pairs of all layers.
+        """
+        items = []
+        for layer in self.layers:
+            items += layer
+            layer.clear()
+        return items
+
+    def flush(self, target: pygame.Surface):
+        """Draw and clear every queued layer, and update the frame's counts.
+
+        Args:
+            target: Surface to draw on.
+        """
+        # fblits (pygame-ce) skips building the list of changed rects
+        fblits = getattr(target, "fblits", None)
+        draw_calls = blit_count = 0
+        for items in self.layers:
+            if not items:
+                continue
+            if fblits is not None:
+                fblits(items)
+            else:
+                target.blits(items, False)
+            draw_calls += 1
+            blit_count += len(items)
+            items.clear()
+        self.draw_calls = draw_calls
+        self.blit_count = blit_count
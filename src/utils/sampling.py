@@ -0,0 +1,66 @@
+"""Weighted random sampling for the Chemination game.
+
+This module contains the AliasTable class, a Walker/Vose alias table that
+draws an index from a fixed discrete distribution in constant time, no matter
+how many outcomes there are.
+"""
+
+import random
+
+
+class AliasTable:
+    """Constant-time sampler of indices with fixed weights.
+
+    Building the table takes O(n); every sample costs one random number, one
+    comparison and at most two list lookups.
+    """
+
+    def __init__(self, weights: list[float]):
+        """Build the alias table.
+
+        Args:
+            weights: Non-negative weight of each index (not all zero).
+
+        Raises:
+            ValueError: If there are no weights, a weight is negative or all are zero.
+        """
+        n = len(weights)
+        total = float(sum(weights))
+        if not n or total <= 0 or min(weights) < 0:
+            raise ValueError("Alias table weights must be non-negative with a positive sum")
+        self.size = n
+
+        # Scale so that the average bucket holds exactly 1
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1 up to rounding error
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def sample(self, rng: random.Random = random) -> int:
+        """Draw an index.
+
+        The integer part of one uniform draw picks the bucket and its fraction
+        decides between the bucket and its alias.
+
+        Args:
+            rng: Random generator to draw from.
+
+        Returns:
+            int: Index drawn with probability proportional to its weight.
+        """
+        u = rng.random() * self.size
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
@@ -0,0 +1,130 @@
+"""Spatial indexing for the Chemination game.
+
+This module contains a uniform-grid spatial hash. Collision queries against it
+only look at the grid cells a rectangle covers, instead of testing every pair
+of objects.
+"""
+
+import pygame
+
+# Default grid cell size in pixels (about the size of an enemy sprite)
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    """Uniform grid that maps cells to the objects whose rectangles cover them.
+
+    Objects are indexed by their ``rect`` attribute. Cell membership is only
+    rewritten when an object's rectangle crosses into a different set of cells,
+    so moving an object a few pixels is usually a single comparison.
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE):
+        """Initialize an empty spatial hash.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels.
+        """
+        self.cell_size = cell_size
+        # Cell -> objects in it (dicts are used as insertion-ordered sets,
+        # which keeps query results deterministic)
+        self.cells: dict[tuple[int, int], dict] = {}
+        # Object -> cell span (first column, first row, last column, last row)
+        self.spans: dict[object, tuple[int, int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self.spans
+
+    def _span(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        """Get the range of cells covered by a rectangle."""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _link(self, obj, span: tuple[int, int, int, int]):
+        """Add an object to all cells of a span."""
+        cells = self.cells
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = {obj: None}
+                else:
+                    cell[obj] = None
+
+    def _unlink(self, obj, span: tuple[int, int, int, int]):
+        """Remove an object from all cells of a span."""
+        cells = self.cells
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells[(cx, cy)]
+                del cell[obj]
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def insert(self, obj):
+        """Index an object at its current rectangle.
+
+        Args:
+            obj: Object with a ``rect`` attribute.
+        """
+        if obj in self.spans:
+            self.move(obj)
+            return
+        span = self._span(obj.rect)
+        self.spans[obj] = span
+        self._link(obj, span)
+
+    def remove(self, obj):
+        """Remove an object from the index (no-op if it is not indexed).
+
+        Args:
+            obj: Indexed object.
+        """
+        span = self.spans.pop(obj, None)
+        if span is not None:
+            self._unlink(obj, span)
+
+    def move(self, obj):
+        """Refresh an object's cells after its rectangle changed.
+
+        Args:
+            obj: Indexed object.
+        """
+        old_span = self.spans[obj]
+        span = self._span(obj.rect)
+        if span != old_span:
+            self._unlink(obj, old_span)
+            self._link(obj, span)
+            self.spans[obj] = span
+
+    def query(self, rect: pygame.Rect) -> list:
+        """Find the indexed objects whose rectangles overlap a rectangle.
+
+        Args:
+            rect: Rectangle to test.
+
+        Returns:
+            list: Overlapping objects, without duplicates.
+        """
+        cells = self.cells
+        x0, y0, x1, y1 = self._span(rect)
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    for obj in cell:
+                        if obj not in found and rect.colliderect(obj.rect):
+                            found[obj] = None
+        return list(found)
+
+    def clear(self):
+        """Remove all objects from the index."""
+        self.cells.clear()
+        self.spans.clear()
@@ -18,6 +18,10 @@ BASE_PATH = sys._MEIPASS if hasattr(sys, '_MEIPASS') else (
     Path(__file__).resolve().parent.parent.parent if "NUITKA_ONEFILE_PARENT" in os.environ else
     os.getcwd())
 
+# Process-wide cache of loaded images and sliced sprite frames, keyed by load parameters
+_sprite_cache: dict[tuple, dict[str, list[pygame.Surface]] | list[pygame.Surface] | pygame.Surface] = {}
+_sprite_cache_stats = {"hits": 0, "misses": 0}
+
 
 def create_alpha_image(image, alpha):
     """Create a copy of an image with specified alpha transparency.
@@ -34,6 +38,23 @@ def create_alpha_image(image, alpha):
     return alpha_image
 
 
+def convert_image(image: pygame.Surface) -> pygame.Surface:
+    """Convert an image to the display pixel format for fast blitting.
+
+    The conversion needs an active video mode; without one (e.g. when running
+    headless) the image is returned unchanged.
+
+    Args:
+        image: Image surface to convert.
+
+    Returns:
+        pygame.Surface: Converted image with per-pixel alpha.
+    """
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return image.convert_alpha()
+    return image
+
+
 def resource_path(relative_path: str):
     """Get absolute path to resource, works for dev and bundled versions.
     
@@ -49,6 +70,41 @@ def resource_path(relative_path: str):
     return os.path.join(BASE_PATH, relative_path)
 
 
+def load_image(filename: str, size: tuple[int, int] | None = None) -> pygame.Surface:
+    """Load a single image, optionally scaled, through the process-wide cache.
+
+    The returned surface is shared between all callers and must not be drawn on.
+    If the image cannot be loaded, a translucent substitute is returned.
+
+    Args:
+        filename: Path to the image file.
+        size:     Optional (width, height) to scale the image to.
+
+    Returns:
+        pygame.Surface: Loaded (and converted) image.
+    """
+    key = (filename, 0, 0, size, None)
+    cached = _sprite_cache.get(key)
+    if cached is not None:
+        _sprite_cache_stats["hits"] += 1
+        return cached
+    _sprite_cache_stats["misses"] += 1
+
+    try:
+        image = convert_image(pygame.image.load(resource_path(filename)))
+    except (FileNotFoundError, pygame.error) as e:
+        print(f"Unable to load image {filename}: {e}")
+        # Create a simple substitute image
+        image = pygame.Surface(size or (20, 20), pygame.SRCALPHA)
+        image.fill((200, 100, 100, 128))
+
+    if size and image.get_size() != size:
+        image = pygame.transform.scale(image, size)
+
+    _sprite_cache[key] = image
+    return image
+
+
 def load_sprite_sheet(filename: str, rows: int, cols: int,
                       directions: tuple = ('down', 'left', 'right', 'up'),
                       scale: float = 1.0) -> dict[str, list[pygame.Surface]]:
@@ -56,6 +112,8 @@ def load_sprite_sheet(filename: str, rows: int, cols: int,
     
     This function loads a sprite sheet image and splits it into individual frames
     organized by direction. It handles errors gracefully by providing substitute graphics.
+    Frames are cached process-wide, so repeated calls with the same parameters
+    do no file I/O and return the same frame surfaces.
     
     Args:
         filename:   Path to the sprite sheet file.
@@ -67,10 +125,18 @@ def load_sprite_sheet(filename: str, rows: int, cols: int,
     Returns:
         dict: Dictionary with direction keys and lists of frames as values.
     """
+    key = (filename, rows, cols, scale, tuple(directions))
+    cached = _sprite_cache.get(key)
+    if cached is not None:
+        _sprite_cache_stats["hits"] += 1
+        # Shared frames, fresh containers (callers may add or pop directions)
+        return {direction: list(frames) for direction, frames in cached.items()}
+    _sprite_cache_stats["misses"] += 1
+
     try:
         filepath = resource_path(filename)
-        sprite_sheet = pygame.image.load(filepath).convert_alpha()
-    except pygame.error as e:
+        sprite_sheet = convert_image(pygame.image.load(filepath))
+    except (FileNotFoundError, pygame.error) as e:
         print(f"Unable to load sprite sheet {filename}: {e}")
         # Create a simple substitute sprite sheet
         sprite_sheet = pygame.Surface((cols * 50, rows * 50), pygame.SRCALPHA)
@@ -104,14 +170,16 @@ def load_sprite_sheet(filename: str, rows: int, cols: int,
         direction_key = directions[row] if row < len(directions) else f"direction_{row}"
         frames[direction_key] = direction_frames
 
-    return frames
+    _sprite_cache[key] = frames
+    return {direction: list(direction_frames) for direction, direction_frames in frames.items()}
 
 
 def load_sprite_row(filename: str, cols: int, scale: float = 1.0) -> list[pygame.Surface]:
     """Load and split all frames from a single-row sprite sheet.
     
     This function loads a single-row sprite sheet image and splits it into individual frames.
-    It handles errors gracefully by providing substitute graphics.
+    It handles errors gracefully by providing substitute graphics. Frames are cached
+    process-wide, so repeated calls with the same parameters do no file I/O.
     
     Args:
         filename: Path to the sprite sheet file.
@@ -121,10 +189,17 @@ def load_sprite_row(filename: str, cols: int, scale: float = 1.0) -> list[pygame
     Returns:
         list: List of frames.
     """
+    key = (filename, 1, cols, scale, None)
+    cached = _sprite_cache.get(key)
+    if cached is not None:
+        _sprite_cache_stats["hits"] += 1
+        return list(cached)
+    _sprite_cache_stats["misses"] += 1
+
     try:
         filepath = resource_path(filename)
-        sprite_sheet = pygame.image.load(filepath).convert_alpha()
-    except pygame.error as e:
+        sprite_sheet = convert_image(pygame.image.load(filepath))
+    except (FileNotFoundError, pygame.error) as e:
         print(f"Unable to load sprite sheet {filename}: {e}")
         # Create a simple substitute sprite sheet
         sprite_sheet = pygame.Surface((cols * 50, 50), pygame.SRCALPHA)
@@ -151,4 +226,25 @@ def load_sprite_row(filename: str, cols: int, scale: float = 1.0) -> list[pygame
             frame = pygame.transform.scale(frame, (new_width, new_height))
         direction_frames.append(frame)
 
-    return direction_frames
+    _sprite_cache[key] = direction_frames
+    return list(direction_frames)
+
+
+def get_asset_cache_stats() -> dict[str, int]:
+    """Get the hit/miss counters of the sprite frame cache.
+
+    Returns:
+        dict: Dictionary with ``hits``, ``misses`` and ``entries`` counts.
+    """
+    return {**_sprite_cache_stats, "entries": len(_sprite_cache)}
+
+
+def clear_asset_cache():
+    """Drop all cached sprite frames and reset the cache counters.
+
+    Useful after the display mode changes, since cached frames are converted
+    to the pixel format of the display that was active when they were loaded.
+    """
+    _sprite_cache.clear()
+    _sprite_cache_stats["hits"] = 0
+    _sprite_cache_stats["misses"] = 0